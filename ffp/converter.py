@@ -1,42 +1,268 @@
 #!/usr/bin/env python3
 
+import argparse
 import os
 import struct
 import sys
 
+from fractions import Fraction
+
 import numpy as np
 import scipy.io.wavfile as wav
+import scipy.optimize
+import scipy.signal
+
+from stats import Stats
 
 stdout = os.fdopen(sys.stdout.fileno(), "wb")
 
+# headerless PCM formats, named as in ffmpeg (and ffp.lua's log).
+pcm_formats = {
+    "u8": "u1",
+    "s8": "i1",
+    "s16le": "<i2",
+    "s16be": ">i2",
+    "s24le": "<i3",
+    "s24be": ">i3",
+    "s32le": "<i4",
+    "s32be": ">i4",
+    "f32le": "<f4",
+    "f32be": ">f4",
+    "f64le": "<f8",
+    "f64be": ">f8",
+}
+
+
+def read_pcm(path, fmt, channels):
+    """
+    Maps a headerless PCM file into memory. Interleaved channels are averaged
+    into one.
+
+    Returns the samples (24-bit ones are widened to 32 bits).
+    """
+
+    dtype = pcm_formats[fmt]
+    width = int(dtype[-1])
+    frames = os.path.getsize(path) // (width * channels)
+
+    if frames == 0:
+        return np.zeros(0)
+
+    if width == 3:
+        # numpy has no 24-bit integers: widen them, keeping the sign.
+        raw = np.memmap(path, dtype=np.uint8, mode="r",
+                        shape=(frames * channels, 3))
+
+        if dtype[0] == ">":
+            raw = raw[:, ::-1]
+
+        data = (raw[:, 0].astype(np.int32)
+                | raw[:, 1].astype(np.int32) << 8
+                | raw[:, 2].astype(np.int8).astype(np.int32) << 16)
+    else:
+        data = np.memmap(path, dtype=np.dtype(dtype), mode="r",
+                         shape=(frames * channels,))
+
+    if channels > 1:
+        return data.reshape(frames, channels).mean(axis=1)
+
+    return data
+
+
+def decimate(data, sample_rate, target_rate):
+    """
+    Resamples the audio to target_rate (which must be lower) with a polyphase
+    filter, which also removes the frequencies above the new Nyquist frequency
+    so they don't alias.
+
+    Returns the new sample rate (target_rate rounded to a ratio of small
+    integers) and the samples.
+    """
+
+    ratio = (Fraction(target_rate) / Fraction(sample_rate)).limit_denominator(
+        1000
+    )
+
+    if ratio >= 1:
+        return sample_rate, data
+
+    data = scipy.signal.resample_poly(
+        data.astype(np.float64), ratio.numerator, ratio.denominator
+    )
+
+    return float(sample_rate * ratio), data
+
+
+def track(prev_freqs, freqs, amps):
+    """
+    Reorders the peaks of a window so each continues the channel whose
+    previous frequency is the nearest: the assignment minimizing the total
+    frequency change (the Hungarian algorithm).
+
+    Returns the reordered frequencies and amplitudes.
+    """
+
+    cost = np.abs(prev_freqs[:, np.newaxis] - freqs[np.newaxis, :])
+    _, order = scipy.optimize.linear_sum_assignment(cost)
+
+    return freqs[order], amps[order]
+
+
+def delta_encode(last_freqs, last_amps, freqs, amps, tolerance):
+    """
+    Replaces the values the player already has with NaN: a frequency equal to
+    the last one written for the channel, or an amplitude within tolerance
+    (relative) of it. last_freqs and last_amps are updated in place.
+
+    Returns the values to write.
+    """
+
+    same_freq = freqs == last_freqs
+    same_amp = np.abs(amps - last_amps) <= tolerance * last_amps
+
+    last_freqs[~same_freq] = freqs[~same_freq]
+    last_amps[~same_amp] = amps[~same_amp]
+
+    return (np.where(same_freq, np.nan, freqs),
+            np.where(same_amp, np.nan, amps))
+
+
+parser = argparse.ArgumentParser(
+    usage="%(prog)s <path> [window size] [channels] "
+          "[--rate HZ | --max-freq HZ] "
+          "[--pcm FORMAT --pcm-rate HZ [--pcm-channels N]] "
+          "[--track] [--delta [TOLERANCE]]",
+)
+parser.add_argument("path")
+parser.add_argument("window_size", nargs="?", type=int, default=1024,
+                    help="in samples of the input (default: 1024)")
+parser.add_argument("channels", nargs="?", type=int, default=8,
+                    help="default: 8")
+group = parser.add_mutually_exclusive_group()
+group.add_argument("--rate", type=float,
+                   help="decimate the audio to this sample rate before the "
+                        "FFT")
+group.add_argument("--max-freq", type=float,
+                   help="decimate the audio by the largest integer factor "
+                        "that keeps the frequencies up to this one (with a "
+                        "10%% margin for the filter)")
+parser.add_argument("--pcm", choices=pcm_formats, metavar="FORMAT",
+                    help="read headerless PCM instead of WAV: "
+                         + ", ".join(pcm_formats))
+parser.add_argument("--pcm-rate", type=float,
+                    help="the sample rate of the PCM input")
+parser.add_argument("--pcm-channels", type=int, default=1,
+                    help="the number of interleaved channels of the PCM "
+                         "input, mixed into one (default: 1)")
+parser.add_argument("--track", action="store_true",
+                    help="keep each tone on the same channel from window to "
+                         "window instead of ordering the channels by "
+                         "amplitude")
+parser.add_argument("--delta", nargs="?", type=float, const=0.05,
+                    metavar="TOLERANCE",
+                    help="write NaN for the frequencies and the amplitudes "
+                         "that haven't changed since the last window (the "
+                         "amplitudes within TOLERANCE, relative; default: "
+                         "0.05), so the player can skip them")
+parser.add_argument("--stats", nargs="?", const="text",
+                    choices=["text", "json"],
+                    help="print the time spent per stage and the throughput "
+                         "to stderr when done")
+
 if len(sys.argv) == 1 or not sys.argv[1]:
-    sys.stderr.write("Usage: %s <path> [window size] [channels]\n" % sys.argv[0])
+    parser.print_usage(sys.stderr)
     sys.exit(1)
 
-window_size = 1024
-channels = 8
+args = parser.parse_args()
+window_size = args.window_size
+channels = args.channels
+stats = Stats()
 
-if len(sys.argv) >= 3:
-    window_size = int(sys.argv[2])
-if len(sys.argv) >= 4:
-    channels = int(sys.argv[3])
+if args.pcm:
+    if not args.pcm_rate:
+        parser.error("--pcm requires --pcm-rate")
 
-sample_rate, data = wav.read(sys.argv[1])
+    sample_rate = args.pcm_rate
 
-if type(data[0]) == np.ndarray:
-    sys.stderr.write("Mono audio required\n")
-    sys.exit(1)
+    # the file is mapped lazily: the reads are counted in the fft stage.
+    with stats.stage("read"):
+        data = read_pcm(args.path, args.pcm, args.pcm_channels)
+else:
+    with stats.stage("read"):
+        sample_rate, data = wav.read(args.path)
+
+    if type(data[0]) == np.ndarray:
+        sys.stderr.write("Mono audio required\n")
+        sys.exit(1)
+
+# the windows keep their duration: the FFTs get smaller with the rate.
+if args.rate:
+    target_rate = args.rate
+elif args.max_freq:
+    target_rate = sample_rate / max(1, int(sample_rate / (2.2 * args.max_freq)))
+else:
+    target_rate = sample_rate
+
+input_rate = sample_rate
+
+with stats.stage("decimate"):
+    sample_rate, data = decimate(data, sample_rate, target_rate)
+
+window_size = max(1, round(window_size * sample_rate / input_rate))
+
+# every record must have a peak per channel: ffp.lua reads them at a fixed
+# stride.
+if window_size // 2 < channels:
+    parser.error("the window has %d frequency bins at %g Hz, fewer than the "
+                 "%d channels; use a larger window or fewer channels"
+                 % (window_size // 2, sample_rate, channels))
+
+if sample_rate != input_rate:
+    sys.stderr.write("Decimated %g Hz to %g Hz; window size %d\n"
+                     % (input_rate, sample_rate, window_size))
 
 stdout.write(struct.pack('>dddd', sample_rate, window_size, window_size, channels))
 
+windows = 0
+freqs = amps = None
+last_freqs = np.full(channels, np.nan)
+last_amps = np.full(channels, np.nan)
+
 for i in range(0, len(data), window_size):
-    window = data[i:i+window_size]
-    n = len(window)
-    freq = np.fft.fftfreq(n, 1/sample_rate)[range(int(n / 2))]
-    fourier = np.fft.fft(window) / n
-    fourier = fourier[range(int(n / 2))]
-    values = [x for x in sorted(zip(freq, np.abs(fourier)),
-                                key=lambda x: x[1],
-                                reverse=True)]
-    for ch in range(channels):
-        stdout.write(struct.pack('>dd', values[ch][0], values[ch][1]))
+    with stats.stage("fft"):
+        window = data[i:i+window_size]
+        # a short last window would have fewer bins than channels.
+        window = np.pad(window, (0, window_size - len(window)))
+        n = len(window)
+        freq = np.fft.fftfreq(n, 1/sample_rate)[range(int(n / 2))]
+        fourier = np.fft.fft(window) / n
+        fourier = fourier[range(int(n / 2))]
+
+    with stats.stage("peaks"):
+        amplitude = np.abs(fourier)
+        # stable, so equal amplitudes stay ordered by frequency.
+        peaks = np.argsort(-amplitude, kind="stable")[:channels]
+        prev_freqs = freqs
+        freqs, amps = freq[peaks], amplitude[peaks]
+
+    if args.track and prev_freqs is not None:
+        with stats.stage("tracking"):
+            freqs, amps = track(prev_freqs, freqs, amps)
+
+    with stats.stage("write"):
+        out_freqs, out_amps = freqs, amps
+
+        if args.delta is not None:
+            out_freqs, out_amps = delta_encode(last_freqs, last_amps,
+                                               freqs, amps, args.delta)
+
+        stdout.write(np.column_stack((out_freqs, out_amps))
+                     .astype(">f8").tobytes())
+
+    windows += 1
+
+if args.stats:
+    with stats.stage("write"):
+        stdout.flush()
+
+    stats.report(args.stats, windows, len(data) / sample_rate)
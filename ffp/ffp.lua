@@ -216,7 +216,10 @@ end
 opencomputers(function()
   local maxAmplitude = 0
   for i = 2, #chans, 2 do
-    maxAmplitude = math.max(maxAmplitude, chans[i])
+    -- NaN (x ~= x) marks a value unchanged since the last window
+    if chans[i] == chans[i] then
+      maxAmplitude = math.max(maxAmplitude, chans[i])
+    end
   end
 
   local iteration = 1
@@ -256,8 +259,12 @@ opencomputers(function()
     log:write(("Playing: %.2fs/%.2fs (%3.0f%%)"):format(iteration * sleep, len, iteration * sleep / len * 100))
     local i = 1
     for chan = sample, sample + channels * 2 - 1, 2 do
-      instr(s.setFrequency(i, chans[chan]))
-      instr(s.setVolume(i, chans[chan + 1] / maxAmplitude))
+      if chans[chan] == chans[chan] then
+        instr(s.setFrequency(i, chans[chan]))
+      end
+      if chans[chan + 1] == chans[chan + 1] then
+        instr(s.setVolume(i, chans[chan + 1] / maxAmplitude))
+      end
       i = i + 1
     end
     instr(s.delay(math.floor(sleep * 1000)))
@@ -1,15 +1,68 @@
+import argparse
 import numpy as np
+import time
 from os import path
-from math import floor
+from math import ceil, floor
 from struct import unpack
-from pyaudio import PyAudio
+from pyaudio import PyAudio, paOutputUnderflowed
 from sys import argv, stdout, stderr, exit
+from stats import Stats
+
+parser = argparse.ArgumentParser(
+    usage="%(prog)s <file> [-o outfile] [--start S] [--end S] "
+          "[--stats [text|json]]",
+)
+parser.add_argument("file")
+parser.add_argument("-o", dest="outfile",
+                    help="also write the audio to this WAV file")
+parser.add_argument("--start", type=float, default=0,
+                    help="where to start playing, in seconds")
+parser.add_argument("--end", type=float,
+                    help="where to stop playing, in seconds")
+parser.add_argument("--stats", nargs="?", const="text",
+                    choices=["text", "json"],
+                    help="print the time spent per stage, the write latency "
+                         "and the underruns to stderr when done")
 
 if len(argv) == 1:
-    print(f"{argv[0]} <file> [-o outfile]", file=stderr)
+    parser.print_usage(stderr)
     exit(-1)
 
-f = open(argv[1], "rb")
+args = parser.parse_args()
+statsFormat = args.stats
+stats = Stats()
+
+
+def fill_deltas(body, first, clip):
+    """
+    Replaces the NaNs of a delta-encoded clip (converter.py --delta) with the
+    last values written before them. Those of the first window are looked up
+    before the clip, reading backwards only as far as needed.
+    """
+
+    missing = np.isnan(clip[0])
+    end = first
+
+    while missing.any() and end > 0:
+        start = max(0, end - 256)
+        # the last value written in the chunk, per channel and field
+        chunk = np.array(body[start:end])[::-1]
+        found = ~np.isnan(chunk)
+        latest = np.take_along_axis(chunk, found.argmax(axis=0)[np.newaxis],
+                                    axis=0)[0]
+        fill = missing & found.any(axis=0)
+        clip[0][fill] = latest[fill]
+        missing &= ~fill
+        end = start
+
+    # anything still missing was never written
+    clip[0][missing] = 0
+
+    # propagate the values forward: index of the last window that has one
+    index = np.where(np.isnan(clip), 0, np.arange(len(clip))[:, None, None])
+    np.maximum.accumulate(index, axis=0, out=index)
+
+    return np.take_along_axis(clip, index, axis=0)
 
 
 def sin_wave(A, f, fs, phi, t):
@@ -33,18 +86,41 @@ def sin_wave(A, f, fs, phi, t):
     return y
 
 
-rate, windowSize, step, channels = unpack(">dddd", f.read(32))
-fileSize = path.getsize(argv[1]) - 32
-length = (fileSize) / rate / channels / 8 / 2 * windowSize
-fileSize = floor(min(fileSize, length * rate * channels * 8 * 2 / windowSize))
+with open(args.file, "rb") as f:
+    rate, windowSize, step, channels = unpack(">dddd", f.read(32))
 
+# each window is a (frequency, amplitude) pair of doubles per channel, so the
+# clip to play can be located without reading what precedes it.
+stride = int(channels) * 16
+totalWindows = (path.getsize(args.file) - 32) // stride
 delay = step / rate
-chans = [unpack(">d", f.read(8))[0] for i in range(0, fileSize, 8)]
-buffer = np.array([])
-maxAmplitude = np.max(chans[1::2])
-f.close()
+length = totalWindows * delay
 
-print(f"length: {fileSize}B/{length}s.")
+first = min(totalWindows, max(0, floor(args.start / delay)))
+last = totalWindows
+
+if args.end is not None:
+    last = min(totalWindows, ceil(args.end / delay))
+
+if last <= first:
+    print(f"nothing to play: the file is {length:.2f}s long", file=stderr)
+    exit(-1)
+
+with stats.stage("load"):
+    body = np.memmap(args.file, dtype=">f8", mode="r", offset=32,
+                     shape=(totalWindows, int(channels), 2))
+    clip = np.array(body[first:last])
+
+    if np.isnan(clip).any():
+        clip = fill_deltas(body, first, clip)
+
+    # the amplitudes are normalized over the clip only.
+    maxAmplitude = np.max(clip[:, :, 1])
+
+print(f"length: {totalWindows * stride}B/{length}s.")
+
+if (first, last) != (0, totalWindows):
+    print(f"playing {first * delay:.2f}s to {last * delay:.2f}s.")
 
 p = PyAudio()
 stream = p.open(
@@ -55,42 +131,65 @@ stream = p.open(
     frames_per_buffer=int(step),
 )
 
-try:
-    out = argv.index("-o")
+if args.outfile:
     import wave
 
-    out = wave.open(argv[out + 1], "wb")
+    out = wave.open(args.outfile, "wb")
     out.setnchannels(1)
     out.setsampwidth(2)
     out.setframerate(rate)
-except:
+else:
     out = None
 
-for sample in range(0, len(chans), int(channels) * 2):
-    buf = sin_wave(
-        chans[sample + 1] / maxAmplitude / channels, chans[sample], rate, 0, delay
-    )
+windows = 0
+# reported even if there are none.
+stats.count("underruns", 0)
 
-    for i in range(2, int(channels) * 2, 2):
-        buf += sin_wave(
-            chans[sample + 1 + i] / maxAmplitude / channels,
-            chans[sample + i],
-            rate,
-            0,
-            delay,
+for window in clip:
+    with stats.stage("synthesis"):
+        buf = sin_wave(
+            window[0, 1] / maxAmplitude / channels, window[0, 0], rate, 0, delay
         )
 
-    data = (buf * 32767).astype(np.int16).tobytes()
-    stream.write(data)
+        for i in range(1, int(channels)):
+            buf += sin_wave(
+                window[i, 1] / maxAmplitude / channels,
+                window[i, 0],
+                rate,
+                0,
+                delay,
+            )
+
+        data = (buf * 32767).astype(np.int16).tobytes()
 
-    if out:
-        out.writeframes(data)
+    with stats.stage("write"):
+        start = time.perf_counter()
+
+        # the data is still played when the output has underflowed.
+        try:
+            stream.write(data, exception_on_underflow=statsFormat is not None)
+        except IOError as e:
+            if e.errno != paOutputUnderflowed:
+                raise
+
+            stats.count("underruns")
+
+        stats.sample("write_latency", time.perf_counter() - start)
+
+        if out:
+            out.writeframes(data)
+
+    windows += 1
 
     stdout.write(
-        "\rPlaying: %0.2f/%0.2fs" % ((sample / channels / 2 + 1) * delay, length)
+        "\rPlaying: %0.2f/%0.2fs" % ((first + windows) * delay, length)
     )
 
 stream.close()
 
 if out:
     out.close()
+
+if statsFormat:
+    print(file=stderr)
+    stats.report(statsFormat, windows, windows * delay)
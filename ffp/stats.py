@@ -0,0 +1,118 @@
+"""
+Timing and throughput statistics for converter.py and ffplayer.py (--stats).
+"""
+
+import json
+import sys
+import time
+
+from contextlib import contextmanager
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    # not on Windows
+    resource = None
+
+
+def peak_rss():
+    """Returns the peak resident set size of the process in bytes, if known."""
+
+    if resource is None:
+        return None
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # kilobytes on Linux, bytes on macOS
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+class Stats:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.stages = {}
+        self.counters = {}
+        self.samples = {}
+
+    @contextmanager
+    def stage(self, name):
+        """Adds the time spent in the block to the stage's total."""
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stages[name] = self.stages.get(name, 0) + elapsed
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def sample(self, name, value):
+        """Records a value whose distribution is reported (e.g. a latency)."""
+
+        self.samples.setdefault(name, []).append(value)
+
+    def summary(self, windows, audio_seconds):
+        wall = time.perf_counter() - self.start
+        result = {
+            "wall_seconds": wall,
+            "stages": self.stages,
+            "windows": windows,
+            "windows_per_second": windows / wall if wall else None,
+            "audio_seconds": audio_seconds,
+            "audio_seconds_per_second": audio_seconds / wall if wall else None,
+            "peak_rss_bytes": peak_rss(),
+            **self.counters,
+        }
+
+        for name, values in self.samples.items():
+            p50, p90, p99 = np.percentile(values, [50, 90, 99])
+            result[name] = {
+                "p50": p50,
+                "p90": p90,
+                "p99": p99,
+                "max": max(values),
+                "count": len(values),
+            }
+
+        return result
+
+    def report(self, fmt, windows, audio_seconds, file=sys.stderr):
+        summary = self.summary(windows, audio_seconds)
+
+        if fmt == "json":
+            json.dump(summary, file, indent=2)
+            print(file=file)
+
+            return
+
+        wall = summary["wall_seconds"]
+        print(f"wall time: {wall:.3f} s", file=file)
+
+        for name, seconds in self.stages.items():
+            share = seconds / wall * 100 if wall else 0
+            print(f"  {name:<12} {seconds:9.3f} s {share:5.1f}%", file=file)
+
+        print(f"windows: {windows} ({summary['windows_per_second']:.1f}/s)",
+              file=file)
+        print(f"audio: {audio_seconds:.2f} s "
+              f"({summary['audio_seconds_per_second']:.2f}x real time)",
+              file=file)
+
+        if summary["peak_rss_bytes"] is not None:
+            print(f"peak RSS: {summary['peak_rss_bytes'] / 2**20:.1f} MiB",
+                  file=file)
+
+        for name, value in self.counters.items():
+            print(f"{name}: {value}", file=file)
+
+        for name in self.samples:
+            s = summary[name]
+            print(f"{name}: p50 {s['p50'] * 1000:.2f} ms, "
+                  f"p90 {s['p90'] * 1000:.2f} ms, "
+                  f"p99 {s['p99'] * 1000:.2f} ms, "
+                  f"max {s['max'] * 1000:.2f} ms", file=file)
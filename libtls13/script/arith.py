@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Big-integer arithmetic for the generators, backed by GMP when possible.
+
+At 384 bits and above CPython's ints are several times slower than GMP, and
+modular exponentiation dominates generate-ec-test-data.py and
+generate-modpow-test-data.py. This module picks a backend at import time:
+
+    gmpy2  if it's installed: mpz, gmpy2.powmod, gmpy2.invert
+    int    otherwise: int, pow(x, y, m), pow(x, -1, m)
+
+Set ARITH_BACKEND=int to force the fallback. Both give the same results, so
+the generated files don't depend on the backend. Values of the gmpy2 backend
+are mpz, which mix with ints; convert them with int() before they leave the
+script (to_bytes, JSON).
+
+When run as a script, runs the generators with each backend, checks that the
+outputs are identical and prints the times:
+
+    arith.py [--repeat N]
+"""
+
+import os
+
+BACKEND = os.environ.get("ARITH_BACKEND", "gmpy2")
+
+if BACKEND == "gmpy2":
+    try:
+        import gmpy2
+    except ImportError:
+        BACKEND = "int"
+
+if BACKEND == "gmpy2":
+    mpz = gmpy2.mpz
+    powmod = gmpy2.powmod
+    invert = gmpy2.invert
+else:
+    BACKEND = "int"
+    mpz = int
+
+    def powmod(x, y, m):
+        return pow(x, y, m)
+
+    def invert(x, m):
+        return pow(x, -1, m)
+
+
+if __name__ == "__main__":
+    import argparse
+    import subprocess
+    import sys
+    import time
+
+    from regenerate import DEFAULT_SEED, runner
+
+    # (name, arguments); run with the PRNG seeded as by regenerate.py
+    workloads = [
+        ("ec", ["generate-ec-test-data.py"]),
+        ("ecdsa", ["generate-ec-test-data.py", "--ecdsa", "16"]),
+        ("modpow", ["generate-modpow-test-data.py"]),
+        ("modpow 1024 words", ["generate-modpow-test-data.py",
+                               "--max-words", "1024"]),
+    ]
+
+    parser = argparse.ArgumentParser(
+        description="Compare the arithmetic backends on the generators.",
+    )
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="the best of N runs is reported (default: 1)")
+    args = parser.parse_args()
+
+    if BACKEND != "gmpy2":
+        sys.exit("gmpy2 is not installed")
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    backends = ["int", "gmpy2"]
+
+    print(f"{'workload':<20}" + "".join(f"{b:>10}" for b in backends)
+          + f"{'speedup':>10}")
+
+    for name, argv in workloads:
+        times = []
+        outputs = []
+
+        for backend in backends:
+            env = dict(os.environ, ARITH_BACKEND=backend)
+            best = None
+
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                script, *script_args = argv
+                output = subprocess.run(
+                    [
+                        sys.executable, "-c", runner, DEFAULT_SEED,
+                        script_dir, os.path.join(script_dir, script),
+                        *script_args,
+                    ],
+                    cwd=script_dir, env=env, check=True,
+                    stdout=subprocess.PIPE,
+                ).stdout
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+
+            times.append(best)
+            outputs.append(output)
+
+        if outputs[0] != outputs[1]:
+            sys.exit(f"{name}: the outputs differ")
+
+        print(f"{name:<20}" + "".join(f"{t:9.2f}s" for t in times)
+              + f"{times[0] / times[1]:9.2f}x")
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""Converts a PEM bundle of CA certificates into a binary trust store.
+
+The trust store lets the client find the anchors for an issuer without
+decoding the whole bundle: it reads the index, binary-searches it for the hash
+of the issuer's name and only then reads (and parses) the matching
+certificates. See src/x509/store.lua.
+
+The format (all integers are big-endian):
+
+    header   "TST1", the number of anchors (uint32)
+    index    per anchor, sorted: the first 8 bytes of SHA-256 of the subject
+             name (its DER encoding), the offset and the size of the record
+             (uint32 each)
+    records  per anchor: the label (s2); the offset and the length of the
+             subject name and of the SubjectPublicKeyInfo in the certificate
+             (uint16 each); the certificate (s3)
+
+sN is an N-byte length followed by the data, as in string.pack. The label is
+the "# ..." comment line preceding the certificate, if any. The subject and
+the public key are located in advance, so they can be used without decoding
+the certificate.
+
+Usage:
+    script/build-trust-store.py test/data/ca-bundle.pem -o ca-bundle.store
+    script/build-trust-store.py --list ca-bundle.store
+"""
+
+import argparse
+import base64
+import hashlib
+import struct
+import sys
+
+from dataclasses import dataclass
+
+MAGIC = b"TST1"
+HEADER = struct.Struct(">4sI")
+INDEX_ENTRY = struct.Struct(">8sII")
+LOCATIONS = struct.Struct(">HHHH")
+
+
+@dataclass
+class Anchor:
+    label: str
+    certificate: bytes
+    # (start, end) in the certificate
+    subject_range: tuple
+    public_key_info_range: tuple
+
+    @property
+    def subject(self):
+        return self.certificate[slice(*self.subject_range)]
+
+    @property
+    def public_key_info(self):
+        return self.certificate[slice(*self.public_key_info_range)]
+
+    @property
+    def key(self):
+        return subject_key(self.subject)
+
+
+def subject_key(subject):
+    return hashlib.sha256(subject).digest()[:8]
+
+
+def read_tlv(data, pos):
+    """Reads a DER value at pos. Returns (tag, contents start, end)."""
+
+    tag = data[pos]
+
+    if tag & 0x1f == 0x1f:
+        raise ValueError(f"high tag number at offset {pos}")
+
+    length = data[pos + 1]
+    start = pos + 2
+
+    if length & 0x80:
+        size = length & 0x7f
+
+        if size == 0 or size > 4:
+            raise ValueError(f"unsupported length at offset {pos}")
+
+        length = int.from_bytes(data[start:start + size], "big")
+        start += size
+
+    if start + length > len(data):
+        raise ValueError(f"truncated value at offset {pos}")
+
+    return tag, start, start + length
+
+
+def children(data, start, end):
+    pos = start
+
+    while pos < end:
+        tag, _, next_pos = read_tlv(data, pos)
+
+        yield tag, pos, next_pos
+
+        pos = next_pos
+
+
+def parse_anchor(label, der):
+    """Extracts the subject and the public key from a certificate."""
+
+    tag, start, end = read_tlv(der, 0)
+
+    if tag != 0x30 or end != len(der):
+        raise ValueError("the certificate is not a SEQUENCE")
+
+    tag, tbs_start, tbs_end = read_tlv(der, start)
+    fields = list(children(der, tbs_start, tbs_end))
+
+    # the version is optional
+    if fields and fields[0][0] == 0xa0:
+        fields = fields[1:]
+
+    if len(fields) < 6:
+        raise ValueError("tbsCertificate is too short")
+
+    # serialNumber, signature, issuer, validity, subject, subjectPublicKeyInfo
+    (_, subject_start, subject_end), (_, spki_start, spki_end) = fields[4:6]
+
+    if len(der) >= 1 << 16:
+        raise ValueError("the certificate is too large")
+
+    return Anchor(
+        label=label,
+        certificate=der,
+        subject_range=(subject_start, subject_end),
+        public_key_info_range=(spki_start, spki_end),
+    )
+
+
+def read_pem_bundle(lines):
+    label = ""
+    cert_lines = None
+
+    for line in lines:
+        line = line.strip()
+
+        if cert_lines is not None:
+            if line.startswith("-----END"):
+                yield label, base64.b64decode("".join(cert_lines))
+                cert_lines = None
+                label = ""
+            else:
+                cert_lines.append(line)
+        elif line.startswith("#"):
+            label = line[1:].strip()
+        elif line == "-----BEGIN CERTIFICATE-----":
+            cert_lines = []
+
+
+def build(anchors):
+    anchors = sorted(anchors, key=lambda a: (a.key, a.certificate))
+    records = []
+    index = []
+    offset = HEADER.size + INDEX_ENTRY.size * len(anchors)
+
+    for anchor in anchors:
+        label = anchor.label.encode()
+        subject_start, subject_end = anchor.subject_range
+        spki_start, spki_end = anchor.public_key_info_range
+        record = (
+            struct.pack(">H", len(label)) + label
+            + LOCATIONS.pack(subject_start, subject_end - subject_start,
+                             spki_start, spki_end - spki_start)
+            + len(anchor.certificate).to_bytes(3, "big") + anchor.certificate
+        )
+        index.append(INDEX_ENTRY.pack(anchor.key, offset, len(record)))
+        records.append(record)
+        offset += len(record)
+
+    return HEADER.pack(MAGIC, len(anchors)) + b"".join(index + records)
+
+
+def read_store(data):
+    magic, count = HEADER.unpack_from(data)
+
+    if magic != MAGIC:
+        raise ValueError("not a trust store")
+
+    for i in range(count):
+        key, offset, size = INDEX_ENTRY.unpack_from(
+            data, HEADER.size + i * INDEX_ENTRY.size
+        )
+        record = data[offset:offset + size]
+
+        label_length, = struct.unpack_from(">H", record)
+        label = record[2:2 + label_length].decode()
+        pos = 2 + label_length
+        subject_start, subject_length, spki_start, spki_length = \
+            LOCATIONS.unpack_from(record, pos)
+        pos += LOCATIONS.size
+        cert_length = int.from_bytes(record[pos:pos + 3], "big")
+
+        if pos + 3 + cert_length != size:
+            raise ValueError(f"the record of {label} has a wrong size")
+
+        anchor = Anchor(
+            label=label,
+            certificate=record[pos + 3:],
+            subject_range=(subject_start, subject_start + subject_length),
+            public_key_info_range=(spki_start, spki_start + spki_length),
+        )
+
+        if anchor.key != key:
+            raise ValueError(f"the index entry of {anchor.label} is wrong")
+
+        yield anchor
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("input", help="the PEM bundle (or a store for --list)")
+    parser.add_argument(
+        "-o", "--output",
+        help="where to write the store (default: stdout)",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="print the anchors of an existing store instead",
+    )
+    args = parser.parse_args()
+
+    if args.list:
+        with open(args.input, "rb") as f:
+            for anchor in read_store(f.read()):
+                print(f"{anchor.key.hex()} {len(anchor.certificate):5} "
+                      f"{anchor.label}")
+
+        sys.exit(0)
+
+    anchors = []
+
+    with open(args.input) as f:
+        for i, (label, der) in enumerate(read_pem_bundle(f), 1):
+            try:
+                anchors.append(parse_anchor(label, der))
+            except ValueError as e:
+                sys.exit(f"certificate {i} ({label or 'no label'}): {e}")
+
+    store = build(anchors)
+
+    if args.output:
+        with open(args.output, "wb") as f:
+            f.write(store)
+    else:
+        sys.stdout.buffer.write(store)
+
+    print(f"{len(anchors)} anchors, {len(store)} bytes", file=sys.stderr)
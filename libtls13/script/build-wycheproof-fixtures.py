@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""Converts the Wycheproof test vectors the tests use into Lua fixtures.
+
+Decoding the JSON files with json.lua takes up most of the time the Wycheproof
+tests run, and much of what it decodes is then skipped: groups with parameters
+we don't support. This script drops those groups in advance (see `fixtures`,
+which mirrors the groupFilter of every test) and writes the rest as a Lua
+chunk returning a table of the same shape as the decoded JSON, which Lua's own
+parser loads in a fraction of the time. The file header and notes, which the
+tests don't read, are dropped as well.
+
+The fixtures go to test/data/wycheproof/<name>.lua, along with manifest.json,
+which records for every fixture the hash of its source and of the filter
+applied, and the number of groups and tests kept. --check compares the
+manifest with the current sources and filters (e.g. after the submodule is
+updated) and reports stale fixtures. The fixtures aren't committed.
+
+test/test-util.lua (loadWycheproof) uses a fixture if it exists and decodes
+the JSON file otherwise, or always if WYCHEPROOF_JSON is set.
+
+Usage:
+    script/build-wycheproof-fixtures.py
+    script/build-wycheproof-fixtures.py aes_gcm_test.json
+    script/build-wycheproof-fixtures.py --check
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import re
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+root = os.path.dirname(script_dir)
+source_dir = os.path.join(root, "third-party", "wycheproof", "testvectors")
+output_dir = os.path.join(root, "test", "data", "wycheproof")
+
+# bumped when the output format changes, so the fixtures are seen as stale.
+FORMAT_VERSION = 1
+
+SUPPORTED_HASHES = {"SHA-256", "SHA-512"}
+
+
+def pkcs1_group(group):
+    return group["sha"] in SUPPORTED_HASHES
+
+
+def pss_group(group):
+    return (group["sha"] in SUPPORTED_HASHES
+            and group["mgfSha"] in SUPPORTED_HASHES
+            and group["mgf"] == "MGF1")
+
+
+def gcm_group(group):
+    return (group["tagSize"] == 128
+            and group["keySize"] != 192
+            and group["ivSize"] == 96)
+
+
+# source file -> the groups to keep (None means all).
+# keep in sync with the tests under test/crypto.
+fixtures = {
+    "rsa_signature_test.json": pkcs1_group,
+    **{
+        f"rsa_pss_{params}_test.json": pss_group
+        for params in [
+            "2048_sha256_mgf1_0",
+            "2048_sha256_mgf1_32",
+            "2048_sha512_256_mgf1_28",
+            "2048_sha512_256_mgf1_32",
+            "3072_sha256_mgf1_32",
+            "4096_sha256_mgf1_32",
+            "4096_sha512_mgf1_32",
+            "misc",
+        ]
+    },
+    "hmac_sha256_test.json": None,
+    "hmac_sha384_test.json": None,
+    "hmac_sha512_test.json": None,
+    "hkdf_sha256_test.json": None,
+    "hkdf_sha384_test.json": None,
+    "hkdf_sha512_test.json": None,
+    "x25519_test.json": None,
+    "eddsa_test.json": None,
+    "ecdsa_secp384r1_sha384_test.json": None,
+    "aes_gcm_test.json": gcm_group,
+    "chacha20_poly1305_test.json": None,
+}
+
+# top-level fields the tests don't read.
+DROPPED_FIELDS = {"header", "notes"}
+
+LUA_KEYWORDS = {
+    "and", "break", "do", "else", "elseif", "end", "false", "for", "function",
+    "goto", "if", "in", "local", "nil", "not", "or", "repeat", "return",
+    "then", "true", "until", "while",
+}
+
+IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+
+ESCAPES = {
+    ord("\\"): "\\\\",
+    ord('"'): '\\"',
+    ord("\n"): "\\n",
+    ord("\r"): "\\r",
+    ord("\t"): "\\t",
+}
+
+
+def lua_string(s):
+    # json.lua decodes strings to UTF-8, and so does this: bytes above 0x7f
+    # are written as they are.
+    parts = []
+
+    for byte in s.encode("utf-8"):
+        if byte in ESCAPES:
+            parts.append(ESCAPES[byte])
+        elif byte < 0x20 or byte == 0x7f:
+            # padded to 3 digits so that a digit that follows isn't absorbed.
+            parts.append(f"\\{byte:03d}")
+        else:
+            parts.append(chr(byte))
+
+    return '"' + "".join(parts) + '"'
+
+
+def lua_key(key):
+    if IDENTIFIER.match(key) and key not in LUA_KEYWORDS:
+        return key
+
+    return f"[{lua_string(key)}]"
+
+
+def lua_value(value):
+    if value is None:
+        return "nil"
+    elif value is True:
+        return "true"
+    elif value is False:
+        return "false"
+    elif isinstance(value, (int, float)):
+        return repr(value)
+    elif isinstance(value, str):
+        return lua_string(value)
+    elif isinstance(value, list):
+        return "{" + ", ".join(map(lua_value, value)) + "}"
+    elif isinstance(value, dict):
+        # like json.lua, which has no representation for null, omit the key.
+        return "{" + ", ".join(
+            f"{lua_key(k)} = {lua_value(v)}"
+            for k, v in value.items()
+            if v is not None
+        ) + "}"
+
+    raise TypeError(f"can't convert {type(value).__name__} to Lua")
+
+
+def write_fixture(f, data):
+    # a line per test keeps the lines (and diffs) manageable.
+    f.write("-- generated by script/build-wycheproof-fixtures.py; "
+            "do not edit.\n")
+    f.write("return {\n")
+
+    for key, value in data.items():
+        if key != "testGroups":
+            f.write(f"  {lua_key(key)} = {lua_value(value)},\n")
+
+    f.write("  testGroups = {\n")
+
+    for group in data["testGroups"]:
+        f.write("    {\n")
+
+        for key, value in group.items():
+            if key != "tests" and value is not None:
+                f.write(f"      {lua_key(key)} = {lua_value(value)},\n")
+
+        f.write("      tests = {\n")
+
+        for test in group["tests"]:
+            f.write(f"        {lua_value(test)},\n")
+
+        f.write("      },\n")
+        f.write("    },\n")
+
+    f.write("  },\n")
+    f.write("}\n")
+
+
+def hash_file(path):
+    h = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 16):
+            h.update(chunk)
+
+    return h.hexdigest()
+
+
+def filter_hash(name):
+    """
+    Hashes the source of the group filter for name and the values of the
+    globals it reads (e.g. SUPPORTED_HASHES), so that editing either makes
+    the fixture stale.
+    """
+
+    group_filter = fixtures[name]
+
+    if group_filter is None:
+        return None
+
+    h = hashlib.sha256(inspect.getsource(group_filter).encode())
+
+    for var in sorted(set(group_filter.__code__.co_names) & globals().keys()):
+        value = globals()[var]
+
+        if isinstance(value, (set, frozenset)):
+            # sets of strings iterate in a different order every run.
+            value = sorted(value)
+
+        h.update(f"{var} = {value!r}".encode())
+
+    return h.hexdigest()
+
+
+def fixture_name(name):
+    return name.removesuffix(".json") + ".lua"
+
+
+def build(name):
+    source = os.path.join(source_dir, name)
+
+    with open(source, encoding="utf-8") as f:
+        data = json.load(f)
+
+    group_filter = fixtures[name]
+    groups = data["testGroups"]
+    kept = [group for group in groups
+            if group_filter is None or group_filter(group)]
+
+    out = {k: v for k, v in data.items() if k not in DROPPED_FIELDS}
+    out["testGroups"] = kept
+    out["numberOfTests"] = sum(len(group["tests"]) for group in kept)
+
+    path = os.path.join(output_dir, fixture_name(name))
+    tmp = f"{path}.tmp"
+
+    # lua_string maps every byte to a character of the same code.
+    with open(tmp, "w", encoding="latin-1", newline="\n") as f:
+        write_fixture(f, out)
+
+    os.replace(tmp, path)
+
+    return {
+        "fixture": fixture_name(name),
+        "source": hash_file(source),
+        "filter": filter_hash(name),
+        "format": FORMAT_VERSION,
+        "groups": [len(kept), len(groups)],
+        "tests": [out["numberOfTests"],
+                  sum(len(group["tests"]) for group in groups)],
+        "size": [os.path.getsize(path), os.path.getsize(source)],
+    }
+
+
+def manifest_path():
+    return os.path.join(output_dir, "manifest.json")
+
+
+def load_manifest():
+    try:
+        with open(manifest_path()) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_manifest(manifest):
+    tmp = manifest_path() + ".tmp"
+
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+    os.replace(tmp, manifest_path())
+
+
+def staleness(name, entry):
+    """Returns why the fixture for name is stale, or None if it isn't."""
+
+    source = os.path.join(source_dir, name)
+
+    if not os.path.exists(source):
+        return "source missing"
+    elif entry is None:
+        return "not built"
+    elif not os.path.exists(os.path.join(output_dir, entry["fixture"])):
+        return "fixture missing"
+    elif entry["format"] != FORMAT_VERSION:
+        return "format changed"
+    elif entry["filter"] != filter_hash(name):
+        return "filter changed"
+    elif entry["source"] != hash_file(source):
+        return "source changed"
+
+    return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="the source files to convert (default: all the tests use)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only report stale fixtures (exits with 1 if there are any)",
+    )
+    args = parser.parse_args()
+
+    for name in args.files:
+        if name not in fixtures:
+            parser.error(f"no tests use {name}")
+
+    selected = args.files or list(fixtures)
+    manifest = load_manifest()
+
+    if args.check:
+        stale = False
+
+        for name in selected:
+            reason = staleness(name, manifest.get(name))
+
+            if reason:
+                stale = True
+                print(f"stale: {name} ({reason})")
+            else:
+                print(f"up to date: {name}")
+
+        sys.exit(1 if stale else 0)
+
+    if not os.path.isdir(source_dir):
+        sys.exit(f"{source_dir} doesn't exist: "
+                 "fetch the wycheproof submodule first")
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    for name in selected:
+        entry = manifest[name] = build(name)
+        save_manifest(manifest)
+
+        kept_groups, total_groups = entry["groups"]
+        kept_tests, total_tests = entry["tests"]
+        fixture_size, source_size = entry["size"]
+        print(f"{entry['fixture']}: {kept_groups}/{total_groups} groups, "
+              f"{kept_tests}/{total_tests} tests, "
+              f"{fixture_size} bytes (from {source_size})")
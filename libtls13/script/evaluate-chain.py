@@ -1,36 +1,143 @@
 #!/usr/bin/env python3
 
+import argparse
+import functools
 import re
 import sys
 
-scanner = re.Scanner([
-    ("\\-\\-\\[(=*)\\[(?:.|\n)*\\]\\1\\]", None),
-    ("\\-\\-[^\n]*\n", None),
-    ("[0-9]+", lambda s, token: ("int", int(token))),
-    ("[a-zA-Z_][a-zA-Z0-9_]*", lambda s, token: ("ident", token)),
-    ("[=,()]", lambda s, token: ("punct", token)),
-    (r"\s+", None),
-])
+from dataclasses import dataclass
+
+# Lua 5.3 tokens. every pattern is matched at a known position and none of
+# them can backtrack far, so lexing is linear in the size of the input.
+name_pattern = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+number_pattern = re.compile(
+    r"0[xX](?:[0-9a-fA-F]+(?:\.[0-9a-fA-F]*)?|\.[0-9a-fA-F]+)"
+    r"(?:[pP][+-]?[0-9]+)?"
+    r"|(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[eE][+-]?[0-9]+)?"
+)
+# \z skips the whitespace that follows, line breaks included.
+short_string_pattern = re.compile(
+    r"""(["'])(?:(?!\1)[^\\\n]|\\z\s*|\\[\s\S])*\1"""
+)
+long_bracket_pattern = re.compile(r"\[(=*)\[")
+space_pattern = re.compile(r"\s+")
+operators = [
+    "...", "..", "==", "~=", "<=", ">=", "<<", ">>", "//", "::",
+    *"+-*/%^#&~|<>=(){}[];:,.",
+]
+
+
+def tokenize(code):
+    """
+    Splits Lua code into (class, value, line) tokens.
+
+    The classes are "ident" (names and keywords), "int", "float", "string" and
+    "punct". Comments and whitespace are skipped.
+    """
+
+    tokens = []
+    pos = 0
+    line = 1
+
+    def long_bracket(pos):
+        # the end of a long string or comment opening at pos, or None.
+        if not (m := long_bracket_pattern.match(code, pos)):
+            return None
+
+        close = code.find("]" + m[1] + "]", m.end())
+
+        if close == -1:
+            raise SyntaxError(f"line {line}: unfinished long bracket")
+
+        return m.end(), close, close + len(m[0])
+
+    while pos < len(code):
+        c = code[pos]
+        start = pos
+
+        if m := space_pattern.match(code, pos):
+            pos = m.end()
+        elif code.startswith("--", pos):
+            if bracket := long_bracket(pos + 2):
+                pos = bracket[2]
+            else:
+                newline = code.find("\n", pos)
+                pos = len(code) if newline == -1 else newline
+        elif m := name_pattern.match(code, pos):
+            tokens.append(("ident", m[0], line))
+            pos = m.end()
+        elif m := number_pattern.match(code, pos):
+            if re.fullmatch(r"[0-9]+", m[0]):
+                tokens.append(("int", int(m[0]), line))
+            elif re.fullmatch(r"0[xX][0-9a-fA-F]+", m[0]):
+                tokens.append(("int", int(m[0], 16), line))
+            else:
+                tokens.append(("float", m[0], line))
+
+            pos = m.end()
+        elif c in "\"'":
+            if not (m := short_string_pattern.match(code, pos)):
+                raise SyntaxError(f"line {line}: unfinished string")
+
+            # escapes are kept as they are.
+            tokens.append(("string", m[0][1:-1], line))
+            pos = m.end()
+        elif c == "[" and (bracket := long_bracket(pos)):
+            # a newline right after the opening bracket is skipped.
+            value = code[bracket[0]:bracket[1]]
+            value = re.sub(r"^(?:\r\n?|\n\r?)", "", value)
+            tokens.append(("string", value, line))
+            pos = bracket[2]
+        else:
+            for op in operators:
+                if code.startswith(op, pos):
+                    tokens.append(("punct", op, line))
+                    pos += len(op)
+
+                    break
+            else:
+                raise SyntaxError(f"line {line}: unexpected character {c!r}")
+
+        line += code.count("\n", start, pos)
+
+    return tokens
 
 
 def parse_lua(code):
-    tokens, unmatched = scanner.scan(code)
+    return parse_tokens(tokenize(code))
 
-    if unmatched:
-        raise SyntaxError("unmatched: " + unmatched)
+
+def parse_tokens(tokens):
+    """
+    Parses a chain: calls to the field (or scalar, or group) operations, for
+    loops of squarings, and local declarations of the temporaries, which are
+    skipped.
+    """
 
     it = iter(tokens)
     parsed = []
+    line = 0
+
+    def next_token():
+        nonlocal line
+
+        try:
+            token_class, value, line = next(it)
+        except StopIteration:
+            raise SyntaxError(f"line {line}: unexpected end of input") from None
+
+        return token_class, value
 
     def parse_token(token_class, value=None):
-        actual_class, actual_value = next(it)
+        actual_class, actual_value = next_token()
 
         if (actual_class == token_class
                 and (value is None or actual_value == value)):
             return actual_value
 
         raise SyntaxError(
-            "unexpected token: " + repr((actual_class, actual_value))
+            f"line {line}: unexpected token: "
+            + repr((actual_class, actual_value))
         )
 
     def parse_ident(value=None):
@@ -92,7 +199,7 @@ def parse_lua(code):
         elif f.endswith("Zero"):
             parse_zero()
         else:
-            raise SyntaxError(f"unknown function {f}")
+            raise SyntaxError(f"line {line}: unknown function {f}")
 
     def parse_for():
         ind_var = parse_ident()
@@ -112,20 +219,148 @@ def parse_lua(code):
 
         parsed[-1] = ("repeated-sq", *parsed[-1][1:], count)
 
-    for token in it:
-        match token:
+    def parse_local():
+        # local t1, t2 = {}, {}
+        names = 1
+        parse_ident()
+
+        while parse_token("punct") == ",":
+            parse_ident()
+            names += 1
+
+        for i in range(names):
+            if i > 0:
+                parse_comma()
+
+            parse_token("punct", "{")
+            parse_token("punct", "}")
+
+    for token_class, value, line in it:
+        match token_class, value:
             case ("ident", "for"):
                 parse_for()
 
+            case ("ident", "local"):
+                parse_local()
+
             case ("ident", f):
                 parse_func(f)
 
-            case _:
-                raise SyntaxError(f"unexpected token: {token!r}")
+            case token:
+                raise SyntaxError(f"line {line}: unexpected token: {token!r}")
 
     return parsed
 
 
+@dataclass
+class Function:
+    """A function definition found in a Lua file."""
+
+    name: str
+    params: list
+    line: int
+    # the tokens between the parameter list and the closing end.
+    body: list
+
+
+def find_functions(tokens):
+    """
+    Finds the function definitions (named ones, nested ones included) in a
+    list of tokens.
+    """
+
+    functions = []
+
+    for i, (token_class, value, line) in enumerate(tokens):
+        if (token_class, value) != ("ident", "function"):
+            continue
+
+        # the name, possibly a.b or a:b; anonymous functions are skipped.
+        j = i + 1
+        name = []
+
+        while tokens[j][0] == "ident" or tokens[j][1] in (".", ":"):
+            name.append(tokens[j][1])
+            j += 1
+
+        if not name or tokens[j][1] != "(":
+            continue
+
+        close = j
+
+        while tokens[close][1] != ")":
+            close += 1
+
+        params = [t[1] for t in tokens[j + 1:close] if t[0] == "ident"]
+
+        # the matching end: function, do and if open a block closed by end;
+        # repeat is closed by until.
+        depth = 1
+        k = close + 1
+
+        while depth and k < len(tokens):
+            token_class, value, _ = tokens[k]
+
+            if token_class == "ident":
+                if value in ("function", "do", "if", "repeat"):
+                    depth += 1
+                elif value in ("end", "until"):
+                    depth -= 1
+
+            k += 1
+
+        if depth:
+            raise SyntaxError(f"line {line}: function {''.join(name)} is "
+                              f"never closed")
+
+        functions.append(Function("".join(name), params, line,
+                                  tokens[close + 1:k - 1]))
+
+    return functions
+
+
+@dataclass
+class Chain:
+    """An exponentiation chain found in a Lua file."""
+
+    name: str
+    # the variable the result is written to and the input.
+    output: str
+    input: str
+    line: int
+    instrs: list
+
+
+def find_chains(code):
+    """
+    Finds the functions of a Lua file that are exponentiation chains: those
+    with two parameters (the result and the input) whose body parses as a
+    chain with both multiplications and squarings.
+    """
+
+    chains = []
+
+    for function in find_functions(tokenize(code)):
+        if len(function.params) != 2:
+            continue
+
+        try:
+            instrs = parse_tokens(function.body)
+        except SyntaxError:
+            continue
+
+        ops = {instr[0] for instr in instrs}
+
+        if "mul" not in ops or not ops & {"sq", "repeated-sq"}:
+            continue
+
+        output, input = function.params
+        chains.append(Chain(function.name, output, input, function.line,
+                            instrs))
+
+    return chains
+
+
 def parse_addchain(code):
     parsed = []
 
@@ -220,37 +455,779 @@ class Monomial:
         return "1"
 
 
-code = sys.stdin.read()
+def evaluate(instrs):
+    env = {}
+
+    def get_var(name):
+        return env.setdefault(name, Monomial(name))
+
+    for instr in instrs:
+        match instr:
+            case ("mul", v1, v2, v3):
+                env[v1] = get_var(v2) * get_var(v3)
+
+            case ("div", v1, v2, v3):
+                env[v1] = get_var(v2) / get_var(v3)
+
+            case ("sq", v1, v2):
+                env[v1] = get_var(v2)**2
+
+            case ("repeated-sq", v1, v2, count):
+                env[v1] = get_var(v2)**(2**count)
+
+            case ("zero", v1):
+                env[v1] = Monomial()
+
+    return env
+
+
+@dataclass
+class Value:
+    """A value assigned to a variable of a chain."""
+
+    var: str
+    # the index of the instruction that assigns it (-1 for the inputs).
+    start: int
+    # the index of the last instruction that reads it.
+    end: int
+    register: str = None
+
+
+def live_ranges(instrs):
+    """
+    Splits the variables of a chain into the values assigned to them.
+
+    Returns (defs, uses, inputs, output): the value each instruction assigns,
+    the values each instruction reads (in operand order), the inputs by name,
+    and the result, which is live until the end.
+    """
+
+    current = {}
+    inputs = {}
+    defs = []
+    uses = []
+
+    for i, instr in enumerate(instrs):
+        v1, *operands = instr[1:]
+        read = []
+
+        for v in operands:
+            if not isinstance(v, str):
+                continue
+
+            if v not in current:
+                current[v] = inputs[v] = Value(v, -1, -1)
+
+            current[v].end = i
+            read.append(current[v])
+
+        current[v1] = Value(v1, i, i)
+        defs.append(current[v1])
+        uses.append(read)
+
+    output = defs[-1]
+    output.end = len(instrs)
+
+    return defs, uses, inputs, output
+
+
+def peak_live(instrs):
+    """
+    Returns the largest number of values (other than the inputs) that are live
+    at the same time.
+
+    A value is live from its assignment up to its last use; an instruction can
+    write the result over one of its operands that isn't used afterwards.
+    """
+
+    if not instrs:
+        return 0
 
-if len(sys.argv) > 1 and sys.argv[1] == "addchain":
-    instrs = parse_addchain(code)
-else:
-    instrs = parse_lua(code)
+    defs, _, _, _ = live_ranges(instrs)
 
-env = {}
+    return max(
+        sum(1 for value in defs if value.start <= i < value.end)
+        + (defs[i].end == i)
+        for i in range(len(instrs))
+    )
 
 
-def get_var(name):
-    return env.setdefault(name, Monomial(name))
+def allocate_registers(instrs):
+    """
+    Rewrites a chain to use as few variables as possible.
 
+    Values whose live ranges don't overlap share a variable, and an instruction
+    writes its result over a dying operand if there is one, so the squarings
+    stay in place. The chains are straight-line code, so allocating the
+    values in order never needs more variables than peak_live.
 
-for instr in instrs:
-    match instr:
-        case ("mul", v1, v2, v3):
-            env[v1] = get_var(v2) * get_var(v3)
+    The inputs are never written to. The result stays in the variable the
+    original chain leaves it in, and the rest are named t1, t2, and so on.
+    """
 
-        case ("div", v1, v2, v3):
-            env[v1] = get_var(v2) / get_var(v3)
+    defs, uses, inputs, output = live_ranges(instrs)
+
+    if output.var in inputs:
+        raise ValueError(f"the chain overwrites its input {output.var}")
+
+    for value in inputs.values():
+        value.register = value.var
+
+    free = []
+    registers = 0
+    allocated = []
+
+    for i, instr in enumerate(instrs):
+        operands = iter(uses[i])
+        args = [
+            next(operands).register if isinstance(v, str) else v
+            for v in instr[2:]
+        ]
+        dying = []
+
+        for value in uses[i]:
+            if (value.end == i and value.var not in inputs
+                    and value.register not in dying):
+                dying.append(value.register)
+
+        free.extend(dying)
+        value = defs[i]
+
+        if dying:
+            value.register = dying[0]
+            free.remove(dying[0])
+        elif free:
+            value.register = free.pop()
+        else:
+            registers += 1
+            # not a valid Lua name, so it can't clash with the inputs.
+            value.register = f"%{registers}"
+
+        if value.end == i:
+            free.append(value.register)
+
+        allocated.append((instr[0], value.register, *args))
+
+    # name the registers in the order they're first used.
+    names = {output.register: output.var}
+    temps = (f"t{i}" for i in range(1, registers + len(inputs) + 2))
+
+    for instr in allocated:
+        for v in instr[1:]:
+            if isinstance(v, str) and v.startswith("%") and v not in names:
+                while (name := next(temps)) in inputs or name == output.var:
+                    pass
+
+                names[v] = name
+
+    return [
+        tuple(names.get(v, v) if isinstance(v, str) else v for v in instr)
+        for instr in allocated
+    ]
+
+
+@dataclass
+class Cost:
+    muls: int = 0
+    sqs: int = 0
+    divs: int = 0
+    temporaries: int = 0
+    # how many temporaries the chain needs after allocate_registers.
+    live_temporaries: int = 0
+    output: str = None
+
+    def total(self, sq_cost=1, div_cost=1):
+        # in units of one multiplication.
+        return self.muls + self.sqs * sq_cost + self.divs * div_cost
+
+    def format(self, sq_cost=1, div_cost=1):
+        parts = [f"{self.muls} mul", f"{self.sqs} sq"]
+
+        if self.divs:
+            parts.append(f"{self.divs} div")
+
+        parts.append(f"{self.temporaries} temporaries "
+                     f"(at most {self.live_temporaries} live)")
+
+        return (", ".join(parts)
+                + f"; cost {self.total(sq_cost, div_cost):.2f}")
+
+
+def chain_cost(instrs):
+    cost = Cost()
+    inputs = set()
+    assigned = set()
+
+    for instr in instrs:
+        match instr:
+            case ("mul", _, _, _):
+                cost.muls += 1
 
-        case ("sq", v1, v2):
-            env[v1] = get_var(v2)**2
+            case ("div", _, _, _):
+                cost.divs += 1
 
-        case ("repeated-sq", v1, v2, count):
-            env[v1] = get_var(v2)**(2**count)
+            case ("sq", _, _):
+                cost.sqs += 1
 
-        case ("zero", v1):
-            env[v1] = Monomial()
+            case ("repeated-sq", _, _, count):
+                cost.sqs += count
 
+            case ("zero", _):
+                pass
 
-for var, value in env.items():
-    print(f"{var} = {value}")
+        v1, *operands = instr[1:]
+        inputs.update(
+            v for v in operands if isinstance(v, str) and v not in assigned
+        )
+        assigned.add(v1)
+        cost.output = v1
+
+    # the chain reads its inputs and leaves the result in the last variable it
+    # assigns to. everything else needs to be allocated.
+    cost.temporaries = len(assigned - inputs - {cost.output})
+    # the result doesn't need a temporary either.
+    cost.live_temporaries = max(peak_live(instrs) - 1, 0)
+
+    return cost
+
+
+def parse(code, fmt):
+    if fmt == "addchain":
+        return parse_addchain(code)
+
+    return parse_lua(code)
+
+
+# well-known exponents for --search.
+exponents = {
+    # p - 2 for secp384r1: fieldInvert.
+    "secp384r1-field": 2**384 - 2**128 - 2**96 + 2**32 - 3,
+    # n - 2 for secp384r1: scalarInvert.
+    "secp384r1-scalar": 2**384 - 0x389cb27e0bc8d220a7e5f24db74f58851313e695333ad68f,
+    # p - 2 for curve25519: fieldInvert.
+    "curve25519-field": 2**255 - 21,
+    # (p - 5) / 8 for curve25519: fieldPow2p252m3.
+    "curve25519-pow22523": 2**252 - 3,
+}
+
+
+def split_exponent(e, window, min_run):
+    """
+    Splits the exponent into digits for left-to-right exponentiation.
+
+    Returns (digits, shift), where digits is a list of (value, shift) pairs.
+    Computing acc = acc^(2^shift) * a^value for each of them, starting with
+    acc = 1, and then squaring the result another `shift` times yields a^e.
+
+    Runs of at least min_run ones become a single digit 2^len - 1. The rest of
+    the bits are covered by odd windows at most `window` bits wide.
+    """
+
+    bits = f"{e:b}"
+
+    def run_length(i):
+        return len(bits[i:]) - len(bits[i:].lstrip("1"))
+
+    digits = []
+    shift = 0
+    i = 0
+
+    while i < len(bits):
+        if bits[i] == "0":
+            shift += 1
+            i += 1
+
+            continue
+
+        if run_length(i) >= min_run:
+            width = run_length(i)
+        else:
+            width = min(window, len(bits) - i)
+
+            # don't break up a long run that follows.
+            for j in range(i + 1, i + width):
+                if (bits[j - 1] == "0" and bits[j] == "1"
+                        and run_length(j) >= min_run):
+                    width = j - i
+
+                    break
+
+            # the window must end with a one.
+            width = len(bits[i:i + width].rstrip("0"))
+
+        digits.append((int(bits[i:i + width], 2), shift + width))
+        shift = 0
+        i += width
+
+    return digits, shift
+
+
+@functools.cache
+def star_chain(targets):
+    """
+    Finds a shortest star addition chain containing all the targets.
+
+    A star chain starts with 1, and each of its elements is the sum of the
+    previous element and some earlier one.
+    """
+
+    top = targets[-1]
+    chain = [1]
+
+    def extend(depth):
+        last = chain[-1]
+
+        if last == top:
+            return all(t in chain for t in targets)
+
+        if len(chain) > depth or last << depth + 1 - len(chain) < top:
+            return False
+
+        for j in reversed(chain):
+            following = last + j
+
+            # the chain is increasing, so a target can't be skipped over.
+            if following > top or any(last < t < following for t in targets):
+                continue
+
+            chain.append(following)
+
+            if extend(depth):
+                return True
+
+            chain.pop()
+
+        return False
+
+    depth = top.bit_length() - 1
+
+    while not extend(depth):
+        depth += 1
+
+    return chain
+
+
+class ChainBuilder:
+    """
+    Builds an exponentiation chain from the digits of an exponent.
+
+    The input is `a`, the result is left in `b`, and every precomputed power
+    gets a temporary of its own.
+    """
+
+    def __init__(self):
+        self.instrs = []
+        self.powers = {1: "a"}
+        self.temps = 0
+
+    def new_temp(self):
+        self.temps += 1
+
+        return f"t{self.temps}"
+
+    def sq(self, dst, src, count):
+        if count == 1:
+            self.instrs.append(("sq", dst, src))
+        else:
+            self.instrs.append(("repeated-sq", dst, src, count))
+
+    def mul(self, dst, x, y):
+        self.instrs.append(("mul", dst, x, y))
+
+    def odd_powers(self, limit):
+        # a^3, a^5, ..., up to a^limit, each from the previous one and a^2.
+        if limit < 3:
+            return
+
+        if 2 not in self.powers:
+            self.powers[2] = self.new_temp()
+            self.sq(self.powers[2], "a", 1)
+
+        for value in range(3, limit + 1, 2):
+            if value not in self.powers:
+                self.powers[value] = self.new_temp()
+                self.mul(self.powers[value], self.powers[value - 2],
+                         self.powers[2])
+
+    def run_powers(self, lengths):
+        # a^(2^length - 1) for each length. uses
+        #   a^(2^(i + j) - 1) = (a^(2^i - 1))^(2^j) * a^(2^j - 1),
+        # following a star addition chain for the lengths, where i is always the
+        # previous element. the squarings then add up to max(lengths) - 1.
+        chain = star_chain(tuple(sorted(lengths)))
+
+        for k in range(1, len(chain)):
+            i = chain[k - 1]
+            j = chain[k] - i
+
+            if 2**chain[k] - 1 in self.powers:
+                continue
+
+            dst = self.new_temp()
+            self.sq(dst, self.powers[2**i - 1], j)
+            self.mul(dst, dst, self.powers[2**j - 1])
+            self.powers[2**chain[k] - 1] = dst
+
+    def build(self, digits, shift):
+        # all-ones digits are built as runs, the rest from the odd powers.
+        values = {value for value, _ in digits}
+        runs = {value for value in values if value & (value + 1) == 0}
+        self.odd_powers(max(values - runs, default=1))
+
+        if runs:
+            self.run_powers([value.bit_length() for value in runs])
+
+        acc = None
+
+        for value, digit_shift in digits:
+            if acc is None:
+                acc = self.powers[value]
+
+                continue
+
+            self.sq("b", acc, digit_shift)
+            self.mul("b", "b", self.powers[value])
+            acc = "b"
+
+        if shift:
+            self.sq("b", acc, shift)
+            acc = "b"
+
+        if acc != "b":
+            raise ValueError("the exponent is too small")
+
+        return self.instrs
+
+
+def search_chain(e, sq_cost, max_window=8):
+    """
+    Finds a cheap chain computing a^e.
+
+    Tries every combination of the window width and the minimum length of a run
+    of ones that is handled separately, and returns the cheapest chain (with
+    the fewest temporaries among equals).
+    """
+
+    best = None
+
+    for window in range(1, max_window + 1):
+        for min_run in [*range(2, e.bit_length() + 1), e.bit_length() + 1]:
+            if min_run <= window:
+                continue
+
+            try:
+                instrs = ChainBuilder().build(
+                    *split_exponent(e, window, min_run)
+                )
+            except ValueError:
+                # the whole exponent is one of the precomputed powers, which
+                # leaves the result in a temporary: a narrower window will do.
+                continue
+
+            cost = chain_cost(instrs)
+            key = (cost.total(sq_cost), cost.temporaries)
+
+            if best is None or key < best[0]:
+                best = key, instrs
+
+    if best is None:
+        raise ValueError("the exponent is too small")
+
+    return best[1]
+
+
+def format_lua(instrs, prefix, loops=False, indent="  "):
+    """
+    Formats the chain as Lua code in the style of the inversion routines.
+
+    Repeated squarings become calls to `{prefix}RepeatedSq`, or, if loops is
+    set, `for` loops over `{prefix}Sq`.
+    """
+
+    lines = []
+
+    for instr in instrs:
+        match instr:
+            case ("mul", dst, x, y):
+                lines.append(f"{prefix}Mul({dst}, {x}, {y})")
+
+            case ("sq", dst, src):
+                lines.append(f"{prefix}Sq({dst}, {src})")
+
+            case ("repeated-sq", dst, src, count) if not loops:
+                lines.append(f"{prefix}RepeatedSq({dst}, {src}, {count})")
+
+            case ("repeated-sq", dst, src, count):
+                if src != dst:
+                    lines.append(f"{prefix}Sq({dst}, {src})")
+                    count -= 1
+
+                if count == 1:
+                    lines.append(f"{prefix}Sq({dst}, {dst})")
+                elif count > 1:
+                    lines.append(f"for i = 1, {count}, 1 do")
+                    lines.append(f"{indent}{prefix}Sq({dst}, {dst})")
+                    lines.append("end")
+
+    return "".join(f"{indent}{line}\n" for line in lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Evaluates an exponentiation chain read from stdin: "
+                    "prints the resulting monomial for each variable. With "
+                    "--file, finds the chains in a Lua file and prints what "
+                    "each computes.",
+    )
+    parser.add_argument(
+        "format",
+        nargs="?",
+        choices=["lua", "addchain"],
+        default="lua",
+        help="the format of the chain: Lua code (a function body) or the "
+             "output of addchain",
+    )
+    parser.add_argument(
+        "--file",
+        metavar="PATH",
+        help="read the chains from the functions of a Lua file (e.g. "
+             "src/crypto/secp384r1.lua) instead of stdin",
+    )
+    parser.add_argument(
+        "--function",
+        metavar="NAME",
+        help="with --file, only this chain (required for --allocate and "
+             "--diff if the file has several)",
+    )
+    parser.add_argument(
+        "--search",
+        metavar="EXPONENT",
+        help="instead of reading a chain, search for one computing a^EXPONENT "
+             "and print it as Lua code. EXPONENT is a number or one of: "
+             + ", ".join(exponents),
+    )
+    parser.add_argument(
+        "--allocate",
+        action="store_true",
+        help="rewrite the chain to reuse temporaries once they're dead and "
+             "print it as Lua code (checked to compute the same result)",
+    )
+    parser.add_argument(
+        "--prefix",
+        help="the function name prefix for --search and --allocate (field or "
+             "scalar; by default, guessed from the exponent or the function "
+             "name, or field)",
+    )
+    parser.add_argument(
+        "--loops",
+        action="store_true",
+        help="emit repeated squarings as for loops",
+    )
+    parser.add_argument(
+        "--cost",
+        action="store_true",
+        help="report the number of operations and temporaries",
+    )
+    parser.add_argument(
+        "--sq-cost",
+        type=float,
+        default=0.8,
+        help="the cost of a squaring relative to a multiplication "
+             "(default: %(default)s; cf. verify-ecdsa-mul.py --count-only)",
+    )
+    parser.add_argument(
+        "--div-cost",
+        type=float,
+        default=1,
+        help="the cost of a division relative to a multiplication",
+    )
+    parser.add_argument(
+        "--diff",
+        metavar="PATH",
+        help="compare the cost with the chain in another file",
+    )
+    parser.add_argument(
+        "--diff-format",
+        choices=["lua", "addchain"],
+        help="the format of the other chain (by default, same as stdin's)",
+    )
+    args = parser.parse_args()
+    chains = None
+
+    if args.file:
+        with open(args.file) as f:
+            chains = find_chains(f.read())
+
+        if args.function:
+            chains = [chain for chain in chains if chain.name == args.function]
+
+        if not chains:
+            sys.exit(f"{args.file}: no chain found")
+
+    def read_chain():
+        if chains is None:
+            return parse(sys.stdin.read(), args.format)
+        elif len(chains) > 1:
+            sys.exit(f"{args.file} has several chains; pick one with "
+                     f"--function: " + ", ".join(c.name for c in chains))
+
+        return chains[0].instrs
+
+    if chains is not None and not (args.allocate or args.diff):
+        names = {exponent: name for name, exponent in exponents.items()}
+
+        for chain in chains:
+            cost = chain_cost(chain.instrs)
+            result = evaluate(chain.instrs)[chain.output]
+            print(f"{args.file}:{chain.line}: {chain.name}({chain.output}, "
+                  f"{chain.input})")
+            print(f"  {chain.output} = {result}")
+
+            if result.vars.keys() == {chain.input}:
+                if name := names.get(result.vars[chain.input]):
+                    print(f"  the exponent is {name}")
+
+            if cost.output != chain.output:
+                print(f"  warning: the chain ends by assigning {cost.output}")
+
+            if args.cost:
+                print(f"  cost: {cost.format(args.sq_cost, args.div_cost)}")
+
+        sys.exit(0)
+
+    if args.search:
+        if args.search in exponents:
+            exponent = exponents[args.search]
+            prefix = args.prefix or args.search.split("-")[1]
+
+            if prefix not in ["field", "scalar"]:
+                prefix = "field"
+        else:
+            try:
+                exponent = int(args.search, 0)
+            except ValueError:
+                exponent = None
+
+            if exponent is None or exponent < 1:
+                parser.error(f"--search: expected a positive number or one "
+                             f"of {', '.join(exponents)}; got {args.search!r}")
+
+            prefix = args.prefix or "field"
+
+        try:
+            instrs = search_chain(exponent, args.sq_cost)
+        except ValueError as e:
+            parser.error(f"--search: {e}")
+
+        if args.allocate:
+            instrs = allocate_registers(instrs)
+
+        cost = chain_cost(instrs)
+        temporaries = ", ".join(f"t{i}" for i in range(1, cost.temporaries + 1))
+        code = (
+            f"  -- b = a^0x{exponent:x}\n"
+            f"  -- {cost.format(args.sq_cost, args.div_cost)} ({temporaries})\n"
+            + format_lua(instrs, prefix, args.loops)
+        )
+
+        # make sure the code does what it's supposed to.
+        instrs = parse_lua(code)
+        env = evaluate(instrs)
+
+        if env["b"].vars != {"a": exponent}:
+            raise AssertionError(f"the generated chain computes {env['b']}")
+
+        print(code, end="")
+    elif args.allocate:
+        original = read_chain()
+        prefix = args.prefix or "field"
+
+        if not original:
+            sys.exit("the chain is empty")
+
+        if chains and not args.prefix:
+            # the prefix of the chain's own name: fieldInvert -> field.
+            prefix = re.match("[a-z]*", chains[0].name)[0] or prefix
+
+        original_cost = chain_cost(original)
+        output = original_cost.output
+        expected = evaluate(original)[output]
+
+        instrs = allocate_registers(original)
+        cost = chain_cost(instrs)
+        temporaries = ", ".join(f"t{i}" for i in range(1, cost.temporaries + 1))
+        code = (
+            f"  -- {output} = {expected}\n"
+            f"  -- {cost.format(args.sq_cost, args.div_cost)} ({temporaries})\n"
+            + format_lua(instrs, prefix, args.loops)
+        )
+
+        # the rewritten chain must compute the same thing.
+        instrs = parse_lua(code)
+        env = evaluate(instrs)
+
+        if env[output].vars != expected.vars:
+            raise AssertionError(
+                f"the rewritten chain computes {output} = {env[output]}"
+            )
+
+        print(code, end="")
+        print(
+            f"temporaries: {original_cost.temporaries} -> {cost.temporaries}",
+            file=sys.stderr,
+        )
+    else:
+        instrs = read_chain()
+        env = evaluate(instrs)
+
+        for var, value in env.items():
+            print(f"{var} = {value}")
+
+    # keep the generated code apart from the report.
+    report = sys.stderr if args.search or args.allocate else sys.stdout
+
+    if args.cost or args.diff:
+        cost = chain_cost(instrs)
+        print(file=report)
+        print(f"cost: {cost.format(args.sq_cost, args.div_cost)}", file=report)
+
+    if args.diff:
+        with open(args.diff) as f:
+            other_instrs = parse(f.read(), args.diff_format or args.format)
+
+        other_cost = chain_cost(other_instrs)
+        other_env = evaluate(other_instrs)
+        print(f"other: {other_cost.format(args.sq_cost, args.div_cost)}",
+              file=report)
+
+        # an empty chain has no result to compare.
+        if (cost.output and other_cost.output
+                and str(env[cost.output])
+                != str(other_env[other_cost.output])):
+            print(
+                f"warning: the chains compute different results "
+                f"({cost.output} = {env[cost.output]} vs "
+                f"{other_cost.output} = {other_env[other_cost.output]})",
+                file=report,
+            )
+
+        total = cost.total(args.sq_cost, args.div_cost)
+        other_total = other_cost.total(args.sq_cost, args.div_cost)
+
+        if total == other_total:
+            print("the chains are equally expensive", file=report)
+        else:
+            if args.search:
+                this = "the generated chain"
+            elif chains is not None:
+                this = f"{args.file}:{chains[0].name}"
+            else:
+                this = "stdin"
+
+            cheaper = this if total < other_total else args.diff
+            saving = abs(total - other_total)
+            print(
+                f"{cheaper} is cheaper by {saving:.2f} "
+                f"({saving / max(total, other_total):.1%})",
+                file=report,
+            )
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""Generates big-integer test data with adversarial operand distributions.
+
+generate-modpow-test-data.py, generate-mod-vec-vec-test-data.py and
+generate-div64by32-test-data.py only draw uniform words. This script writes
+the same formats (or the binary one from vecfile.py), but takes the operands
+from a named distribution:
+
+- uniform: uniformly random words, like the other generators.
+- max-carry: all-ones words (with a random low word), which maximize carry
+  and borrow chains.
+- sparse: a handful of set bits.
+- near-modulus: moduli just above a power of two, operands just below the
+  modulus.
+- rsa-2048, rsa-3072, rsa-4096: RSA-shaped moduli (exact bit length, the top
+  two bits and the low bit set), operands below the modulus, and the public
+  exponent 65537, which is what rsa.lua computes.
+- quotient-correction (div64by32 only): cases that make divide64By32 correct
+  its quotient estimate at least once.
+
+Operands are drawn whole, with a few getrandbits calls rather than one per
+word, and the output is deterministic for a given --seed. --all DIR writes
+every applicable (kind, distribution) pair as
+DIR/<kind>-<distribution>.{txt,bin}; run-benchmarks.py --corpus DIR
+benchmarks montgomery.lua on the modpow and mod-vec-vec files (the rsa-*
+ones are the modular exponentiations rsa.lua performs).
+
+Usage:
+    generate-bigint-corpus.py modpow rsa-2048 > modpow.txt
+    generate-bigint-corpus.py --binary --all corpus
+"""
+
+import argparse
+import os
+import random
+import sys
+
+import vecfile
+
+MAX_WORDS = {
+    "modpow": 256,
+    "mod-vec-vec": 1024,
+}
+MAX_EXPONENT_WORDS = 8
+RSA_EXPONENT = 65537
+
+COUNTS = {
+    "modpow": 64,
+    "mod-vec-vec": 1024,
+    "div64by32": 1024,
+}
+
+
+def uniform(rng, bits):
+    return rng.getrandbits(bits)
+
+
+def max_carry(rng, bits):
+    low = min(32, bits)
+
+    return (1 << bits) - 1 ^ rng.getrandbits(low) & rng.getrandbits(low)
+
+
+def sparse(rng, bits):
+    result = 1 << bits - 1
+
+    for _ in range(rng.randint(0, max(1, bits // 256))):
+        result |= 1 << rng.randrange(bits)
+
+    return result
+
+
+def near_power(rng, bits):
+    # 2^(bits - 1) plus an offset of at most a word
+    return 1 << bits - 1 | rng.getrandbits(min(32, bits // 4))
+
+
+def rsa_modulus(rng, bits):
+    return 0b11 << bits - 2 | rng.getrandbits(bits - 2) | 1
+
+
+operands = {
+    "uniform": uniform,
+    "max-carry": max_carry,
+    "sparse": sparse,
+    "near-modulus": near_power,
+}
+
+rsa_sizes = {
+    "rsa-2048": 2048,
+    "rsa-3072": 3072,
+    "rsa-4096": 4096,
+}
+
+
+def random_bits(rng, max_words):
+    return 32 * rng.randint(1, max_words)
+
+
+def below(rng, m):
+    # slightly biased, but cheap: one getrandbits call
+    return rng.getrandbits(m.bit_length()) % m
+
+
+def make_modpow(rng, distribution):
+    if distribution in rsa_sizes:
+        m = rsa_modulus(rng, rsa_sizes[distribution])
+        x = below(rng, m)
+        y = RSA_EXPONENT
+    else:
+        gen = operands[distribution]
+        m = gen(rng, random_bits(rng, MAX_WORDS["modpow"])) | 1
+
+        if distribution == "near-modulus":
+            x = max(0, m - 1 - rng.getrandbits(16))
+            y = uniform(rng, random_bits(rng, MAX_EXPONENT_WORDS))
+        else:
+            x = gen(rng, random_bits(rng, MAX_WORDS["modpow"]))
+            y = gen(rng, random_bits(rng, MAX_EXPONENT_WORDS))
+
+    return x, y, m, pow(x, y, m)
+
+
+def make_mod_vec_vec(rng, distribution):
+    if distribution in rsa_sizes:
+        # reducing a double-length product is the common case
+        y = rsa_modulus(rng, rsa_sizes[distribution])
+        x = uniform(rng, 2 * y.bit_length())
+    else:
+        gen = operands[distribution]
+        y = gen(rng, random_bits(rng, MAX_WORDS["mod-vec-vec"]))
+
+        if distribution == "near-modulus":
+            x = y * rng.getrandbits(64) + y - 1 - rng.getrandbits(16)
+        else:
+            x = gen(rng, random_bits(rng, MAX_WORDS["mod-vec-vec"]))
+
+    if y == 0:
+        y = 1
+
+    return x, y, x % y
+
+
+def div64by32_corrections(x, y):
+    """Counts the quotient corrections divide64By32 in montgomery.lua makes."""
+
+    if x >> 63 == 0:
+        return 0
+
+    corrections = 0
+    y1 = y >> 8
+    r = x << 16
+
+    for shift in (40, 16):
+        z = min((r >> shift + 8) // y1, 0xffffff)
+        r -= z * y << shift
+
+        while r < 0:
+            r += y << shift
+            corrections += 1
+
+    return corrections
+
+
+def make_div64by32(rng, distribution):
+    match distribution:
+        case "uniform":
+            dividend = rng.getrandbits(64) | 1 << 63
+            divisor = rng.getrandbits(32) | 1 << 31
+
+        case "max-carry":
+            dividend = max_carry(rng, 64)
+            divisor = max_carry(rng, 32) | 1 << 31
+
+        case "sparse":
+            dividend = sparse(rng, 64)
+            divisor = sparse(rng, 32)
+
+        case "near-modulus":
+            divisor = near_power(rng, 32)
+            dividend = divisor * (rng.getrandbits(32) | 1 << 31) - 1
+
+        case "quotient-correction":
+            while True:
+                # a small top part and a large low byte make the estimate,
+                # which only looks at the top 24 bits, overshoot
+                divisor = 1 << 31 | rng.getrandbits(12) << 8 | 0xff
+                dividend = rng.getrandbits(64) | 1 << 63
+
+                if div64by32_corrections(dividend, divisor):
+                    break
+
+        case _:
+            raise ValueError(f"{distribution} does not apply to div64by32")
+
+    return dividend, divisor, dividend // divisor
+
+
+kinds = {
+    "modpow": (make_modpow, [*operands, *rsa_sizes]),
+    "mod-vec-vec": (make_mod_vec_vec, [*operands, *rsa_sizes]),
+    "div64by32": (make_div64by32, [*operands, "quotient-correction"]),
+}
+
+
+def generate(kind, distribution, count, seed):
+    make, _ = kinds[kind]
+    rng = random.Random(f"{seed}/{kind}/{distribution}")
+
+    return [make(rng, distribution) for _ in range(count)]
+
+
+def write_text(out, kind, cases):
+    for case in cases:
+        if kind == "div64by32":
+            print(" ".join(f"0x{x:x}" for x in case), file=out)
+        else:
+            print(" ".join(f"{x:x}" for x in case), file=out)
+
+
+def write(path, kind, cases, binary):
+    if binary:
+        with open(path, "wb") as f:
+            vecfile.write_cases(f, cases)
+    else:
+        with open(path, "w") as f:
+            write_text(f, kind, cases)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate adversarial big-integer test data.",
+    )
+    parser.add_argument("kind", nargs="?", choices=kinds)
+    parser.add_argument("distribution", nargs="?")
+    parser.add_argument(
+        "-n", "--count",
+        type=int,
+        help="the number of cases (default: as many as the other generators)",
+    )
+    parser.add_argument("--seed", default="zxcvbnM1")
+    parser.add_argument(
+        "--binary",
+        action="store_true",
+        help="write the binary format described in vecfile.py",
+    )
+    parser.add_argument(
+        "--all",
+        metavar="DIR",
+        help="write every kind and distribution into DIR",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="list the distributions for each kind",
+    )
+    args = parser.parse_args()
+
+    if args.list:
+        for kind, (_, distributions) in kinds.items():
+            print(f"{kind}: {', '.join(distributions)}")
+    elif args.all:
+        os.makedirs(args.all, exist_ok=True)
+        ext = "bin" if args.binary else "txt"
+
+        for kind, (_, distributions) in kinds.items():
+            for distribution in distributions:
+                path = os.path.join(args.all, f"{kind}-{distribution}.{ext}")
+                print(path, file=sys.stderr)
+                cases = generate(kind, distribution,
+                                 args.count or COUNTS[kind], args.seed)
+                write(path, kind, cases, args.binary)
+    elif args.kind and args.distribution:
+        if args.distribution not in kinds[args.kind][1]:
+            parser.error(f"unknown distribution for {args.kind}: "
+                         f"{args.distribution} (see --list)")
+
+        cases = generate(args.kind, args.distribution,
+                         args.count or COUNTS[args.kind], args.seed)
+
+        if args.binary:
+            vecfile.write_cases(sys.stdout.buffer, cases)
+        else:
+            write_text(sys.stdout, args.kind, cases)
+    else:
+        parser.error("either a kind and a distribution or --all is required")
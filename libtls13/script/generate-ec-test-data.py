@@ -1,18 +1,27 @@
 #!/usr/bin/env python3
 
+import argparse
+import hashlib
+import hmac
 import json
 import random
 import sys
 
 from dataclasses import dataclass
 
+from arith import invert, mpz, powmod
+
 
 @dataclass
 class Field:
+    # the elements are of the arith backend's type (int or mpz)
     p: int
 
+    def __post_init__(self):
+        self.p = mpz(self.p)
+
     def to_element(self, x):
-        return x % self.p
+        return mpz(x) % self.p
 
     def add(self, x, y):
         return (x + y) % self.p
@@ -21,13 +30,13 @@ class Field:
         return (x * y) % self.p
 
     def pow(self, x, y):
-        return pow(x, y, self.p)
+        return powmod(x, y, self.p)
 
     def neg(self, x):
         return -x % self.p
 
     def inv(self, x):
-        return pow(x, -1, self.p)
+        return invert(x, self.p)
 
     def legendre(self, x):
         assert self.p % 2 == 1
@@ -41,12 +50,43 @@ class Field:
         return random.randint(low, hi)
 
     def sqrt(self, x):
+        """Returns a square root of x, or None if x is not a square.
+
+        For p ≡ 3 (mod 4) and p ≡ 5 (mod 8) (secp384r1 and curve25519) the
+        root is a direct formula costing one exponentiation, checked by
+        squaring it; otherwise Tonelli—Shanks is used.
+        """
+
         if x == 0:
             return x
-        elif self.legendre(x) != 1:
-            return None
+        elif self.p % 4 == 3:
+            r = self.pow(x, (self.p + 1) // 4)
+        elif self.p % 8 == 5:
+            # Atkin
+            v = self.pow(self.add(x, x), (self.p - 5) // 8)
+            i = self.mul(self.mul(self.add(x, x), v), v)
+            r = self.mul(self.mul(x, v), self.add(i, -1))
+        else:
+            return self.tonelli_shanks(x)
+
+        return r if self.mul(r, r) == x else None
+
+    def non_residue(self):
+        """Returns the least quadratic non-residue (for Tonelli—Shanks)."""
+
+        if self.__dict__.get("_non_residue") is None:
+            z = 2
+
+            while self.legendre(z) == 1:
+                z += 1
+
+            self._non_residue = z
 
-        # Tonelli—Shanks
+        return self._non_residue
+
+    def tonelli_shanks(self, x):
+        if self.legendre(x) != 1:
+            return None
 
         q = self.p - 1
         s = 0
@@ -55,11 +95,7 @@ class Field:
             q >>= 1
             s += 1
 
-        while True:
-            z = self.random(2)
-
-            if self.legendre(z) == 1:
-                break
+        z = self.non_residue()
 
         m = s
         c = self.pow(z, q)
@@ -67,15 +103,16 @@ class Field:
         r = self.pow(x, (q + 1) // 2)
 
         while not 0 <= t <= 1:
+            # the least i such that t^(2^i) = 1
             tt = t
+            i = 0
 
-            for i in range(1, m):
-                if tt == 1:
-                    break
+            while tt != 1:
+                tt = self.mul(tt, tt)
+                i += 1
 
-                tt = self.pow(tt, 2)
-            else:
-                return None
+                if i == m:
+                    return None
 
             b = self.pow(c, 1 << m - i - 1)
             m = i
@@ -162,7 +199,7 @@ class FieldElement:
         return self
 
     def __int__(self):
-        return self.x
+        return int(self.x)
 
     def __eq__(self, other):
         other = self._coerce(other)
@@ -206,14 +243,66 @@ class Curve:
     def get_y(self, x):
         return (x**3 + self.a * x + self.b).sqrt()
 
-    def random_point(self):
-        y = None
+    def contains(self, point):
+        if point.is_zero():
+            return True
+
+        x, y = point.x, point.y
+
+        return y**2 == x**3 + self.a * x + self.b
+
+    def _rhs(self, x):
+        # x³ + ax + b on plain integers
+        field = self.field
+
+        return field.add(field.mul(field.add(field.mul(x, x), self.a.x), x),
+                         self.b.x)
+
+    def decompress_many(self, points):
+        """Recovers points from their x coordinates and the parities of y.
+
+        points is an iterable of (x, y parity) pairs. Returns a list with a
+        Point per pair, or None where x is not on the curve.
+        """
 
-        while y is None:
-            x = FieldElement(self.field.random(), self.field)
-            y = self.get_y(x)
+        field = self.field
+        result = []
 
-        return Point(x, y, self)
+        for x, parity in points:
+            y = field.sqrt(self._rhs(field.to_element(int(x))))
+
+            if y is None:
+                result.append(None)
+                continue
+
+            if y & 1 != parity & 1:
+                y = field.neg(y)
+
+            result.append(Point(FieldElement(x, field), FieldElement(y, field),
+                                self))
+
+        return result
+
+    def decompress(self, x, parity):
+        return self.decompress_many([(x, parity)])[0]
+
+    def random_points(self, n):
+        """Returns n random points (the same ones as n random_point calls)."""
+
+        field = self.field
+        result = []
+
+        while len(result) < n:
+            x = field.random()
+
+            if (y := field.sqrt(self._rhs(x))) is not None:
+                result.append(Point(FieldElement(x, field),
+                                    FieldElement(y, field), self))
+
+        return result
+
+    def random_point(self):
+        return self.random_points(1)[0]
 
 
 class PointOps:
@@ -401,12 +490,332 @@ secp384r1_scalars = Field(from_hex('''
     FFFFFFFF FFFFFFFF FFFFFFFF FFFFFFFF FFFFFFFF FFFFFFFF
     C7634D81 F4372DDF 581A0DB2 48B0A77A ECEC196A CCC52973
 '''))
-order = secp384r1_scalars.p
+order = int(secp384r1_scalars.p)
+
+
+def multi_scalar_mul(terms):
+    """Computes the sum of k * P over the (k, P) pairs of terms.
+
+    The points are affine. The doublings are shared (Straus), so this costs
+    about as many doublings as a single scalar multiplication.
+    """
+
+    terms = [(k % order, JacobianPoint.from_affine(p)) for k, p in terms]
+    result = JacobianPoint.zero(secp384r1)
+
+    for i in range(max(bit_count(k) for k, _ in terms) - 1, -1, -1):
+        result = result.double()
+
+        for k, p in terms:
+            if k >> i & 1:
+                result += p
+
+    return result
+
+
+def encode_point(p):
+    return b"\x04" + int(p.x).to_bytes(48, "big") + int(p.y).to_bytes(48, "big")
+
+
+# ECDSA over secp384r1.
+
+def bits2int(b):
+    x = int.from_bytes(b, "big")
+    excess = 8 * len(b) - bit_count(order)
+
+    return x >> excess if excess > 0 else x
+
+
+def rfc6979_nonces(d, digest, hash_name):
+    """Yields the candidate nonces for signing digest with d (RFC 6979 3.2)."""
+
+    def mac(key, data):
+        return hmac.new(key, data, hash_name).digest()
+
+    qlen = bit_count(order)
+    x = d.to_bytes(48, "big")
+    h = (bits2int(digest) % order).to_bytes(48, "big")
+
+    v = b"\x01" * hashlib.new(hash_name).digest_size
+    k = b"\x00" * len(v)
+    k = mac(k, v + b"\x00" + x + h)
+    v = mac(k, v)
+    k = mac(k, v + b"\x01" + x + h)
+    v = mac(k, v)
+
+    while True:
+        t = b""
+
+        while 8 * len(t) < qlen:
+            v = mac(k, v)
+            t += v
+
+        if 1 <= (nonce := bits2int(t)) < order:
+            yield nonce
+
+        k = mac(k, v + b"\x00")
+        v = mac(k, v)
+
+
+@dataclass
+class Signature:
+    q: Point
+    message: bytes
+    r: int
+    s: int
+    # bit 0: the parity of R.y; bit 1: set if R.x ≥ order. R is the point
+    # whose x coordinate r is, which batch verification needs. None if
+    # unknown.
+    recovery_id: int | None = None
+    hash_name: str = "sha384"
+
+    @property
+    def e(self):
+        return bits2int(hashlib.new(self.hash_name, self.message).digest())
+
+    def r_point(self):
+        """Recovers R from r and the recovery id, or returns None."""
+
+        x = self.r + (self.recovery_id >> 1) * order
+
+        if x >= secp384r1_field.p:
+            return None
+
+        return secp384r1.decompress(x, self.recovery_id & 1)
+
+
+def ecdsa_sign(d, message, hash_name="sha384"):
+    digest = hashlib.new(hash_name, message).digest()
+    e = bits2int(digest)
+    gj = JacobianPoint.from_affine(secp384r1_g)
+
+    for k in rfc6979_nonces(d, digest, hash_name):
+        p = (k * gj).to_affine()
+        r = int(p.x) % order
+        s = pow(k, -1, order) * (e + r * d) % order
+
+        if r and s:
+            recovery_id = int(p.y) & 1 | (int(p.x) >= order) << 1
+
+            return Signature(int(d) * secp384r1_g, message, r, s,
+                             recovery_id, hash_name)
+
+
+def ecdsa_verify(sig):
+    if not (0 < sig.r < order and 0 < sig.s < order):
+        return False
+    elif sig.q.is_zero() or not secp384r1.contains(sig.q):
+        return False
+
+    w = pow(sig.s, -1, order)
+    p = multi_scalar_mul([
+        (sig.e * w, secp384r1_g),
+        (sig.r * w, sig.q),
+    ])
+
+    return not p.is_zero() and int(p.to_affine().x) % order == sig.r
+
+
+def ecdsa_batch_verify(signatures, rng=random):
+    """Checks that all signatures are valid with one multi-scalar mult.
+
+    Every signature is weighted by a random 128-bit z, and the sum
+
+        (Σ z e / s) G + Σ (z r / s) Q - Σ z R
+
+    must be zero. A batch with an invalid signature passes with
+    probability about 2⁻¹²⁸. Signatures without a recovery id are verified
+    individually: the sign of R can't be guessed.
+    """
+
+    g_scalar = 0
+    terms = []
+
+    for sig in signatures:
+        if sig.recovery_id is None:
+            if not ecdsa_verify(sig):
+                return False
+
+            continue
+
+        if not (0 < sig.r < order and 0 < sig.s < order):
+            return False
+        elif sig.q.is_zero() or not secp384r1.contains(sig.q):
+            return False
+        elif (r_point := sig.r_point()) is None:
+            return False
+
+        z = rng.randrange(1, 2**128)
+        w = pow(sig.s, -1, order)
+        g_scalar += z * sig.e * w
+        terms.append((z * sig.r * w, sig.q))
+        terms.append((-z, r_point))
+
+    if not terms:
+        return True
+
+    return multi_scalar_mul([(g_scalar, secp384r1_g), *terms]).is_zero()
+
+
+def ecdsa_find_invalid(signatures, rng=random):
+    """Returns the indices of the invalid signatures.
+
+    The batch is split in halves until the halves pass. A single signature
+    that fails the batch check is verified on its own, so a wrong recovery
+    id makes this slower but never changes the result.
+    """
+
+    if ecdsa_batch_verify(signatures, rng):
+        return []
+    elif len(signatures) == 1:
+        return [] if ecdsa_verify(signatures[0]) else [0]
+
+    mid = len(signatures) // 2
+    left = ecdsa_find_invalid(signatures[:mid], rng)
+    right = ecdsa_find_invalid(signatures[mid:], rng)
+
+    return left + [mid + i for i in right]
+
+
+def ecdsa_corpus(count):
+    """Generates valid and invalid ECDSA-SHA384 signatures and batches."""
+
+    entries = []
+
+    def add(name, sig, valid):
+        assert ecdsa_verify(sig) == valid, name
+
+        entries.append((sig, {
+            "id": len(entries) + 1,
+            "name": name,
+            "publicKey": encode_point(sig.q).hex(),
+            "message": sig.message.hex(),
+            "r": "{:096x}".format(sig.r),
+            "s": "{:096x}".format(sig.s),
+            "recoveryId": sig.recovery_id,
+            "valid": valid,
+        }))
+
+    # RFC 6979, A.2.6
+    d = from_hex("""
+        6B9D3DAD2E1B8C1C05B19875B6659F4DE23C3B667BF297BA
+        9AA47740787137D896D5724E4C70A825F872C9EA60D2EDF5
+    """)
+
+    for message, r, s in [
+        (
+            b"sample",
+            """
+                94EDBB92A5ECB8AAD4736E56C691916B3F88140666CE9FA7
+                3D64C4EA95AD133C81A648152E44ACF96E36DD1E80FABE46
+            """,
+            """
+                99EF4AEB15F178CEA1FE40DB2603138F130E740A19624526
+                203B6351D0A3A94FA329C145786E679E7B82C71A38628AC8
+            """,
+        ),
+        (
+            b"test",
+            """
+                8203B63D3C853E8D77227FB377BCF7B7B772E97892A80F36
+                AB775D509D7A5FEB0542A7F0812998DA8F1DD3CA3CF023DB
+            """,
+            """
+                DDD0760448D42D8A43AF45AF836FCE4DE8BE06B485E9B61B
+                827C2F13173923E06A739F040649A667BF3B828246BAA5A5
+            """,
+        ),
+    ]:
+        sig = ecdsa_sign(d, message)
+        assert (sig.r, sig.s) == (from_hex(r), from_hex(s))
+        add(f"RFC 6979: {message.decode()}", sig, True)
+
+    signatures = []
+
+    for i in range(count):
+        d = secp384r1_scalars.random(1)
+        message = random.randbytes(random.randint(0, 512))
+        sig = ecdsa_sign(d, message)
+        signatures.append(sig)
+        add(f"Random {i + 1}", sig, True)
+
+    def replace(sig, **changes):
+        return Signature(**(sig.__dict__ | changes))
+
+    def flip_bit(message):
+        return bytes([message[0] ^ 1]) + message[1:] if message else b"\x00"
+
+    variants = [
+        # -s verifies with -R, which has the other parity
+        ("s negated", True,
+         lambda sig: replace(sig, s=order - sig.s,
+                             recovery_id=sig.recovery_id ^ 1)),
+        ("r + 1", False, lambda sig: replace(sig, r=sig.r + 1)),
+        ("s + 1", False, lambda sig: replace(sig, s=sig.s + 1)),
+        ("r and s swapped", False,
+         lambda sig: replace(sig, r=sig.s, s=sig.r)),
+        ("message modified", False,
+         lambda sig: replace(sig, message=flip_bit(sig.message))),
+        ("wrong public key", False,
+         lambda sig: replace(sig, q=sig.q + secp384r1_g)),
+        ("r = 0", False, lambda sig: replace(sig, r=0)),
+        ("s = 0", False, lambda sig: replace(sig, s=0)),
+        ("r = n", False, lambda sig: replace(sig, r=order)),
+        ("s = n", False, lambda sig: replace(sig, s=order)),
+        ("public key not on the curve", False,
+         lambda sig: replace(sig, q=Point(sig.q.x, sig.q.y + 1, secp384r1))),
+    ]
+
+    for i, (name, valid, make) in enumerate(variants):
+        sig = signatures[i % len(signatures)]
+        add(f"Random {i % len(signatures) + 1}, {name}", make(sig), valid)
+
+    batches = []
+
+    def add_batch(name, ids):
+        sigs = [entries[i - 1][0] for i in ids]
+        invalid = [ids[i] for i in ecdsa_find_invalid(sigs)]
+        assert invalid == [i for i in ids if not entries[i - 1][1]["valid"]]
+
+        batches.append({
+            "id": len(entries) + len(batches) + 1,
+            "name": name,
+            "signatures": ids,
+            "valid": not invalid,
+            "invalid": invalid,
+        })
+
+    valid_ids = [e["id"] for _, e in entries if e["valid"]]
+    invalid_ids = [e["id"] for _, e in entries if not e["valid"]]
+    add_batch("All valid", valid_ids)
+    add_batch("One invalid", valid_ids[:8] + invalid_ids[:1] + valid_ids[8:])
+    add_batch("Everything", [e["id"] for _, e in entries])
+
+    return {
+        "ecdsa-sha384": [e for _, e in entries],
+        "ecdsa-sha384-batch": batches,
+    }
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate the secp384r1 test data.",
+    )
+    parser.add_argument(
+        "--ecdsa",
+        type=int,
+        metavar="COUNT",
+        help="generate a corpus of ECDSA-SHA384 signatures (COUNT random "
+        "valid ones, variants of them, and batches) instead",
+    )
+    args = parser.parse_args()
+
     # for determinism
     random.seed('zxcvbnM1', version=2)
 
+    if args.ecdsa is not None:
+        json.dump(ecdsa_corpus(args.ecdsa), sys.stdout, indent=2)
+        sys.exit(0)
+
     g = secp384r1_g
 
     z = FieldElement.to_field_element(secp384r1_field.random(), secp384r1_field)
@@ -489,8 +898,7 @@ if __name__ == "__main__":
     )
 
     for i in range(64):
-        p = secp384r1.random_point()
-        q = secp384r1.random_point()
+        p, q = secp384r1.random_points(2)
         z1 = secp384r1_field.random(1)
         z2 = secp384r1_field.random(1)
 
@@ -511,8 +919,7 @@ if __name__ == "__main__":
     register_mixed_add_test("3G + 42G", 3 * gj, 42 * g, 45 * gj)
 
     for i in range(64):
-        p = secp384r1.random_point()
-        q = secp384r1.random_point()
+        p, q = secp384r1.random_points(2)
 
         z = secp384r1_field.random(1)
         pj = JacobianPoint(p.x / z**2, p.y / z**3, z, secp384r1)
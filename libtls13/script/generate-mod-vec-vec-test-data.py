@@ -1,10 +1,24 @@
 #!/usr/bin/env python3
 
+import argparse
 import random
+import sys
+
+import vecfile
 
 N = 1024
 MAX_WORDS = 1024
 
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--binary",
+    action="store_true",
+    help="write the binary format described in vecfile.py instead of hex text",
+)
+args = parser.parse_args()
+
+cases = []
+
 for _ in range(N):
     x_words = random.randint(1, MAX_WORDS)
     y_words = random.randint(1, MAX_WORDS)
@@ -23,5 +37,10 @@ for _ in range(N):
         y = 1
 
     remainder = x % y
+    cases.append((x, y, remainder))
 
-    print(f"{x:x} {y:x} {remainder:x}")
+if args.binary:
+    vecfile.write_cases(sys.stdout.buffer, cases)
+else:
+    for x, y, remainder in cases:
+        print(f"{x:x} {y:x} {remainder:x}")
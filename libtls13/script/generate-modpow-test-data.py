@@ -1,15 +1,38 @@
 #!/usr/bin/env python3
 
+import argparse
 import random
+import sys
+
+import vecfile
+
+from arith import mpz, powmod
 
 N = 64
 MAX_WORDS = 256
 MAX_EXPONENT_WORDS = 8
 
+parser = argparse.ArgumentParser()
+parser.add_argument(
+    "--binary",
+    action="store_true",
+    help="write the binary format described in vecfile.py instead of hex text",
+)
+parser.add_argument(
+    "--max-words",
+    type=int,
+    default=MAX_WORDS,
+    help=f"the maximum size of the base and the modulus in 32-bit words "
+    f"(default: {MAX_WORDS})",
+)
+args = parser.parse_args()
+
+cases = []
+
 for _ in range(N):
-    x_words = random.randint(1, MAX_WORDS)
+    x_words = random.randint(1, args.max_words)
     y_words = random.randint(1, MAX_EXPONENT_WORDS)
-    m_words = random.randint(1, MAX_WORDS)
+    m_words = random.randint(1, args.max_words)
     x = 0
     y = 0
     m = 0
@@ -28,5 +51,11 @@ for _ in range(N):
 
     m |= 1
 
-    result = pow(x, y, m)
-    print(f"{x:x} {y:x} {m:x} {result:x}")
+    result = int(powmod(mpz(x), mpz(y), mpz(m)))
+    cases.append((x, y, m, result))
+
+if args.binary:
+    vecfile.write_cases(sys.stdout.buffer, cases)
+else:
+    for x, y, m, result in cases:
+        print(f"{x:x} {y:x} {m:x} {result:x}")
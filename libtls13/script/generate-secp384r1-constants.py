@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Generates src/crypto/secp384r1/constants.lua.
+
+The module holds the fixed-base table used by
+groupJacobianDoubleBaseScalarMulAdd: the odd multiples G, 3G, ..., (2^w - 1)G
+of the base point in affine coordinates, so the Lua code doesn't have to
+compute (and invert) them on every require. The window width w is also written
+out, since getChain needs it to recode the G scalar.
+
+Usage: generate-secp384r1-constants.py [--window W] > constants.lua
+"""
+
+import argparse
+import importlib
+import sys
+
+ec = importlib.import_module("generate-ec-test-data")
+
+limb_width = 30
+limb_count = 13
+
+
+def to_limbs(x):
+    x = int(x)
+
+    return [x >> i * limb_width & (1 << limb_width) - 1
+            for i in range(limb_count)]
+
+
+def format_element(x, indent):
+    limbs = [f"0x{limb:08x}," for limb in to_limbs(x)]
+    lines = [" ".join(limbs[i:i + 5]) for i in range(0, len(limbs), 5)]
+
+    return "".join(f"{indent}{line}\n" for line in lines)
+
+
+def odd_multiples(g, window):
+    g2 = g + g
+    result = [g]
+
+    for _ in range(1, 1 << window - 1):
+        result.append(result[-1] + g2)
+
+    return result
+
+
+def format_module(g, window):
+    out = []
+    out.append("-- Constants used in NIST P-384 algorithms.\n")
+    out.append("--\n")
+    out.append("-- Generated by script/generate-secp384r1-constants.py.\n")
+    out.append("-- Do not edit.\n")
+    out.append("\n")
+    out.append("local lib = {}\n")
+    out.append("\n")
+    out.append("-- The window width used to recode the scalar multiplying G.\n")
+    out.append(f"lib.gWindowWidth = {window}\n")
+    out.append("\n")
+    out.append(f"-- {{G, 3G, 5G, ..., {(1 << window) - 1}G}} "
+               "in affine coordinates (Z = 1).\n")
+    out.append("lib.gWindow = {\n")
+
+    for i, point in enumerate(odd_multiples(g, window)):
+        assert not point.is_zero()
+
+        out.append(f"  {{ -- {2 * i + 1}G\n")
+
+        for coord in (point.x, point.y, 1):
+            out.append("    {\n")
+            out.append(format_element(coord, "      "))
+            out.append("    },\n")
+
+        out.append("  },\n")
+
+    out.append("}\n")
+    out.append("\n")
+    out.append("return lib\n")
+
+    return "".join(out)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate the secp384r1 fixed-base table.",
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=7,
+        help="the window width (the table has 2^(W - 1) points)",
+    )
+    args = parser.parse_args()
+
+    if not 2 <= args.window <= 10:
+        parser.error("the window width must be between 2 and 10")
+
+    sys.stdout.write(format_module(ec.secp384r1_g, args.window))
@@ -1,25 +1,94 @@
 #!/usr/bin/env python3
 
+import argparse
 import hashlib
 import random
-import sys
+import struct
 
-match sys.argv[1] if len(sys.argv) >= 2 else None:
-    case "sha256":
-        algo = hashlib.sha256
+MASK = (1 << 64) - 1
 
-    case "sha384":
-        algo = hashlib.sha384
+# (length, split patterns) of the --stream messages. a split pattern lists the
+# sizes of successive update calls, repeated until the message ends; an empty
+# pattern hashes the message in one call.
+stream_messages = [
+    (0, [[]]),
+    (55, [[], [1]]),
+    (56, [[], [1]]),
+    (63, [[], [1], [62]]),
+    (64, [[], [1], [63], [64]]),
+    (65, [[], [1], [64]]),
+    (111, [[], [1], [110]]),
+    (112, [[], [1], [111]]),
+    (127, [[], [1], [126]]),
+    (128, [[], [1], [127], [128]]),
+    (129, [[], [1], [128]]),
+    (1000, [[], [1, 2, 3, 5, 8, 13], [63, 65], [127, 129]]),
+    # a full TLS record plus a header
+    (16 * 1024 + 5, [[], [5, 16 * 1024], [1000]]),
+    (65536, [[], [4096], [1, 4095]]),
+    (1 << 20, [[], [65536], [16 * 1024 + 5]]),
+    (8 << 20, [[1 << 20]]),
+]
 
-    case "sha512":
-        algo = hashlib.sha512
 
-    case _:
-        print("Usage: ./script/generate-sha-hashes.py {sha256|sha384|sha512}")
-        sys.exit(1)
+def prng_chunks(seed, length, chunk_size=1 << 16):
+    """Yields the first `length` bytes of a SplitMix64 stream in chunks.
 
-sizes = list(range(1, 256)) + [256, 512, 1024, 2048, 4096, 8192]
+    The same generator is implemented in test/test-util.lua (makePrng).
+    """
 
-for size in sizes:
-    data = random.randbytes(size)
-    print(data.hex(), algo(data).hexdigest())
+    state = seed & MASK
+    words_per_chunk = chunk_size // 8
+
+    while length > 0:
+        words = []
+
+        for _ in range(min(words_per_chunk, (length + 7) // 8)):
+            state = state + 0x9e3779b97f4a7c15 & MASK
+            z = state
+            z = (z ^ z >> 30) * 0xbf58476d1ce4e5b9 & MASK
+            z = (z ^ z >> 27) * 0x94d049bb133111eb & MASK
+            words.append(z ^ z >> 31)
+
+        chunk = struct.pack(f"<{len(words)}Q", *words)[:length]
+        length -= len(chunk)
+
+        yield chunk
+
+
+def stream(algo):
+    for seed, (length, splits) in enumerate(stream_messages, 1):
+        hasher = algo()
+
+        for chunk in prng_chunks(seed, length):
+            hasher.update(chunk)
+
+        digest = hasher.hexdigest()
+
+        for split in splits:
+            pattern = ",".join(map(str, split)) or "-"
+            print(seed, length, pattern, digest)
+
+
+parser = argparse.ArgumentParser(
+    usage="./script/generate-sha-hashes.py {sha256|sha384|sha512} [--stream]",
+)
+parser.add_argument("algorithm", choices=["sha256", "sha384", "sha512"])
+parser.add_argument(
+    "--stream",
+    action="store_true",
+    help="emit <seed> <length> <update sizes> <digest> lines for messages "
+    "generated by a seeded PRNG instead of inline hex",
+)
+args = parser.parse_args()
+
+algo = getattr(hashlib, args.algorithm)
+
+if args.stream:
+    stream(algo)
+else:
+    sizes = list(range(1, 256)) + [256, 512, 1024, 2048, 4096, 8192]
+
+    for size in sizes:
+        data = random.randbytes(size)
+        print(data.hex(), algo(data).hexdigest())
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""Profiles a libtls13 operation per function.
+
+The operation runs in a local Lua interpreter under a debug.sethook shim that
+counts calls and measures the time spent in every function (the time spent in
+the hook itself is subtracted). The reporter prints a flat profile and can
+write the call stacks in the collapsed format flamegraph.pl and speedscope
+read.
+
+The operation is either one of the workloads of run-benchmarks.py:
+
+    script/profile-lua.py ecdsa-p384-sha384-verify
+
+or a Lua chunk that returns the function to profile, which works for any
+module in src/crypto:
+
+    script/profile-lua.py --code '
+      local mont = require("tls13.crypto.montgomery")
+      local x, m = mont.fromHex("1234"), mont.fromHex(("f"):rep(512))
+      return function() return mont.modPowOdd(x, x, m) end
+    '
+
+Run it from the libtls13 directory. The numbers are inflated by the hook:
+compare functions with each other rather than with run-benchmarks.py.
+"""
+
+import argparse
+import importlib
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+from dataclasses import dataclass
+
+shim = r"""
+local root, dataDir, iterations, output = ...
+iterations = tonumber(iterations)
+
+package.path = root .. "/?.lua;" .. package.path
+
+local function input(name)
+  local f = assert(io.open(dataDir .. "/" .. name, "rb"))
+  local data = f:read("a")
+  f:close()
+
+  return data
+end
+
+local op = (function()
+%s
+end)()
+
+-- warm up (and load everything lazily loaded) outside the profile.
+op()
+
+local clock = os.clock
+local getinfo = debug.getinfo
+
+local records = {}
+local recordList = {}
+local rootNode = {children = {}, self = 0}
+local stack = {}
+local depth = 0
+-- the time spent in the hook, which is subtracted from the clock.
+local overhead = 0
+
+local function pop(now)
+  local frame = stack[depth]
+  local record = frame.record
+  local elapsed = now - frame.start
+  local self = elapsed - frame.children
+
+  record.self = record.self + self
+  frame.node.self = frame.node.self + self
+  record.active = record.active - 1
+
+  if record.active == 0 then
+    -- only the outermost activation of a recursive function counts.
+    record.total = record.total + elapsed
+  end
+
+  stack[depth] = nil
+  depth = depth - 1
+
+  if depth > 0 then
+    stack[depth].children = stack[depth].children + elapsed
+  end
+end
+
+local function hook(event)
+  local entered = clock()
+  local now = entered - overhead
+
+  if event == "return" then
+    if depth > 0 then
+      pop(now)
+    end
+  else
+    local info = getinfo(2, "fnS")
+    local record = records[info.func]
+
+    if not record then
+      record = {
+        id = #recordList + 1,
+        name = info.name,
+        source = info.short_src,
+        line = info.linedefined,
+        calls = 0,
+        self = 0,
+        total = 0,
+        active = 0,
+      }
+      records[info.func] = record
+      recordList[record.id] = record
+    elseif not record.name then
+      record.name = info.name
+    end
+
+    if event == "tail call" and depth > 0 then
+      -- the caller's frame has been replaced.
+      pop(now)
+    end
+
+    local parentNode = depth > 0 and stack[depth].node or rootNode
+    local node = parentNode.children[record]
+
+    if not node then
+      node = {children = {}, self = 0}
+      parentNode.children[record] = node
+    end
+
+    depth = depth + 1
+    stack[depth] = {record = record, node = node, start = now, children = 0}
+    record.calls = record.calls + 1
+    record.active = record.active + 1
+  end
+
+  overhead = overhead + (clock() - entered)
+end
+
+debug.sethook(hook, "cr")
+
+for _ = 1, iterations, 1 do
+  op()
+end
+
+debug.sethook()
+
+local f = assert(io.open(output, "w"))
+
+for _, record in ipairs(recordList) do
+  f:write(("F %%d %%d %%.9f %%.9f %%s:%%d %%s\n"):format(
+    record.id, record.calls, record.self, record.total,
+    record.source, record.line, record.name or "?"
+  ))
+end
+
+local function dumpNode(node, path)
+  for record, child in pairs(node.children) do
+    local childPath = path and path .. ";" .. record.id or tostring(record.id)
+
+    if child.self > 0 then
+      f:write(("S %%.9f %%s\n"):format(child.self, childPath))
+    end
+
+    dumpNode(child, childPath)
+  end
+end
+
+dumpNode(rootNode, nil)
+f:close()
+"""
+
+
+@dataclass
+class Function:
+    name: str
+    location: str
+    calls: int
+    self_time: float
+    total_time: float
+
+    @property
+    def label(self):
+        return f"{self.name} ({self.location})"
+
+    @property
+    def frame(self):
+        # no spaces or semicolons: collapsed stacks use them as separators
+        location = os.path.basename(self.location.split(":")[0])
+        line = self.location.rsplit(":", 1)[-1]
+
+        return f"{self.name}@{location}:{line}".replace(" ", "_")
+
+
+def run(setup, inputs, args, root):
+    with tempfile.TemporaryDirectory(prefix="libtls13-profile-") as data_dir:
+        for name, data in inputs.items():
+            with open(os.path.join(data_dir, name), "wb") as f:
+                f.write(data)
+
+        script = os.path.join(data_dir, "profile.lua")
+        output = os.path.join(data_dir, "profile.txt")
+
+        with open(script, "w") as f:
+            f.write(shim % setup)
+
+        proc = subprocess.run(
+            [args.lua, script, root, data_dir, str(args.iterations), output],
+            capture_output=True,
+            text=True,
+        )
+
+        if proc.returncode != 0:
+            raise RuntimeError(f"the profiled operation failed:\n"
+                               f"{proc.stderr}")
+
+        with open(output) as f:
+            return parse(f)
+
+
+def parse(lines):
+    functions = {}
+    stacks = []
+
+    for line in lines:
+        match line.split(" ", 1):
+            case ["F", rest]:
+                fid, calls, self_time, total, location, name = \
+                    rest.rstrip("\n").split(" ", 5)
+                functions[fid] = Function(
+                    name=name,
+                    location=location,
+                    calls=int(calls),
+                    self_time=float(self_time),
+                    total_time=float(total),
+                )
+
+            case ["S", rest]:
+                self_time, path = rest.split()
+                stacks.append((path.split(";"), float(self_time)))
+
+    return functions, stacks
+
+
+def print_flat(functions, limit):
+    total = sum(f.self_time for f in functions.values()) or 1
+    ranked = sorted(functions.values(), key=lambda f: f.self_time,
+                    reverse=True)
+
+    print(f"{'self %':>7} {'self ms':>10} {'total ms':>10} {'calls':>10} "
+          f"{'us/call':>9}  function")
+
+    for f in ranked[:limit]:
+        print(f"{100 * f.self_time / total:>6.2f}% "
+              f"{1000 * f.self_time:>10.2f} {1000 * f.total_time:>10.2f} "
+              f"{f.calls:>10} {1e6 * f.total_time / f.calls:>9.2f}  "
+              f"{f.label}")
+
+
+def write_collapsed(path, functions, stacks):
+    with open(path, "w") as out:
+        for frames, self_time in stacks:
+            # flamegraph.pl wants integer sample counts: use microseconds
+            samples = round(self_time * 1e6)
+
+            if samples:
+                names = ";".join(functions[fid].frame for fid in frames)
+                print(f"{names} {samples}", file=out)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Profile a libtls13 operation per function.",
+    )
+    parser.add_argument(
+        "benchmark",
+        nargs="?",
+        help="the run-benchmarks.py workload to profile",
+    )
+    parser.add_argument(
+        "--code",
+        help="a Lua chunk that returns the function to profile",
+    )
+    parser.add_argument("--lua", default="lua5.3", help="the Lua interpreter")
+    parser.add_argument(
+        "-n", "--iterations",
+        type=int,
+        default=1,
+        help="how many times to run the operation",
+    )
+    parser.add_argument("--seed", default="zxcvbnM1")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=30,
+        help="the number of functions in the flat profile",
+    )
+    parser.add_argument(
+        "-o", "--collapsed",
+        metavar="PATH",
+        help="write the collapsed stacks (in microseconds) to PATH",
+    )
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join("tls13", "init.lua")):
+        parser.error("run this from the libtls13 directory")
+
+    if args.code:
+        setup, inputs = args.code, {}
+    elif args.benchmark:
+        # imported here: it needs cryptography, which --code doesn't.
+        benchmarks = importlib.import_module("run-benchmarks")
+        by_name = {b.name: b for b in benchmarks.benchmarks}
+
+        if args.benchmark not in by_name:
+            parser.error(f"unknown benchmark: {args.benchmark} "
+                         "(see run-benchmarks.py --list)")
+
+        benchmark = by_name[args.benchmark]
+        # the setup returns the operation and its expected result; the
+        # profile only needs the former.
+        setup = benchmark.setup
+        inputs = benchmark.inputs(
+            random.Random(f"{args.seed}/{benchmark.name}"),
+        )
+    else:
+        parser.error("either a benchmark or --code is required")
+
+    functions, stacks = run(setup, inputs, args, os.getcwd())
+    print_flat(functions, args.limit)
+
+    if args.collapsed:
+        write_collapsed(args.collapsed, functions, stacks)
+        print(f"\ncollapsed stacks written to {args.collapsed}",
+              file=sys.stderr)
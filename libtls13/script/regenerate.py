@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""Regenerates the test data and the other outputs of the scripts here.
+
+Every target knows the script that produces it, its arguments, the seed, the
+local modules the script imports, and the files it writes. A target is up to
+date if the hash of all of these (the sources included) matches the one
+recorded in the cache and its outputs are still the files that were written
+then. Stale targets are regenerated in parallel.
+
+Scripts that don't seed their PRNG themselves are run with random seeded from
+the target's seed, so the outputs are reproducible.
+
+verify-ecdsa-mul.py is run with --cache, so even when its source changes, the
+z3 queries are only repeated for models that haven't been checked before. Its
+report is kept in the cache directory. So is the summary of
+build-wycheproof-fixtures.py, whose sources are in the wycheproof submodule
+and aren't tracked here: use --force after updating it.
+
+Usage:
+    script/regenerate.py              # everything that's stale
+    script/regenerate.py ec sha256    # only these targets
+    script/regenerate.py --force ec   # even if up to date
+    script/regenerate.py --list
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+root = os.path.dirname(script_dir)
+cache_dir = os.path.join(script_dir, ".cache")
+stamp_path = os.path.join(cache_dir, "regenerate.json")
+z3_cache_path = os.path.join(cache_dir, "z3-verdicts.json")
+
+DEFAULT_SEED = "zxcvbnM1"
+
+# runs a script as __main__ after seeding the global PRNG.
+runner = """
+import random, runpy, sys
+random.seed(sys.argv[1], version=2)
+sys.path.insert(0, sys.argv[2])
+sys.argv = sys.argv[3:]
+runpy.run_path(sys.argv[0], run_name="__main__")
+"""
+
+
+@dataclass
+class Target:
+    name: str
+    script: str
+    # the file stdout goes to, relative to the libtls13 directory
+    output: str
+    args: list = field(default_factory=list)
+    # other files the output depends on (local modules the script imports,
+    # inputs), relative to the script directory
+    deps: list = field(default_factory=list)
+    seed: str = DEFAULT_SEED
+
+    @property
+    def output_path(self):
+        return os.path.join(root, self.output)
+
+
+targets = [
+    Target("ec", "generate-ec-test-data.py", "test/data/ec.json",
+           deps=["arith.py"]),
+    Target(
+        "ecdsa-p384",
+        "generate-ec-test-data.py",
+        "test/data/ecdsa-p384.json",
+        args=["--ecdsa", "16"],
+        deps=["arith.py"],
+    ),
+    Target(
+        "ca-bundle-store",
+        "build-trust-store.py",
+        "test/data/ca-bundle.store",
+        args=["test/data/ca-bundle.pem"],
+        deps=["../test/data/ca-bundle.pem"],
+    ),
+    Target(
+        "secp384r1-constants",
+        "generate-secp384r1-constants.py",
+        "src/crypto/secp384r1/constants.lua",
+        deps=["generate-ec-test-data.py", "arith.py"],
+    ),
+    Target(
+        "div64by32",
+        "generate-div64by32-test-data.py",
+        "test/data/div64by32.txt",
+    ),
+    Target(
+        "modpow",
+        "generate-modpow-test-data.py",
+        "test/data/modpow.txt",
+        deps=["vecfile.py", "arith.py"],
+    ),
+    Target(
+        "mod-vec-vec",
+        "generate-mod-vec-vec-test-data.py",
+        "test/data/mod-vec-vec.txt",
+        deps=["vecfile.py"],
+    ),
+    *(
+        Target(f"sha{bits}", "generate-sha-hashes.py",
+               f"test/data/sha{bits}.txt", args=[f"sha{bits}"])
+        for bits in (256, 384, 512)
+    ),
+    *(
+        Target(f"sha{bits}-stream", "generate-sha-hashes.py",
+               f"test/data/sha{bits}-stream.txt",
+               args=[f"sha{bits}", "--stream"])
+        for bits in (256, 384, 512)
+    ),
+    Target(
+        "wycheproof-fixtures",
+        "build-wycheproof-fixtures.py",
+        "script/.cache/wycheproof-fixtures.txt",
+    ),
+    Target(
+        "verify-ecdsa-mul",
+        "verify-ecdsa-mul.py",
+        "script/.cache/verify-ecdsa-mul.txt",
+        args=["--routine", "all", "--cache", z3_cache_path],
+    ),
+]
+
+
+def hash_file(path):
+    h = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 16):
+            h.update(chunk)
+
+    return h.hexdigest()
+
+
+def target_key(target):
+    h = hashlib.sha256()
+    h.update(json.dumps([target.script, target.args, target.seed]).encode())
+
+    for source in [target.script, *target.deps]:
+        h.update(hash_file(os.path.join(script_dir, source)).encode())
+
+    return h.hexdigest()
+
+
+def load_stamps():
+    try:
+        with open(stamp_path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_stamps(stamps):
+    tmp = stamp_path + ".tmp"
+
+    with open(tmp, "w") as f:
+        json.dump(stamps, f, indent=2, sort_keys=True)
+
+    os.replace(tmp, stamp_path)
+
+
+def is_up_to_date(target, stamp):
+    if not stamp or stamp["key"] != target_key(target):
+        return False
+
+    # the output may have been edited or regenerated by hand since.
+    return (os.path.exists(target.output_path)
+            and hash_file(target.output_path) == stamp["output"])
+
+
+def regenerate(target):
+    tmp = f"{target.output_path}.tmp"
+    os.makedirs(os.path.dirname(tmp), exist_ok=True)
+    start = time.monotonic()
+
+    with open(tmp, "wb") as out:
+        proc = subprocess.run(
+            [
+                sys.executable, "-c", runner, target.seed, script_dir,
+                os.path.join(script_dir, target.script), *target.args,
+            ],
+            cwd=root,
+            stdout=out,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+
+    if proc.returncode != 0:
+        # keep what it printed: for verify-ecdsa-mul.py, that's the report.
+        failed_path = f"{target.output_path}.failed"
+        os.replace(tmp, failed_path)
+
+        raise RuntimeError(f"{target.script} exited with code "
+                           f"{proc.returncode} (output in {failed_path}):\n"
+                           f"{proc.stderr}")
+
+    os.replace(tmp, target.output_path)
+
+    return time.monotonic() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "targets",
+        nargs="*",
+        help="the targets to consider (default: all)",
+    )
+    parser.add_argument(
+        "-f", "--force",
+        action="store_true",
+        help="regenerate even if up to date",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="the number of generators to run at once",
+    )
+    parser.add_argument(
+        "-n", "--dry-run",
+        action="store_true",
+        help="only print which targets are stale",
+    )
+    parser.add_argument("--list", action="store_true")
+    args = parser.parse_args()
+
+    by_name = {target.name: target for target in targets}
+
+    if args.list:
+        for target in targets:
+            print(f"{target.name}: {target.output} "
+                  f"({' '.join([target.script, *target.args])})")
+
+        sys.exit(0)
+
+    for name in args.targets:
+        if name not in by_name:
+            parser.error(f"unknown target: {name} (see --list)")
+
+    selected = [by_name[name] for name in args.targets] or targets
+    os.makedirs(cache_dir, exist_ok=True)
+    stamps = load_stamps()
+
+    stale = [target for target in selected
+             if args.force or not is_up_to_date(target, stamps.get(target.name))]
+
+    for target in selected:
+        if target not in stale:
+            print(f"up to date: {target.name}")
+
+    if args.dry_run:
+        for target in stale:
+            print(f"stale: {target.name}")
+
+        sys.exit(0)
+
+    failed = []
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+        futures = {executor.submit(regenerate, target): target
+                   for target in stale}
+
+        for future in as_completed(futures):
+            target = futures[future]
+
+            try:
+                elapsed = future.result()
+            except RuntimeError as e:
+                print(f"failed: {target.name}: {e}", file=sys.stderr)
+                failed.append(target.name)
+
+                continue
+
+            stamps[target.name] = {
+                "key": target_key(target),
+                "output": hash_file(target.output_path),
+            }
+            save_stamps(stamps)
+            print(f"regenerated: {target.name} ({elapsed:.2f} s)")
+
+    sys.exit(1 if failed else 0)
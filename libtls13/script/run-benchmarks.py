@@ -0,0 +1,681 @@
+#!/usr/bin/env python3
+"""Benchmarks the libtls13 crypto primitives under a local Lua interpreter.
+
+Each benchmark runs in its own Lua process. The inputs (messages, records,
+keys and signatures) are generated here with the cryptography package and
+passed to Lua as files; the result of the first call is checked against the
+expected one before timing starts.
+
+For every benchmark the runner records ops/sec, bytes/sec (where it makes
+sense) and the Lua heap size from collectgarbage("count"): before the run,
+its peak during the run, and what remains after a full collection. Results
+are appended to a JSON history file and compared with the previous run.
+
+Usage: run it from the libtls13 directory (the tls13 symlink must resolve).
+
+    script/run-benchmarks.py                  # everything
+    script/run-benchmarks.py sha rsa          # names containing sha or rsa
+    script/run-benchmarks.py --list
+
+--corpus DIR adds a benchmark for each modpow and mod-vec-vec file of a
+generate-bigint-corpus.py --all directory (text or binary).
+"""
+
+import argparse
+import datetime
+import io
+import json
+import os
+import random
+import struct
+import subprocess
+import sys
+import tempfile
+
+from dataclasses import dataclass, field
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, padding
+from cryptography.hazmat.primitives.asymmetric import rsa, x25519
+from cryptography.hazmat.primitives.asymmetric.utils import (
+    decode_dss_signature,
+)
+from cryptography.hazmat.primitives.ciphers.aead import (
+    AESGCM,
+    ChaCha20Poly1305,
+)
+
+import vecfile
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+cache_dir = os.path.join(script_dir, ".cache")
+
+KiB = 1024
+MiB = 1024 * KiB
+
+# the largest TLS record
+RECORD_SIZE = 16 * KiB
+
+driver = r"""
+local root, dataDir, minTime, minIterations = ...
+minTime = tonumber(minTime)
+minIterations = tonumber(minIterations)
+
+package.path = root .. "/?.lua;" .. package.path
+
+local function input(name)
+  local f = assert(io.open(dataDir .. "/" .. name, "rb"))
+  local data = f:read("a")
+  f:close()
+
+  return data
+end
+
+local op, expected = (function()
+%s
+end)()
+
+assert(op() == expected, "the benchmark produced a wrong result")
+
+collectgarbage("collect")
+local baseKb = collectgarbage("count")
+local peakKb = baseKb
+local iterations = 0
+local start = os.clock()
+
+repeat
+  op()
+  iterations = iterations + 1
+  peakKb = math.max(peakKb, collectgarbage("count"))
+until iterations >= minIterations and os.clock() - start >= minTime
+
+local elapsed = os.clock() - start
+collectgarbage("collect")
+
+print(("RESULT %%d %%.17g %%.17g %%.17g %%.17g"):format(
+  iterations, elapsed, baseKb, peakKb, collectgarbage("count")
+))
+"""
+
+
+@dataclass
+class Benchmark:
+    name: str
+    # generates the input files: rng -> {file name: bytes}
+    inputs: object
+    # a Lua chunk that returns the operation and its expected result
+    setup: str
+    # the number of bytes processed by an operation, if applicable
+    size: int = 0
+    tags: list = field(default_factory=list)
+
+
+def random_bytes(rng, n):
+    return rng.getrandbits(8 * n).to_bytes(n, "little") if n else b""
+
+
+def sha2_inputs(algorithm, size):
+    def inputs(rng):
+        message = random_bytes(rng, size)
+        digest = hashes.Hash(algorithm())
+        digest.update(message)
+
+        return {"message": message, "expected": digest.finalize()}
+
+    return inputs
+
+
+def sha2_benchmark(bits, size):
+    algorithm = {256: hashes.SHA256, 384: hashes.SHA384, 512: hashes.SHA512}
+
+    return Benchmark(
+        name=f"sha{bits}-{size // KiB}KiB",
+        inputs=sha2_inputs(algorithm[bits], size),
+        setup=f"""
+  local sha2 = require("tls13.crypto.hash.sha2")
+  local message = input("message")
+
+  return function()
+    return sha2.sha{bits}():update(message):finish()
+  end, input("expected")
+""",
+        size=size,
+        tags=["hash"],
+    )
+
+
+def aead_inputs(make_cipher, key_size, size):
+    def inputs(rng):
+        key = random_bytes(rng, key_size)
+        iv = random_bytes(rng, 12)
+        aad = random_bytes(rng, 13)
+        plaintext = random_bytes(rng, size)
+        ciphertext = make_cipher(key).encrypt(iv, plaintext, aad)
+
+        return {
+            "key": key,
+            "iv": iv,
+            "aad": aad,
+            "plaintext": plaintext,
+            "ciphertext": ciphertext,
+        }
+
+    return inputs
+
+
+def aead_benchmark(name, factory, make_cipher, key_size, size=RECORD_SIZE):
+    return Benchmark(
+        name=f"{name}-decrypt-{size // KiB}KiB",
+        inputs=aead_inputs(make_cipher, key_size, size),
+        setup=f"""
+  {factory}
+  local aead = factory(input("key"))
+  local ciphertext, iv, aad = input("ciphertext"), input("iv"), input("aad")
+
+  return function()
+    return aead:decrypt(ciphertext, iv, aad)
+  end, input("plaintext")
+""",
+        size=size,
+        tags=["aead"],
+    )
+
+
+def ecdsa_p384_inputs(rng):
+    key = ec.derive_private_key(rng.randrange(1, 2**383), ec.SECP384R1())
+    message = random_bytes(rng, 256)
+    r, s = decode_dss_signature(key.sign(message, ec.ECDSA(hashes.SHA384())))
+    point = key.public_key().public_bytes(
+        serialization.Encoding.X962,
+        serialization.PublicFormat.UncompressedPoint,
+    )
+
+    return {
+        "message": message,
+        "r": r.to_bytes(48, "big"),
+        "s": s.to_bytes(48, "big"),
+        "q": point,
+    }
+
+
+def ecdsa_p384_corpus_inputs(rng):
+    # the signature corpus of generate-ec-test-data.py --ecdsa, valid and
+    # invalid, so the order doesn't depend on rng
+    with open(os.path.join("test", "data", "ecdsa-p384.json")) as f:
+        corpus = json.load(f)["ecdsa-sha384"]
+
+    packed = b"".join(
+        struct.pack(">I", len(data)) + data
+        for spec in corpus
+        for data in (
+            bytes.fromhex(spec["message"]),
+            bytes.fromhex(spec["r"]),
+            bytes.fromhex(spec["s"]),
+            bytes.fromhex(spec["publicKey"]),
+        )
+    )
+
+    return {
+        "corpus": packed,
+        "valid": str(sum(spec["valid"] for spec in corpus)).encode(),
+    }
+
+
+def ed25519_inputs(rng):
+    key = ed25519.Ed25519PrivateKey.from_private_bytes(random_bytes(rng, 32))
+    message = random_bytes(rng, 256)
+
+    return {
+        "message": message,
+        "signature": key.sign(message),
+        "public": key.public_key().public_bytes_raw(),
+    }
+
+
+def x25519_inputs(rng):
+    private = random_bytes(rng, 32)
+    other = x25519.X25519PrivateKey.from_private_bytes(random_bytes(rng, 32))
+    key = x25519.X25519PrivateKey.from_private_bytes(private)
+
+    return {
+        "private": private,
+        "public": key.public_key().public_bytes_raw(),
+        "other": other.public_key().public_bytes_raw(),
+        "expected": key.exchange(other.public_key()),
+    }
+
+
+def rsa_pss_inputs(bits):
+    def inputs(rng):
+        # key generation can't be seeded, so the key differs between runs;
+        # the cost of a verification only depends on the modulus size.
+        key = rsa.generate_private_key(public_exponent=65537, key_size=bits)
+        numbers = key.public_key().public_numbers()
+        message = random_bytes(rng, 256)
+        signature = key.sign(
+            message,
+            padding.PSS(padding.MGF1(hashes.SHA256()), 32),
+            hashes.SHA256(),
+        )
+
+        return {
+            "message": message,
+            "signature": signature,
+            "modulus": numbers.n.to_bytes(bits // 8, "big"),
+            "exponent": numbers.e.to_bytes(3, "big"),
+        }
+
+    return inputs
+
+
+def rsa_pss_benchmark(bits):
+    return Benchmark(
+        name=f"rsa-pss-{bits}-verify",
+        inputs=rsa_pss_inputs(bits),
+        setup="""
+  local rsa = require("tls13.crypto.rsa")
+  local sha2 = require("tls13.crypto.hash.sha2")
+  local pss = rsa.rsassaPss(sha2.sha256, rsa.mgf1(sha2.sha256), 32)
+  local pubKey =
+    rsa.makePublicKeyFromBytes(input("modulus"), input("exponent"))
+  local message, signature = input("message"), input("signature")
+
+  return function()
+    return pss:verify(pubKey, message, signature)
+  end, true
+""",
+        tags=["signature"],
+    )
+
+
+benchmarks = [
+    *(sha2_benchmark(bits, MiB) for bits in (256, 384, 512)),
+    aead_benchmark(
+        "aes128-gcm",
+        """local aes = require("tls13.crypto.cipher.aes")
+  local gcm = require("tls13.crypto.cipher.mode.gcm")
+  local factory = gcm.gcm(aes.aes128, true)""",
+        AESGCM,
+        16,
+    ),
+    aead_benchmark(
+        "aes256-gcm",
+        """local aes = require("tls13.crypto.cipher.aes")
+  local gcm = require("tls13.crypto.cipher.mode.gcm")
+  local factory = gcm.gcm(aes.aes256, true)""",
+        AESGCM,
+        32,
+    ),
+    aead_benchmark(
+        "chacha20-poly1305",
+        """local chacha = require("tls13.crypto.cipher.chacha20-poly1305")
+  local factory = chacha.chacha20Poly1305""",
+        ChaCha20Poly1305,
+        32,
+    ),
+    Benchmark(
+        name="ecdsa-p384-sha384-verify",
+        inputs=ecdsa_p384_inputs,
+        setup="""
+  local secp384r1 = require("tls13.crypto.secp384r1")
+  local message, r, s, q = input("message"), input("r"), input("s"), input("q")
+
+  return function()
+    return secp384r1.ecdsaVerifySha384(message, r, s, q)
+  end, true
+""",
+        tags=["signature"],
+    ),
+    Benchmark(
+        name="ecdsa-p384-sha384-verify-corpus",
+        inputs=ecdsa_p384_corpus_inputs,
+        setup="""
+  local secp384r1 = require("tls13.crypto.secp384r1")
+  local corpus = input("corpus")
+  local signatures = {}
+  local pos = 1
+
+  while pos <= #corpus do
+    local message, r, s, q
+    message, r, s, q, pos = (">s4s4s4s4"):unpack(corpus, pos)
+    signatures[#signatures + 1] = {message, r, s, q}
+  end
+
+  -- the number of accepted signatures
+  return function()
+    local accepted = 0
+
+    for _, sig in ipairs(signatures) do
+      if secp384r1.ecdsaVerifySha384(sig[1], sig[2], sig[3], sig[4]) then
+        accepted = accepted + 1
+      end
+    end
+
+    return accepted
+  end, tonumber(input("valid"))
+""",
+        tags=["signature"],
+    ),
+    Benchmark(
+        name="ed25519-verify",
+        inputs=ed25519_inputs,
+        setup="""
+  local curve25519 = require("tls13.crypto.curve25519")
+  local message, signature = input("message"), input("signature")
+  local public = input("public")
+
+  return function()
+    return curve25519.verifyEd25519(public, message, signature)
+  end, true
+""",
+        tags=["signature"],
+    ),
+    Benchmark(
+        name="x25519-shared-secret",
+        inputs=x25519_inputs,
+        setup="""
+  local curve25519 = require("tls13.crypto.curve25519")
+  local selfKeys = {private = input("private"), public = input("public")}
+  local otherKeys = {public = input("other")}
+
+  return function()
+    return curve25519.deriveSharedSecret(selfKeys, otherKeys)
+  end, input("expected")
+""",
+        tags=["key-exchange"],
+    ),
+    *(rsa_pss_benchmark(bits) for bits in (2048, 3072, 4096)),
+]
+
+
+# the functions of tls13.crypto.montgomery the big-integer corpus kinds
+# exercise, called with every operand of a case but the last (the result).
+corpus_functions = {
+    "modpow": "montgomery.modPowOdd",
+    "mod-vec-vec": "montgomery.__internal.modVecVec",
+}
+
+
+def corpus_inputs(path):
+    def inputs(rng):
+        # the cases are fixed: generate-bigint-corpus.py has seeded them.
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if not path.endswith(".bin"):
+            cases = [tuple(int(x, 16) for x in line.split())
+                     for line in data.decode().splitlines() if line]
+            out = io.BytesIO()
+            vecfile.write_cases(out, cases)
+            data = out.getvalue()
+
+        return {"corpus": data}
+
+    return inputs
+
+
+def corpus_benchmarks(corpus_dir):
+    """
+    Makes a benchmark of every file generate-bigint-corpus.py --all wrote to
+    corpus_dir, for the kinds in corpus_functions.
+    """
+
+    result = []
+
+    for name in sorted(os.listdir(corpus_dir)):
+        stem, ext = os.path.splitext(name)
+        kind = next((k for k in corpus_functions if stem.startswith(k + "-")),
+                    None)
+
+        if kind is None or ext not in (".txt", ".bin"):
+            continue
+
+        result.append(Benchmark(
+            name=f"corpus-{stem}",
+            inputs=corpus_inputs(os.path.join(corpus_dir, name)),
+            setup=f"""
+  local montgomery = require("tls13.crypto.montgomery")
+  local op = {corpus_functions[kind]}
+  local corpus = input("corpus")
+  -- see script/vecfile.py. the cases are read in order: skip the index.
+  local count, operandCount, pos = ("<I4I4"):unpack(corpus, 5)
+  pos = pos + 4 * count
+  local cases, expected = {{}}, {{}}
+
+  for i = 1, count, 1 do
+    local case = {{}}
+
+    for j = 1, operandCount, 1 do
+      local wordCount
+      wordCount, pos = ("<I4"):unpack(corpus, pos)
+      local words = {{("<" .. ("I4"):rep(wordCount)):unpack(corpus, pos)}}
+      pos = table.remove(words)
+      case[j] = words
+    end
+
+    cases[i] = case
+    expected[i] = montgomery.toHex(case[operandCount])
+  end
+
+  -- the number of correct results
+  return function()
+    local correct = 0
+
+    for i, case in ipairs(cases) do
+      local result = op(table.unpack(case, 1, operandCount - 1))
+
+      if montgomery.toHex(result) == expected[i] then
+        correct = correct + 1
+      end
+    end
+
+    return correct
+  end, count
+""",
+            tags=["bigint"],
+        ))
+
+    return result
+
+
+def run_benchmark(benchmark, args, root):
+    rng = random.Random(f"{args.seed}/{benchmark.name}")
+
+    with tempfile.TemporaryDirectory(prefix="libtls13-bench-") as data_dir:
+        for name, data in benchmark.inputs(rng).items():
+            with open(os.path.join(data_dir, name), "wb") as f:
+                f.write(data)
+
+        script = os.path.join(data_dir, "driver.lua")
+
+        with open(script, "w") as f:
+            f.write(driver % benchmark.setup)
+
+        proc = subprocess.run(
+            [args.lua, script, root, data_dir,
+             str(args.min_time), str(args.min_iterations)],
+            capture_output=True,
+            text=True,
+        )
+
+    if proc.returncode != 0:
+        raise RuntimeError(f"{benchmark.name} failed:\n{proc.stderr}")
+
+    line = next(line for line in proc.stdout.splitlines()
+                if line.startswith("RESULT "))
+    iterations, elapsed, base_kb, peak_kb, retained_kb = \
+        map(float, line.split()[1:])
+    ops = iterations / elapsed
+
+    return {
+        "iterations": int(iterations),
+        "seconds": elapsed,
+        "ops_per_sec": ops,
+        "bytes_per_sec": ops * benchmark.size if benchmark.size else None,
+        "memory_kb": {
+            "base": base_kb,
+            "peak": peak_kb,
+            "retained": retained_kb,
+        },
+    }
+
+
+def lua_version(lua):
+    proc = subprocess.run([lua, "-v"], capture_output=True, text=True)
+
+    return (proc.stdout or proc.stderr).strip()
+
+
+def git_commit(root):
+    proc = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=root,
+        capture_output=True,
+        text=True,
+    )
+
+    return proc.stdout.strip() or None
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return {"runs": []}
+
+    with open(path) as f:
+        return json.load(f)
+
+
+def format_rate(x, unit):
+    for prefix in ("", "K", "M", "G"):
+        if abs(x) < 1000:
+            return f"{x:.2f} {prefix}{unit}"
+
+        x /= 1000
+
+    return f"{x:.2f} T{unit}"
+
+
+def report(run, previous):
+    print(f"{'benchmark':<32} {'ops/s':>12} {'ms/op':>10} {'throughput':>14} "
+          f"{'peak KiB':>10} {'change':>8}")
+
+    for name, result in run["results"].items():
+        ops = result["ops_per_sec"]
+        throughput = (format_rate(result["bytes_per_sec"], "B/s")
+                      if result["bytes_per_sec"] else "-")
+        change = "-"
+
+        if previous and name in previous["results"]:
+            before = previous["results"][name]["ops_per_sec"]
+            change = f"{(ops - before) / before:+.1%}"
+
+        print(f"{name:<32} {ops:>12.2f} {1000 / ops:>10.2f} {throughput:>14} "
+              f"{result['memory_kb']['peak']:>10.0f} {change:>8}")
+
+    if previous:
+        print(f"\n(change is relative to the run from {previous['timestamp']}"
+              f", commit {previous.get('commit')})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark the libtls13 crypto primitives.",
+    )
+    parser.add_argument(
+        "filters",
+        nargs="*",
+        help="run only the benchmarks whose names contain one of these",
+    )
+    parser.add_argument("--lua", default="lua5.3", help="the Lua interpreter")
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=2.0,
+        help="the minimum CPU time per benchmark, in seconds",
+    )
+    parser.add_argument("--min-iterations", type=int, default=3)
+    parser.add_argument("--seed", default="zxcvbnM1")
+    parser.add_argument(
+        "--history",
+        default=os.path.join(cache_dir, "benchmark-history.json"),
+        help="the JSON file the results are appended to (default: "
+             "script/.cache/benchmark-history.json)",
+    )
+    parser.add_argument(
+        "--no-save",
+        action="store_true",
+        help="don't append the results to the history file",
+    )
+    parser.add_argument(
+        "--compare",
+        type=int,
+        default=-1,
+        metavar="INDEX",
+        help="the history entry to compare against (default: the last one)",
+    )
+    parser.add_argument(
+        "--corpus",
+        metavar="DIR",
+        help="also benchmark modPowOdd and modVecVec on the modpow-* and "
+             "mod-vec-vec-* files generate-bigint-corpus.py --all wrote to "
+             "DIR",
+    )
+    parser.add_argument("--list", action="store_true")
+    args = parser.parse_args()
+
+    if args.corpus:
+        if not os.path.isdir(args.corpus):
+            parser.error(f"{args.corpus} is not a directory")
+
+        benchmarks += corpus_benchmarks(args.corpus)
+
+    if args.list:
+        for benchmark in benchmarks:
+            print(benchmark.name)
+
+        sys.exit(0)
+
+    root = os.getcwd()
+
+    if not os.path.exists(os.path.join(root, "tls13", "init.lua")):
+        parser.error("run this from the libtls13 directory")
+
+    selected = [b for b in benchmarks
+                if not args.filters or any(f in b.name for f in args.filters)]
+
+    if not selected:
+        parser.error("no benchmarks match the filters")
+
+    run = {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(root),
+        "lua": lua_version(args.lua),
+        "min_time": args.min_time,
+        "results": {},
+    }
+
+    for benchmark in selected:
+        print(f"running {benchmark.name}...", file=sys.stderr)
+        run["results"][benchmark.name] = run_benchmark(benchmark, args, root)
+
+    history = load_history(args.history)
+    previous = None
+
+    if history["runs"]:
+        try:
+            previous = history["runs"][args.compare]
+        except IndexError:
+            parser.error(f"there are only {len(history['runs'])} runs "
+                         "in the history")
+
+    report(run, previous)
+
+    if not args.no_save:
+        history["runs"].append(run)
+
+        if os.path.dirname(args.history):
+            os.makedirs(os.path.dirname(args.history), exist_ok=True)
+
+        with open(args.history, "w") as f:
+            json.dump(history, f, indent=2)
+            f.write("\n")
@@ -0,0 +1,47 @@
+import glob
+import importlib.util
+import os
+
+import pytest
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+root = os.path.dirname(script_dir)
+
+spec = importlib.util.spec_from_file_location(
+    "evaluate_chain", os.path.join(script_dir, "evaluate-chain.py")
+)
+evaluate_chain = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(evaluate_chain)
+
+lua_sources = sorted(
+    glob.glob(os.path.join(root, "src", "**", "*.lua"), recursive=True)
+)
+
+
+@pytest.mark.parametrize(
+    "path", lua_sources, ids=lambda path: os.path.relpath(path, root)
+)
+def test_tokenize_sources(path):
+    with open(path) as f:
+        evaluate_chain.tokenize(f.read())
+
+
+def test_tokenize_z_escape():
+    tokens = evaluate_chain.tokenize('x = "a\\z\n    b" .. \'c\\z  \'\ny')
+
+    assert tokens == [
+        ("ident", "x", 1),
+        ("punct", "=", 1),
+        ("string", "a\\z\n    b", 1),
+        ("punct", "..", 2),
+        ("string", "c\\z  ", 2),
+        ("ident", "y", 3),
+    ]
+
+
+def test_empty_chain():
+    assert evaluate_chain.peak_live([]) == 0
+
+    cost = evaluate_chain.chain_cost([])
+    assert (cost.muls, cost.sqs, cost.temporaries) == (0, 0, 0)
+    assert cost.live_temporaries == 0
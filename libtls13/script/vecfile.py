@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""A compact binary format for big-integer test vectors.
+
+A file holds N cases of K operands each. All integers are little-endian.
+
+    header:  b"VEC1", N (uint32), K (uint32)
+    index:   N uint32 offsets, each pointing to the start of a case
+    case:    K operands
+    operand: word count (uint32), then that many uint32 words, least
+             significant first, with no leading zero words (zero is a single
+             zero word)
+
+The word order matches the arrays used by tls13.crypto.montgomery, so the Lua
+side can string.unpack an operand as is. The index lets a reader seek straight
+to case i, which is what sharded test runs do.
+
+When run as a script, converts the hex text format (one case per line,
+operands separated by spaces) to the binary one:
+
+    vecfile.py test/data/modpow.txt > test/data/modpow.bin
+"""
+
+import struct
+import sys
+
+MAGIC = b"VEC1"
+HEADER = struct.Struct("<4sII")
+WORD = struct.Struct("<I")
+
+
+def to_words(x):
+    assert x >= 0
+
+    words = []
+
+    while x:
+        words.append(x & 0xffffffff)
+        x >>= 32
+
+    return words or [0]
+
+
+def encode_operand(x):
+    words = to_words(x)
+
+    return struct.pack(f"<I{len(words)}I", len(words), *words)
+
+
+def write_cases(out, cases):
+    """Writes a list of cases (tuples of ints) to a binary file object."""
+
+    operand_count = len(cases[0]) if cases else 0
+    encoded = []
+
+    for case in cases:
+        assert len(case) == operand_count
+        encoded.append(b"".join(map(encode_operand, case)))
+
+    offset = HEADER.size + WORD.size * len(cases)
+    index = []
+
+    for chunk in encoded:
+        index.append(offset)
+        offset += len(chunk)
+
+    if offset >= 1 << 32:
+        raise ValueError("the file would be too large for 32-bit offsets")
+
+    out.write(HEADER.pack(MAGIC, len(cases), operand_count))
+    out.write(struct.pack(f"<{len(index)}I", *index))
+
+    for chunk in encoded:
+        out.write(chunk)
+
+
+def read_index(f):
+    """Returns (operand count, case offsets) of a binary file object."""
+
+    magic, case_count, operand_count = HEADER.unpack(f.read(HEADER.size))
+
+    if magic != MAGIC:
+        raise ValueError("not a test vector file")
+
+    index = struct.unpack(f"<{case_count}I", f.read(WORD.size * case_count))
+
+    return operand_count, index
+
+
+def read_case(f, operand_count, offset):
+    f.seek(offset)
+    result = []
+
+    for _ in range(operand_count):
+        (count,) = WORD.unpack(f.read(WORD.size))
+        words = struct.unpack(f"<{count}I", f.read(WORD.size * count))
+        result.append(sum(w << 32 * i for i, w in enumerate(words)))
+
+    return tuple(result)
+
+
+def parse_text(lines):
+    return [tuple(int(x, 16) for x in line.split())
+            for line in lines if line.strip()]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print(f"Usage: {sys.argv[0]} <text file>", file=sys.stderr)
+        sys.exit(1)
+
+    with open(sys.argv[1]) as f:
+        cases = parse_text(f)
+
+    write_cases(sys.stdout.buffer, cases)
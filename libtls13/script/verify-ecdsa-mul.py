@@ -1,202 +1,989 @@
 #!/usr/bin/env python3
 
 """
-Tries to find a counterexample for the scalar field multiplication algorithm for
-secp384r1.
+Tries to find a counterexample for the multiplication and squaring algorithms
+in secp384r1, i.e., an input that causes an integer overflow.
 
-The multiplication is performed modulo the EC group's order.
+The following routines are modeled (--routine):
+
+- scalarMul, scalarSq: computation modulo the EC group's order, reduced by
+  multiplying the high-order words by constant limbs.
+- fieldMul, fieldSq: computation modulo the field prime p, reduced with signed
+  shifts and additions that exploit the special form of p.
+
+Squarings compute each cross term once and double it.
+
+The limbs of the result are checked to satisfy the constraints on the inputs,
+so a chain of the routines (e.g. the repeated squarings in scalar inversion)
+is covered as well.
+
+The model is generated from a reduction schedule: the limb width and the words
+at which the reduction stops to propagate carries. The reduction constants are
+derived from the modulus. The default schedules are the ones the Lua code uses.
+
+By default, all overflow conditions are checked in a single query. Pass
+--per-condition to check each of them independently across a process pool; a
+report with the verdict for every condition is printed at the end.
+
+With --explore, every schedule with at most --max-passes intermediate carry
+propagations is listed with an estimate of its operation count. Unless
+--count-only is given, the schedules are then verified, cheapest first, until a
+safe one is found.
+
+Before z3 is called, the model is run over bounds instead (IntervalArith):
+starting from the input limbs' ranges, every condition whose operands can't
+overflow for any values in their ranges is proven on the spot, and only the
+remaining ones are sent to z3. --no-intervals sends all of them.
+
+With --cache PATH, definite verdicts (proven or violated) are stored in a JSON
+file keyed by a hash of the model, and a model that has been checked before
+isn't checked again.
 """
 
+import argparse
+import hashlib
+import itertools
+import json
+import multiprocessing
+import operator
+import os
+import sys
+import time
+
+from collections import Counter
+from dataclasses import dataclass
 from functools import reduce
 
-import operator
 import z3
 
-from z3 import ULT, BitVec, BitVecVal, LShR, ZeroExt
-
-modulus = BitVecVal(
-    2**384 - 0x389cb27e0bc8d220a7e5f24db74f58851313e695333ad68d,
-    400
-)
-
-conditions = []
-constraints = []
-
-def mul(a, b):
-    # check for overflow
-    conditions.append(ULT(
-        ZeroExt(64, a) * ZeroExt(64, b),
-        BitVecVal(1 << 64, 128)
-    ))
-
-    return a * b
-
-
-def add(a, b):
-    # check for overflow
-    conditions.append(ULT(
-        ZeroExt(1, a) + ZeroExt(1, b),
-        BitVecVal(1 << 64, 65)
-    ))
-
-    return a + b
-
-
-def addmul(a, b, c):
-    return add(a, mul(b, c))
-
-
-a = [BitVec(f"a{i}", 64) for i in range(13)]
-b = [BitVec(f"b{i}", 64) for i in range(13)]
-
-for ai in a:
-    constraints.append(ULT(ai, BitVecVal(0x40000000, 64)))
-
-for bi in b:
-    constraints.append(ULT(bi, BitVecVal(0x40000000, 64)))
-
-a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11, a12, a13 = a
-b1, b2, b3, b4, b5, b6, b7, b8, b9, b10, b11, b12, b13 = b
-
-d = [
-    None,
-    a1 * b1,
-    a1 * b2 + a2 * b1,
-    a1 * b3 + a2 * b2 + a3 * b1,
-    a1 * b4 + a2 * b3 + a3 * b2 + a4 * b1,
-    a1 * b5 + a2 * b4 + a3 * b3 + a4 * b2 + a5 * b1,
-    a1 * b6 + a2 * b5 + a3 * b4 + a4 * b3 + a5 * b2 + a6 * b1,
-    a1 * b7 + a2 * b6 + a3 * b5 + a4 * b4 + a5 * b3 + a6 * b2 + a7 * b1,
-    a1 * b8 + a2 * b7 + a3 * b6 + a4 * b5 + a5 * b4 + a6 * b3 + a7 * b2
-    + a8 * b1,
-    a1 * b9 + a2 * b8 + a3 * b7 + a4 * b6 + a5 * b5 + a6 * b4 + a7 * b3
-    + a8 * b2 + a9 * b1,
-    a1 * b10 + a2 * b9 + a3 * b8 + a4 * b7 + a5 * b6 + a6 * b5 + a7 * b4
-    + a8 * b3 + a9 * b2 + a10 * b1,
-    a1 * b11 + a2 * b10 + a3 * b9 + a4 * b8 + a5 * b7 + a6 * b6 + a7 * b5
-    + a8 * b4 + a9 * b3 + a10 * b2 + a11 * b1,
-    a1 * b12 + a2 * b11 + a3 * b10 + a4 * b9 + a5 * b8 + a6 * b7 + a7 * b6
-    + a8 * b5 + a9 * b4 + a10 * b3 + a11 * b2 + a12 * b1,
-    a1 * b13 + a2 * b12 + a3 * b11 + a4 * b10 + a5 * b9 + a6 * b8 + a7 * b7
-    + a8 * b6 + a9 * b5 + a10 * b4 + a11 * b3 + a12 * b2 + a13 * b1,
-    a2 * b13 + a3 * b12 + a4 * b11 + a5 * b10 + a6 * b9 + a7 * b8 + a8 * b7
-    + a9 * b6 + a10 * b5 + a11 * b4 + a12 * b3 + a13 * b2,
-    a3 * b13 + a4 * b12 + a5 * b11 + a6 * b10 + a7 * b9 + a8 * b8 + a9 * b7
-    + a10 * b6 + a11 * b5 + a12 * b4 + a13 * b3,
-    a4 * b13 + a5 * b12 + a6 * b11 + a7 * b10 + a8 * b9 + a9 * b8 + a10 * b7
-    + a11 * b6 + a12 * b5 + a13 * b4,
-    a5 * b13 + a6 * b12 + a7 * b11 + a8 * b10 + a9 * b9 + a10 * b8 + a11 * b7
-    + a12 * b6 + a13 * b5,
-    a6 * b13 + a7 * b12 + a8 * b11 + a9 * b10 + a10 * b9 + a11 * b8 + a12 * b7
-    + a13 * b6,
-    a7 * b13 + a8 * b12 + a9 * b11 + a10 * b10 + a11 * b9 + a12 * b8 + a13 * b7,
-    a8 * b13 + a9 * b12 + a10 * b11 + a11 * b10 + a12 * b9 + a13 * b8,
-    a9 * b13 + a10 * b12 + a11 * b11 + a12 * b10 + a13 * b9,
-    a10 * b13 + a11 * b12 + a12 * b11 + a13 * b10,
-    a11 * b13 + a12 * b12 + a13 * b11,
-    a12 * b13 + a13 * b12,
-    a13 * b13,
-]
-
-carry = BitVecVal(0, 64)
-
-for i in range(1, 26):
-    word = d[i] + carry
-    d[i] = word & BitVecVal(0x3fffffff, 64)
-    carry = LShR(word, BitVecVal(30, 64))
-
-i = 26
-
-while True:
-    d[i - 7] = addmul(d[i - 7], carry, BitVecVal(0xe272, 64))
-    d[i - 8] = addmul(d[i - 8], carry, BitVecVal(0x327e0bc8, 64))
-    d[i - 9] = addmul(d[i - 9], carry, BitVecVal(0x348829f9, 64))
-    d[i - 10] = addmul(d[i - 10], carry, BitVecVal(0x1f24db74, 64))
-    d[i - 11] = addmul(d[i - 11], carry, BitVecVal(0x3d62144c, 64))
-    d[i - 12] = addmul(d[i - 12], carry, BitVecVal(0x13e69533, 64))
-    d[i - 13] = addmul(d[i - 13], carry, BitVecVal(0xeb5a340, 64))
-
-    i = i - 1
-    carry = d[i]
-
-    if i == 19:
-        break
-
-carry = BitVecVal(0, 64)
-
-for i in range(20 - 13, 20):
-    word = add(d[i], carry)
-    d[i] = word & BitVecVal(0x3fffffff, 64)
-    carry = LShR(word, BitVecVal(30, 64))
-
-d[20] = carry
-i = 20
-
-while True:
-    d[i - 7] = addmul(d[i - 7], carry, BitVecVal(0xe272, 64))
-    d[i - 8] = addmul(d[i - 8], carry, BitVecVal(0x327e0bc8, 64))
-    d[i - 9] = addmul(d[i - 9], carry, BitVecVal(0x348829f9, 64))
-    d[i - 10] = addmul(d[i - 10], carry, BitVecVal(0x1f24db74, 64))
-    d[i - 11] = addmul(d[i - 11], carry, BitVecVal(0x3d62144c, 64))
-    d[i - 12] = addmul(d[i - 12], carry, BitVecVal(0x13e69533, 64))
-    d[i - 13] = addmul(d[i - 13], carry, BitVecVal(0xeb5a340, 64))
-
-    i = i - 1
-    carry = d[i]
-
-    if i == 13:
-        break
-
-carry = BitVecVal(0, 64)
-c = [None] * 14
-
-for i in range(1, 13):
-    word = add(d[i], carry)
-    c[i] = word & BitVecVal(0x3fffffff, 64)
-    carry = LShR(word, BitVecVal(30, 64))
-
-word = add(d[13], carry)
-c[13] = word & BitVecVal(0xffffff, 64)
-carry = LShR(word, BitVecVal(24, 64))
-
-c[1] = addmul(c[1], carry, BitVecVal(0x333ad68d, 64))
-c[2] = addmul(c[2], carry, BitVecVal(0xc4f9a54, 64))
-c[3] = addmul(c[3], carry, BitVecVal(0x34f58851, 64))
-c[4] = addmul(c[4], carry, BitVecVal(0x397c936d, 64))
-c[5] = addmul(c[5], carry, BitVecVal(0x8d220a7, 64))
-c[6] = addmul(c[6], carry, BitVecVal(0x32c9f82f, 64))
-c[7] = addmul(c[7], carry, BitVecVal(0x389, 64))
-
-carry = BitVecVal(0, 64)
-
-for i in range(1, 14):
-    word = add(c[i], carry)
-    c[i] = word & BitVecVal(0x3fffffff, 64)
-    carry = LShR(word, BitVecVal(30, 64))
-
-
-def concat_parts(parts):
-    # extend to 400 bits
-    extended = [ZeroExt(336, x) for x in parts]
-    shifted = [x << BitVecVal(30 * i, 400) for i, x in enumerate(extended)]
-
-    return reduce(operator.or_, shifted)
-
-
-#a = concat_parts(a[1:])
-#b = concat_parts(b[1:])
-#c_actual = concat_parts(c[1:])
-#conditions.append(ULT(c_actual, BitVecVal(2**390, 400)))
-
-# extend further to accomodate intermediate values
-#c_expected = Extract(
-#    399,
-#    0,
-#    ZeroExt(400, a) * ZeroExt(400, b) % ZeroExt(400, modulus)
-#)
-#conditions.append(c_actual % modulus == c_expected)
+from z3 import ULT, BitVec, BitVecVal, LShR, SignExt, ZeroExt
+
+order = 2**384 - 0x389cb27e0bc8d220a7e5f24db74f58851313e695333ad68d
+p = 2**384 - 2**128 - 2**96 + 2**32 - 1
+
+modulus = BitVecVal(order, 400)
+
+
+def to_limbs(x, width):
+    limbs = []
+
+    while x:
+        limbs.append(x & (1 << width) - 1)
+        x >>= width
+
+    return limbs
+
+
+def to_signed_digits(x):
+    # returns the non-adjacent form of x as a dict {exponent: ±1}.
+    digits = {}
+    e = 0
+
+    while x:
+        if x & 1:
+            digits[e] = 2 - (x & 3)
+            x -= digits[e]
+
+        x >>= 1
+        e += 1
+
+    return digits
+
+
+@dataclass(frozen=True)
+class Routine:
+    modulus: int
+    # "dense" reduction multiplies the high-order words by the limbs of
+    # 2^k mod modulus. "sparse" reduction instead adds them shifted according
+    # to the signed binary form of 2^k mod modulus, which calls for signed
+    # arithmetic.
+    reduction: str
+    # whether the product is a square, computed with doubled cross terms.
+    square: bool = False
+
+
+routines = {
+    "scalarMul": Routine(order, "dense"),
+    "scalarSq": Routine(order, "dense", square=True),
+    "fieldMul": Routine(p, "sparse"),
+    "fieldSq": Routine(p, "sparse", square=True),
+}
+
+
+@dataclass(frozen=True)
+class Schedule:
+    routine: str = "scalarMul"
+    limb_width: int = 30
+    # the words at which the high-order reduction stops to propagate carries.
+    # the last round, which stops at the top limb, is implicit.
+    # `None` means the default for the routine: a single stop halfway through
+    # the high-order words for dense reduction, and none for sparse reduction.
+    stops: tuple = None
+    bits: int = 384
+
+    def __post_init__(self):
+        if self.stops is None:
+            if self.spec.reduction == "dense":
+                stops = (self.limbs + self.limbs // 2,)
+            else:
+                stops = ()
+
+            object.__setattr__(self, "stops", stops)
+
+        n = self.limbs
+
+        if list(self.stops) != sorted(set(self.stops), reverse=True):
+            raise ValueError("stops must be in descending order")
+
+        if any(not n < stop < 2 * n for stop in self.stops):
+            raise ValueError(f"stops must be between {n + 1} and {2 * n - 1}")
+
+    @property
+    def spec(self):
+        return routines[self.routine]
+
+    @property
+    def limbs(self):
+        return -(-self.bits // self.limb_width)
+
+    @property
+    def top_width(self):
+        return self.bits - (self.limbs - 1) * self.limb_width
+
+    def fold_constants(self):
+        # 2^(limbs * limb_width) mod modulus, used to eliminate the high-order
+        # words.
+        return self._split(pow(2, self.limbs * self.limb_width,
+                               self.spec.modulus))
+
+    def final_constants(self):
+        # 2^bits mod modulus, used to eliminate the excess bits of the top
+        # limb.
+        return self._split(pow(2, self.bits, self.spec.modulus))
+
+    def _split(self, x):
+        # dense reduction: a list of limbs.
+        # sparse reduction: a list of (limb index, shift, sign), in descending
+        # order.
+        if self.spec.reduction == "dense":
+            return to_limbs(x, self.limb_width)
+
+        return [
+            (e // self.limb_width, e % self.limb_width, sign)
+            for e, sign in sorted(to_signed_digits(x).items(), reverse=True)
+        ]
+
+    def __str__(self):
+        stops = ", ".join(map(str, self.stops)) or "none"
+
+        return f"{self.routine}, {self.limb_width}-bit limbs, stops: {stops}"
+
+
+@dataclass
+class Condition:
+    # the operation that must not overflow: "add", "sub", "mul" or "shl".
+    op: str
+    # where the operation happens in the algorithm (the reduction round and the
+    # index of the limb being updated).
+    where: str
+    # a z3 term, or, for IntervalArith, whether the bounds prove the condition.
+    expr: z3.BoolRef | bool
+
+    def __str__(self):
+        return f"{self.where}: {self.op}"
+
+
+class Z3Arith:
+    """
+    Performs 64-bit arithmetic on z3 terms.
+
+    Records an overflow condition for every addition, subtraction,
+    multiplication and left shift, and counts the operations performed.
+
+    The arithmetic is unsigned unless `signed` is set. In that case, values must
+    stay in the range of Lua integers, and right shifts are arithmetic (which
+    takes a few more operations in Lua).
+    """
+
+    def __init__(self):
+        self.conditions = []
+        self.constraints = []
+        self.ops = Counter()
+        self.where = None
+        self.signed = False
+
+    def input(self, name, width):
+        x = BitVec(name, 64)
+        self.constraints.append(ULT(x, BitVecVal(1 << width, 64)))
+
+        return x
+
+    def const(self, x):
+        return BitVecVal(x, 64)
+
+    def _check(self, op, extend, bits, result):
+        if self.signed:
+            r = result(SignExt(bits, extend[0]), SignExt(bits, extend[1]))
+            expr = z3.And(
+                r >= BitVecVal(-(1 << 63), 64 + bits),
+                r < BitVecVal(1 << 63, 64 + bits),
+            )
+        else:
+            r = result(ZeroExt(bits, extend[0]), ZeroExt(bits, extend[1]))
+            expr = ULT(r, BitVecVal(1 << 64, 64 + bits))
+
+        self.conditions.append(Condition(op, self.where, expr))
+
+    def mul(self, a, b):
+        self.ops["mul"] += 1
+        self._check("mul", (a, b), 64, operator.mul)
+
+        return a * b
+
+    def add(self, a, b):
+        self.ops["add"] += 1
+        self._check("add", (a, b), 1, operator.add)
+
+        return a + b
+
+    def sub(self, a, b):
+        self.ops["sub"] += 1
+        self._check("sub", (a, b), 1, operator.sub)
+
+        return a - b
+
+    def shl(self, a, width):
+        self.ops["shl"] += 1
+        self._check("shl", (a, BitVecVal(width, 64)), width,
+                    lambda x, k: x << k)
+
+        return a << BitVecVal(width, 64)
+
+    def mask(self, a, width):
+        self.ops["and"] += 1
+
+        return a & BitVecVal((1 << width) - 1, 64)
+
+    def bound(self, a, width):
+        # not an operation: a condition on a value.
+        self.conditions.append(
+            Condition("bound", self.where, ULT(a, BitVecVal(1 << width, 64)))
+        )
+
+    def shr(self, a, width):
+        if self.signed:
+            # carry = carry | -(carry & 1 << 63 >> width)
+            self.ops["sar"] += 1
+
+            return a >> BitVecVal(width, 64)
+
+        self.ops["shr"] += 1
+
+        return LShR(a, BitVecVal(width, 64))
+
+
+@dataclass(frozen=True)
+class Interval:
+    """The range [lo, hi] of a value, as a mathematical integer."""
+
+    lo: int
+    hi: int
+
+    def __str__(self):
+        return f"[{self.lo:#x}, {self.hi:#x}]"
+
+
+class IntervalArith:
+    """
+    Performs the operations of Z3Arith on bounds instead of z3 terms.
+
+    Every value is an Interval containing all the values the 64-bit term can
+    take. A condition is recorded as proven if the exact result of the
+    operation is in range for every pair of operands in the intervals. When it
+    isn't, the result may have wrapped around, so it's widened to the whole
+    range: the bounds stay sound for the conditions that follow.
+
+    The bounds ignore the correlations between values, so this can fail to
+    prove a condition that holds, but never proves one that doesn't. The
+    operations are applied in the same order as with Z3Arith, so the
+    conditions of the two models correspond one to one.
+    """
+
+    def __init__(self):
+        self.conditions = []
+        self.constraints = []
+        self.ops = Counter()
+        self.where = None
+        self.signed = False
+
+    def _range(self):
+        if self.signed:
+            return Interval(-(1 << 63), (1 << 63) - 1)
+
+        return Interval(0, (1 << 64) - 1)
+
+    def _read(self, x):
+        # reinterprets the bits of x as signed or unsigned, as the
+        # operation at hand does.
+        full = self._range()
+
+        if full.lo <= x.lo and x.hi <= full.hi:
+            return x
+
+        for offset in (1 << 64, -(1 << 64)):
+            if full.lo <= x.lo + offset and x.hi + offset <= full.hi:
+                return Interval(x.lo + offset, x.hi + offset)
+
+        return full
+
+    def _check(self, op, result):
+        full = self._range()
+        proven = full.lo <= result.lo and result.hi <= full.hi
+        self.conditions.append(Condition(op, self.where, proven))
+
+        return result if proven else full
+
+    def input(self, name, width):
+        return Interval(0, (1 << width) - 1)
+
+    def const(self, x):
+        return Interval(x, x)
+
+    def mul(self, a, b):
+        self.ops["mul"] += 1
+        a, b = self._read(a), self._read(b)
+        products = [x * y for x in (a.lo, a.hi) for y in (b.lo, b.hi)]
+
+        return self._check("mul", Interval(min(products), max(products)))
+
+    def add(self, a, b):
+        self.ops["add"] += 1
+        a, b = self._read(a), self._read(b)
+
+        return self._check("add", Interval(a.lo + b.lo, a.hi + b.hi))
+
+    def sub(self, a, b):
+        self.ops["sub"] += 1
+        a, b = self._read(a), self._read(b)
+
+        return self._check("sub", Interval(a.lo - b.hi, a.hi - b.lo))
+
+    def shl(self, a, width):
+        self.ops["shl"] += 1
+        a = self._read(a)
+
+        return self._check("shl", Interval(a.lo << width, a.hi << width))
+
+    def mask(self, a, width):
+        self.ops["and"] += 1
+        a = self._read(a)
+
+        # the bits below width don't wrap around within the interval.
+        if a.lo >> width == a.hi >> width:
+            m = (1 << width) - 1
+
+            return Interval(a.lo & m, a.hi & m)
+
+        return Interval(0, (1 << width) - 1)
+
+    def bound(self, a, width):
+        a = self._read(a)
+        proven = 0 <= a.lo and a.hi < 1 << width
+        self.conditions.append(Condition("bound", self.where, proven))
+
+    def shr(self, a, width):
+        # arithmetic if signed, logical otherwise: either is monotonic on the
+        # values as read.
+        self.ops["sar" if self.signed else "shr"] += 1
+        a = self._read(a)
+
+        return Interval(a.lo >> width, a.hi >> width)
+
+
+def interval_verdicts(schedule):
+    """
+    Returns, for every condition of the model, whether interval arithmetic
+    proves it.
+    """
+
+    arith, _, _ = build_model(schedule, IntervalArith())
+
+    return [condition.expr for condition in arith.conditions]
+
+
+def build_product(arith, a, b, square):
+    n = len(a) - 1
+    d = [None] * (2 * n + 1)
+
+    for k in range(1, 2 * n):
+        arith.where = f"product, d[{k}]"
+        first, last = max(1, k + 1 - n), min(k, n)
+
+        if not square:
+            d[k] = reduce(arith.add, [
+                arith.mul(a[i], b[k + 1 - i]) for i in range(first, last + 1)
+            ])
+
+            continue
+
+        # the cross terms a[i] * a[j] and a[j] * a[i] are equal, so each is
+        # computed once and doubled.
+        cross = [
+            arith.mul(a[i], a[k + 1 - i])
+            for i in range(first, last + 1)
+            if i < k + 1 - i
+        ]
+        d[k] = arith.shl(reduce(arith.add, cross), 1) if cross else None
+
+        if (k + 1) % 2 == 0:
+            sq = arith.mul(a[(k + 1) // 2], a[(k + 1) // 2])
+            d[k] = arith.add(d[k], sq) if d[k] is not None else sq
+
+    return d
+
+
+def build_reduction(arith, d, schedule):
+    n = schedule.limbs
+    w = schedule.limb_width
+    spec = schedule.spec
+    fold = schedule.fold_constants()
+    final = schedule.final_constants()
+
+    carry = arith.const(0)
+
+    for i in range(1, 2 * n):
+        arith.where = f"carry pass 0, d[{i}]"
+        word = arith.add(d[i], carry)
+        d[i] = arith.mask(word, w)
+        carry = arith.shr(word, w)
+
+    d[2 * n] = carry
+    top = 2 * n
+
+    # sparse reduction subtracts, so the words may become negative from now on.
+    arith.signed = spec.reduction == "sparse"
+
+    # eliminate the high-order words, from the top down, using
+    # 2^((n + k) * w) ≡ 2^(k * w) * fold.
+    # after each round but the last, carries are propagated to keep the words
+    # small.
+    for round_no, stop in enumerate([*schedule.stops, n], start=1):
+        for i in range(top, stop, -1):
+            carry = d[i]
+
+            if spec.reduction == "dense":
+                for j in range(len(fold) - 1, -1, -1):
+                    arith.where = (f"reduction round {round_no}, "
+                                   f"d[{i}] -> d[{i - n + j}]")
+                    d[i - n + j] = arith.add(
+                        d[i - n + j],
+                        arith.mul(carry, arith.const(fold[j]))
+                    )
+            else:
+                for j, shift, sign in fold:
+                    arith.where = (f"reduction round {round_no}, "
+                                   f"d[{i}] -> d[{i - n + j}]")
+                    term = arith.shl(carry, shift) if shift else carry
+                    op = arith.add if sign > 0 else arith.sub
+                    d[i - n + j] = op(d[i - n + j], term)
+
+        if stop == n:
+            break
+
+        carry = arith.const(0)
+
+        for i in range(stop + 1 - n, stop + 1):
+            arith.where = f"carry pass {round_no}, d[{i}]"
+            word = arith.add(d[i], carry)
+            d[i] = arith.mask(word, w)
+            carry = arith.shr(word, w)
+
+        d[stop + 1] = carry
+        top = stop + 1
+
+    # propagate carries into the result. the top limb is shorter, and the bits
+    # above it are eliminated with 2^bits ≡ final.
+    carry = arith.const(0)
+    c = [None] * (n + 1)
+
+    for i in range(1, n + 1):
+        width = w if i < n else schedule.top_width
+        arith.where = f"final carry pass, c[{i}]"
+        word = arith.add(d[i], carry)
+        c[i] = arith.mask(word, width)
+        carry = arith.shr(word, width)
+
+    if spec.reduction == "dense":
+        for j, k in enumerate(final, start=1):
+            arith.where = f"final reduction, c[{j}]"
+            c[j] = arith.add(c[j], arith.mul(carry, arith.const(k)))
+
+        last_carry = arith.const(0)
+    else:
+        # the constant term, if positive, is added by the last carry pass.
+        last_carry = arith.const(0)
+
+        for j, shift, sign in reversed(final):
+            if (j, shift, sign) == (0, 0, 1):
+                last_carry = carry
+
+                continue
+
+            arith.where = f"final reduction, c[{j + 1}]"
+            term = arith.shl(carry, shift) if shift else carry
+            op = arith.add if sign > 0 else arith.sub
+            c[j + 1] = op(c[j + 1], term)
+
+    carry = last_carry
+
+    for i in range(1, n + 1):
+        arith.where = f"last carry pass, c[{i}]"
+        word = arith.add(c[i], carry)
+        c[i] = arith.mask(word, w)
+        carry = arith.shr(word, w)
+
+    arith.signed = False
+
+    return c
+
+
+def build_model(schedule, arith=None):
+    """
+    Builds the model of the routine following the schedule.
+
+    Returns a tuple (arith, inputs, c). arith.constraints restrict the inputs
+    (a1, ..., b1, ...) to valid limbs, arith.conditions must hold for the
+    routine to be free of overflows, and c holds the limbs of the result
+    (1-indexed, like in Lua).
+    """
+
+    if arith is None:
+        arith = Z3Arith()
+
+    n = schedule.limbs
+    w = schedule.limb_width
+    spec = schedule.spec
+
+    a = [None] + [arith.input(f"a{i}", w) for i in range(1, n + 1)]
+    inputs = a[1:]
+
+    if spec.square:
+        b = a
+    else:
+        b = [None] + [arith.input(f"b{i}", w) for i in range(1, n + 1)]
+        inputs += b[1:]
+
+    d = build_product(arith, a, b, spec.square)
+    c = build_reduction(arith, d, schedule)
+
+    # the result must satisfy the constraints on the inputs: then the routine
+    # can be applied to its own result, and the model covers chains of any
+    # length (e.g. scalarRepeatedSq in secp384r1.lua).
+    for i in range(1, n + 1):
+        arith.where = f"result, c[{i}]"
+        arith.bound(c[i], w)
+
+    return arith, inputs, c
+
+
+def count_ops(schedule):
+    arith, _, _ = build_model(schedule)
+
+    return arith.ops
+
+
+def make_solver(constraints, timeout):
+    solver = z3.Solver()
+
+    if timeout:
+        solver.set(timeout=int(timeout * 1000))
+
+    solver.add(*constraints)
+
+    return solver
+
+
+def get_counterexample(solver, inputs):
+    model = solver.model()
+
+    return {
+        str(x): model.eval(x, model_completion=True).as_long()
+        for x in inputs
+    }
+
+
+def print_counterexample(counterexample, indent="    "):
+    for var, value in counterexample.items():
+        print(f"{indent}{var} = 0x{value:x}")
+
+
+def check_all(schedule, timeout, intervals=True):
+    arith, inputs, _ = build_model(schedule)
+    proven = (interval_verdicts(schedule) if intervals
+              else [False] * len(arith.conditions))
+    remaining = [c for c, p in zip(arith.conditions, proven) if not p]
+    by_intervals = len(arith.conditions) - len(remaining)
+
+    if not remaining:
+        print(f"proven: {len(arith.conditions)} conditions hold (all by "
+              f"interval arithmetic)")
+
+        return "proven"
+
+    solver = make_solver(arith.constraints, timeout)
+
+    # negate the conjunction of conditions to look for contradictions
+    solver.add(z3.Not(z3.And(*(c.expr for c in remaining))))
+    result = solver.check()
+
+    if result == z3.unsat:
+        print(f"proven: {len(arith.conditions)} conditions hold "
+              f"({by_intervals} by interval arithmetic)")
+
+        return "proven"
+    elif result != z3.sat:
+        print(f"unknown: {solver.reason_unknown()}")
+
+        return "unknown"
+
+    model = solver.model()
+    print("counterexample found; violated conditions:")
+
+    for condition in remaining:
+        if z3.is_false(model.eval(condition.expr, model_completion=True)):
+            print(f"  {condition}")
+
+    print_counterexample(get_counterexample(solver, inputs), indent="  ")
+
+    return "violated"
+
+
+# per-process state of the --per-condition workers.
+_worker = None
+
+
+def init_worker(schedule, timeout):
+    global _worker
+
+    # every worker builds its own copy of the model: z3 terms can't be sent
+    # across processes.
+    arith, inputs, _ = build_model(schedule)
+
+    # the constraints on a and b are shared by all queries, so they're asserted
+    # once in the base scope. each condition is then checked in a scope of its
+    # own, which lets z3 reuse whatever it has learned about the inputs.
+    solver = make_solver(arith.constraints, timeout)
+
+    _worker = (inputs, solver, arith.conditions)
+
+
+def check_condition(idx):
+    inputs, solver, conditions = _worker
+
+    start = time.monotonic()
+    solver.push()
+
+    try:
+        solver.add(z3.Not(conditions[idx].expr))
+        result = solver.check()
+
+        if result == z3.sat:
+            counterexample = get_counterexample(solver, inputs)
+
+            return idx, "counterexample", counterexample, time.monotonic() - start
+        elif result == z3.unsat:
+            return idx, "proven", None, time.monotonic() - start
+        else:
+            return idx, "timeout", None, time.monotonic() - start
+    finally:
+        solver.pop()
+
+
+def check_per_condition(schedule, jobs, timeout, intervals=True):
+    arith, _, _ = build_model(schedule)
+    conditions = arith.conditions
+    results = [None] * len(conditions)
+    pending = []
+
+    for idx, proven in enumerate(interval_verdicts(schedule) if intervals
+                                 else [False] * len(conditions)):
+        if proven:
+            results[idx] = "proven", None, None
+        else:
+            pending.append(idx)
+
+    # spawn rather than fork so that the workers don't inherit the z3 context.
+    ctx = multiprocessing.get_context("spawn")
+    start = time.monotonic()
+
+    with ctx.Pool(jobs, initializer=init_worker,
+                  initargs=(schedule, timeout)) as pool:
+        for done, (idx, verdict, counterexample, elapsed) in enumerate(
+            pool.imap_unordered(check_condition, pending),
+            start=1,
+        ):
+            results[idx] = verdict, counterexample, elapsed
+            print(
+                f"[{done}/{len(pending)}] {verdict:<14} {conditions[idx]} "
+                f"({elapsed:.2f} s)",
+                file=sys.stderr,
+            )
+
+    total = time.monotonic() - start
+    counts = {}
+
+    print("Report:")
+
+    for condition, (verdict, counterexample, elapsed) in zip(conditions,
+                                                            results):
+        counts[verdict] = counts.get(verdict, 0) + 1
+        how = "intervals" if elapsed is None else f"{elapsed:.2f} s"
+        print(f"  {verdict:<14} {condition} ({how})")
+
+        if counterexample:
+            print_counterexample(counterexample)
+
+    print(
+        f"{len(conditions)} conditions in {total:.2f} s: "
+        + ", ".join(f"{count} {verdict}" for verdict, count in counts.items())
+        + f" ({len(conditions) - len(pending)} by interval arithmetic)"
+    )
+
+    if "counterexample" in counts:
+        return "violated"
+    elif counts.keys() <= {"proven"}:
+        return "proven"
+
+    return "unknown"
+
+
+def model_hash(arith):
+    """
+    Hashes the constraints and the conditions of a model.
+
+    z3's structural AST hashes are used: they are stable across runs and, unlike
+    sexpr(), don't expand shared subterms, so hashing takes milliseconds.
+    """
+
+    h = hashlib.sha256(z3.get_version_string().encode())
+
+    for expr in arith.constraints:
+        h.update(expr.hash().to_bytes(4, "little"))
+
+    for condition in arith.conditions:
+        h.update(str(condition).encode())
+        h.update(condition.expr.hash().to_bytes(4, "little"))
+
+    return h.hexdigest()
+
+
+def load_cache(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
 
-# negate the conjunction of conditions to look for contradictions
-verification_condition = z3.Not(z3.And(*conditions))
 
-z3.solve(verification_condition, *constraints, show=True)
+def store_verdict(path, key, entry):
+    # reload first: another process may have added entries in the meantime.
+    cache = load_cache(path)
+    cache[key] = entry
+    tmp = f"{path}.{os.getpid()}.tmp"
+
+    with open(tmp, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+    os.replace(tmp, path)
+
+
+def verify(schedule, args):
+    print(f"Verifying the schedule ({schedule})")
+
+    if args.cache:
+        arith, _, _ = build_model(schedule)
+        key = model_hash(arith)
+        entry = load_cache(args.cache).get(key)
+
+        if entry:
+            print(f"{entry['verdict']} (cached verdict for model {key[:16]})")
+
+            return entry["verdict"] == "proven"
+
+    if args.per_condition:
+        verdict = check_per_condition(schedule, args.jobs, args.timeout,
+                                      args.intervals)
+    else:
+        verdict = check_all(schedule, args.timeout, args.intervals)
+
+    # a timeout may go away with a larger one, so only cache definite verdicts.
+    if args.cache and verdict != "unknown":
+        store_verdict(args.cache, key, {
+            "verdict": verdict,
+            "schedule": str(schedule),
+            "conditions": len(arith.conditions),
+        })
+
+    return verdict == "proven"
+
+
+def format_ops(ops):
+    return ", ".join(
+        f"{count} {op}" for op, count in ops.items()
+    ) + f"; total {ops.total()}"
+
+
+def explore(args):
+    candidates = []
+
+    for routine, limb_width in itertools.product(args.routine,
+                                                 args.limb_width):
+        n = Schedule(routine, limb_width).limbs
+
+        for passes in range(args.max_passes + 1):
+            for stops in itertools.combinations(range(2 * n - 1, n, -1),
+                                                passes):
+                schedule = Schedule(routine, limb_width, stops)
+                candidates.append((count_ops(schedule), schedule))
+
+    candidates.sort(key=lambda candidate: candidate[0].total())
+
+    for ops, schedule in candidates:
+        print(f"{schedule}: {format_ops(ops)}")
+
+    if args.count_only:
+        return True
+
+    success = True
+
+    # each routine needs its own safe schedule.
+    for routine in args.routine:
+        for ops, schedule in candidates:
+            if schedule.routine == routine and verify(schedule, args):
+                print(f"Cheapest safe schedule: {schedule} "
+                      f"({format_ops(ops)})")
+
+                break
+        else:
+            print(f"None of the schedules for {routine} is safe")
+            success = False
+
+    return success
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--routine",
+        nargs="+",
+        choices=[*routines, "all"],
+        default=["scalarMul"],
+        help="the routines to verify",
+    )
+    parser.add_argument(
+        "--limb-width",
+        type=int,
+        nargs="+",
+        default=[30],
+        help="limb width in bits (several are allowed with --explore)",
+    )
+    parser.add_argument(
+        "--stops",
+        type=int,
+        nargs="*",
+        help="words at which to propagate carries during reduction",
+    )
+    parser.add_argument(
+        "--show-constants",
+        action="store_true",
+        help="print the reduction constants derived for the schedule",
+    )
+    parser.add_argument(
+        "--explore",
+        action="store_true",
+        help="compare the costs of schedules and find the cheapest safe one",
+    )
+    parser.add_argument(
+        "--max-passes",
+        type=int,
+        default=1,
+        help="maximum number of intermediate carry passes for --explore",
+    )
+    parser.add_argument(
+        "--count-only",
+        action="store_true",
+        help="only estimate operation counts, don't verify",
+    )
+    parser.add_argument(
+        "--per-condition",
+        action="store_true",
+        help="check every overflow condition independently",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes for --per-condition",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=0,
+        help="per-query timeout in seconds (0 means none)",
+    )
+    parser.add_argument(
+        "--no-intervals",
+        dest="intervals",
+        action="store_false",
+        help="send every condition to z3, even those interval arithmetic "
+             "proves",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="a JSON file to cache verdicts in, keyed by the model's hash",
+    )
+    args = parser.parse_args()
+
+    if "all" in args.routine:
+        args.routine = list(routines)
+
+    if args.explore:
+        sys.exit(0 if explore(args) else 1)
+
+    if len(args.limb_width) != 1:
+        parser.error("multiple limb widths are only allowed with --explore")
+
+    success = True
+
+    for routine in args.routine:
+        try:
+            schedule = Schedule(
+                routine,
+                args.limb_width[0],
+                tuple(args.stops) if args.stops is not None else None,
+            )
+        except ValueError as e:
+            parser.error(str(e))
+
+        print(f"{schedule}: {format_ops(count_ops(schedule))}")
+
+        if args.show_constants:
+            for name, constants in [
+                ("fold", schedule.fold_constants()),
+                ("final", schedule.final_constants()),
+            ]:
+                print(f"{name}: " + ", ".join(
+                    f"0x{k:x}" if isinstance(k, int)
+                    else f"{'+' if k[2] > 0 else '-'}(carry << {k[1]}) at "
+                    f"limb {k[0] + 1}"
+                    for k in constants
+                ))
+
+        if not args.count_only:
+            success = verify(schedule, args) and success
+
+    sys.exit(0 if success else 1)
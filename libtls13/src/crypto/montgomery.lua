@@ -391,7 +391,7 @@ end
 local function modVecVec(x, y)
   stripZeros(x)
   stripZeros(y)
-  assert(y[1] ~= 0, "division by zero")
+  assert(#y > 1 or y[1] ~= 0, "division by zero")
 
   x = util.copy(x)
 
@@ -449,6 +449,9 @@ function lib.modPowOdd(x, y, m)
   resize(rr, 2 * #m, 0)
   rr[2 * #m + 1] = 1
   rr = modVecVec(rr, m)
+  -- the remainder has its leading zeros stripped, which happens to matter if
+  -- m is close to a power of two.
+  resize(rr, #m, 0)
 
   local one = {1}
   resize(one, #m, 0)
@@ -4,6 +4,7 @@
 -- - https://www.secg.org/sec2-v2.pdf
 -- - https://eprint.iacr.org/2007/455.pdf
 
+local constants = require("tls13.crypto.secp384r1.constants")
 local sha2 = require("tls13.crypto.hash.sha2")
 
 local lib = {}
@@ -1649,8 +1650,9 @@ lib.group.groupJacobianMixedSub = groupJacobianMixedSub
 -- (subtraction if negative) of a precomputed value.
 --
 -- k is assumed to be a 384-bit scalar, represented as a 13-array of 30-bit
--- words (same as field elements).
-local function getChain(k)
+-- words (same as field elements). The entries are odd and bounded by
+-- 2^width - 1 in magnitude.
+local function getChain(k, width)
   -- see https://eprint.iacr.org/2007/455.pdf, section 3, for reference.
   local r = {}
 
@@ -1663,12 +1665,16 @@ local function getChain(k)
   r[385] = 0
 
   -- try to group bits together to reduce the number of additions.
-  -- the precomputed points are {-31P, -29P, ..., 29P, 31P}.
+  -- the precomputed points are
+  -- {-maxFactor * P, ..., -3P, -P, P, 3P, ..., maxFactor * P}.
+  local maxFactor = (1 << width) - 1
+
   for i = 1, 384, 1 do
     if r[i] == 1 then
-      -- the maximum multiple factor (31) is 5 bits wide. but we want to check
-      -- 1 extra bit to make it extra efficient (see the comment below).
-      for b = 1, 5, 1 do
+      -- maxFactor is width bits wide, so bits i to i + width - 1 can be glued
+      -- into an addition. but we check bit i + width as well, which can turn
+      -- the addition into a subtraction (see the comment below).
+      for b = 1, width, 1 do
         if i + b > 384 then
           break
         elseif r[i + b] == 1 then
@@ -1680,31 +1686,32 @@ local function getChain(k)
           -- and skipping the addition at i + 1.
           --
           -- likewise, sometimes it makes sense to *subtract*. imagine we had
-          -- 10 bits set in a row. we can, of course, glue together the first
-          -- 5 additions (31P), do 5 doubles, followed by another addition of
-          -- 31P. but notice what happens if we subtract P instead of adding it.
-          -- this now requires us to add 32P -- but that's exactly what's going
-          -- to happen anyway when we double. and if we consider the whole
-          -- sequence of 10 bits, which told us we'll be adding 1023P, now we
-          -- need to add 1024P, which will happen automatically when we do
-          -- doubling.
+          -- 2 * width bits set in a row. we can, of course, glue together the
+          -- first width additions (maxFactor * P), do width doubles, followed
+          -- by another addition of maxFactor * P. but notice what happens if
+          -- we subtract P instead of adding it. this now requires us to add
+          -- 2^width * P -- but that's exactly what's going to happen anyway
+          -- when we double. and if we consider the whole sequence of 2 * width
+          -- bits, which told us we'll be adding (2^(2 * width) - 1)P, now we
+          -- need to add 2^(2 * width) * P, which will happen automatically
+          -- when we do doubling.
           --
-          -- in the end, we first try to add a precomputed point (up to 31P).
-          -- if gluing another bit gets us a multiple with a factor larger than
-          -- 31, we'll instead subtract by that much (unless we again get a
-          -- factor larger than in 31 in magnitude). the subtraction can only
-          -- happen when we're looking at the 5th bit from i, which considers
-          -- 32P.
+          -- in the end, we first try to add a precomputed point (up to
+          -- maxFactor * P). if gluing another bit gets us a factor larger than
+          -- maxFactor, we'll instead subtract by that much (unless we again
+          -- get a factor larger than maxFactor in magnitude). the subtraction
+          -- can only happen when we're looking at bit i + width, which
+          -- considers 2^width * P.
           local bit = r[i + b] << b
           local factor = r[i] + bit
 
-          if factor <= 31 then
+          if factor <= maxFactor then
             r[i] = factor
             r[i + b] = 0
           else
             factor = r[i] - bit
 
-            if factor < -31 then
+            if factor < -maxFactor then
               break
             end
 
@@ -1745,34 +1752,18 @@ end
 
 lib.group.groupDoScalarMultPrecomputation = groupDoScalarMultPrecomputation
 
--- The base point G of the curve.
-local g = {
-  {
-    0x32760ab7, 0x295178e1, 0x355296c3, 0xbc976f, 0x142a3855,
-    0x1d078209, 0x39b9859f, 0x0ed8a2e9, 0x2d746e1d, 0x1c7bcc82,
-    0x1378eb1c, 0x08afa2c1, 0xaa87ca,
-  },
-  {
-    0x10ea0e5f, 0x290c75f2, 0x17e819d7, 0x182c7387, 0x30b8c00a,
-    0x28c44ed7, 0x2147ce9d, 0x076f4a26, 0x1c29f8f4, 0x22fe4a4b,
-    0x06f5d9e9, 0x12a5898b, 0x3617de,
-  },
-  fieldOne(),
-}
-
-local gWindow = groupDoScalarMultPrecomputation(g)
-
-for i, p in ipairs(gWindow) do
-  groupJacobianToAffine(p, p)
-end
+-- The odd multiples of the base point G, {G, 3G, ..., (2^w - 1)G}, in affine
+-- coordinates. Generated by script/generate-secp384r1-constants.py.
+local gWindow = constants.gWindow
+local gWindowWidth = constants.gWindowWidth
 
 -- Given p, an EC point in Jacobian coordinates, and u, v, two 384-bit scalars,
 -- represented as arrays of 13 30-bit words, little-endian,
 -- sets d to [u]G + [v]q, where G is the curve's base point.
 local function groupJacobianDoubleBaseScalarMulAdd(d, p, u, v)
   local pWindow = groupDoScalarMultPrecomputation(p)
-  local gChain = getChain(u)
-  local pChain = getChain(v)
+  local gChain = getChain(u, gWindowWidth)
+  local pChain = getChain(v, 5)
 
   groupJacobianZero(d)
 
@@ -0,0 +1,1103 @@
+-- Constants used in NIST P-384 algorithms.
+--
+-- Generated by script/generate-secp384r1-constants.py.
+-- Do not edit.
+
+local lib = {}
+
+-- The window width used to recode the scalar multiplying G.
+lib.gWindowWidth = 7
+
+-- {G, 3G, 5G, ..., 127G} in affine coordinates (Z = 1).
+lib.gWindow = {
+  { -- 1G
+    {
+      0x32760ab7, 0x295178e1, 0x355296c3, 0x00bc976f, 0x142a3855,
+      0x1d078209, 0x39b9859f, 0x0ed8a2e9, 0x2d746e1d, 0x1c7bcc82,
+      0x1378eb1c, 0x08afa2c1, 0x00aa87ca,
+    },
+    {
+      0x10ea0e5f, 0x290c75f2, 0x17e819d7, 0x182c7387, 0x30b8c00a,
+      0x28c44ed7, 0x2147ce9d, 0x076f4a26, 0x1c29f8f4, 0x22fe4a4b,
+      0x06f5d9e9, 0x12a5898b, 0x003617de,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 3G
+    {
+      0x0500c831, 0x0b5f971c, 0x026580d0, 0x022eeb94, 0x166da6b4,
+      0x13c9034d, 0x1cd06bea, 0x0e44080b, 0x3d98cb9d, 0x31f97f71,
+      0x21464793, 0x35181bfe, 0x00077a41,
+    },
+    {
+      0x0a2f1df1, 0x197ca180, 0x0b5d298b, 0x12af5af9, 0x111eacc2,
+      0x21303b70, 0x15aa5f76, 0x2d072144, 0x3c998520, 0x3a580aa7,
+      0x2837d0bb, 0x3282c310, 0x00c995f7,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 5G
+    {
+      0x036d84bc, 0x2af36f0e, 0x0a297e60, 0x220bd287, 0x2583b037,
+      0x19872f95, 0x18fc54f6, 0x39476ffe, 0x2467f208, 0x317a8097,
+      0x377573ca, 0x28b09471, 0x0011de24,
+    },
+    {
+      0x26c1713a, 0x211052af, 0x2e8fb331, 0x1dda1b42, 0x101aeb31,
+      0x2194ceda, 0x1dee88c9, 0x111dd535, 0x27c5284b, 0x1fa42803,
+      0x12d0f583, 0x31dd103e, 0x008fa696,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 7G
+    {
+      0x0fb6d0e1, 0x103c16d2, 0x1b9ebb20, 0x01549bd5, 0x3b1c508b,
+      0x233277e9, 0x25ffa2d5, 0x3a65fefa, 0x1ffead6f, 0x3afc8d3b,
+      0x388f29f8, 0x1cd97391, 0x00283c1d,
+    },
+    {
+      0x0512ef8c, 0x1199336b, 0x2a78f9e6, 0x3613b78c, 0x3d225630,
+      0x24b34076, 0x19729d9c, 0x3619fb5e, 0x10471a61, 0x3f6e305a,
+      0x388ba52e, 0x24187906, 0x009475c9,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 9G
+    {
+      0x1079118b, 0x31579118, 0x2e2b9535, 0x2214a2ff, 0x3b6e21c3,
+      0x2c7b8a17, 0x3d3bac6c, 0x3dca479b, 0x378f2216, 0x26e2c096,
+      0x33ef1bf2, 0x290126f2, 0x008f0a39,
+    },
+    {
+      0x2c664af8, 0x18b693e6, 0x3d51b682, 0x1d0fbfb7, 0x19b3029e,
+      0x1e2152bb, 0x000c6b76, 0x0f5f28f1, 0x29799a9b, 0x294c8b0e,
+      0x1d6452c4, 0x050e2d80, 0x0062c77e,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 11G
+    {
+      0x15b4ddd8, 0x18d5bced, 0x2fb81d62, 0x126d9b8e, 0x2d3f8c47,
+      0x27f45224, 0x3c37456c, 0x0d7b560d, 0x16c57fe9, 0x3b0a4120,
+      0x198da1ee, 0x389f69ee, 0x00099056,
+    },
+    {
+      0x38c5e0bb, 0x3576ea04, 0x3aaff357, 0x19b54498, 0x12a32554,
+      0x3e4fd06d, 0x363fd43f, 0x3bb637f0, 0x20396fc4, 0x15512b17,
+      0x39668850, 0x08d38c2a, 0x002e4c0c,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 13G
+    {
+      0x3b5cbce7, 0x2bc72878, 0x3d99f1ba, 0x397d106a, 0x311c139e,
+      0x1ef347c3, 0x3873f626, 0x2ffe7c07, 0x06ab9632, 0x1400bff3,
+      0x25bafdaf, 0x25ed9eba, 0x00a567ba,
+    },
+    {
+      0x36f429cc, 0x108e849c, 0x2218a7d6, 0x1af2e09c, 0x057d6677,
+      0x0a6f815e, 0x32ec0863, 0x165411a4, 0x0ecc5185, 0x051ebc59,
+      0x318644e4, 0x2ce627cc, 0x00de1b38,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 15G
+    {
+      0x1606860b, 0x2e21c06a, 0x0b6383b4, 0x12555e84, 0x3c4e9ca8,
+      0x07e7df69, 0x01c205b2, 0x1055bffc, 0x125522a9, 0x3047604d,
+      0x1058cc15, 0x322ccac0, 0x00b3d13f,
+    },
+    {
+      0x33f7bd62, 0x21756234, 0x284af509, 0x23493e2c, 0x1fbfd983,
+      0x04450dcf, 0x09af484d, 0x3128475d, 0x0b1beeba, 0x2c94d859,
+      0x2a61b049, 0x39f7e458, 0x00152919,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 17G
+    {
+      0x19ffcc03, 0x2bcea6b7, 0x2f1f486c, 0x004aa646, 0x1805f817,
+      0x185390b9, 0x341e6dcc, 0x3bec1cce, 0x1a32692b, 0x2ef2c4f8,
+      0x09600a5e, 0x08822d22, 0x00409995,
+    },
+    {
+      0x223b09a0, 0x29943bd7, 0x29680ecf, 0x36934bea, 0x2388b304,
+      0x25f49dfc, 0x2d0cd9b7, 0x34fe0022, 0x3598163a, 0x1652bd80,
+      0x19839474, 0x1dde0cc1, 0x005ecf94,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 19G
+    {
+      0x13f5d41b, 0x16679a1c, 0x0801c0e9, 0x32194418, 0x27aabf59,
+      0x242d0c11, 0x0d9b0123, 0x2fb32a1b, 0x0b77e07d, 0x288475d4,
+      0x0ab16858, 0x2ae44af2, 0x008d481d,
+    },
+    {
+      0x35e52245, 0x2656c1f9, 0x0004e646, 0x3fee9582, 0x1c0e8c11,
+      0x2ccbf5eb, 0x39aa0594, 0x06da2840, 0x1050b229, 0x3ca9819a,
+      0x0857be99, 0x3c048518, 0x00a1592f,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 21G
+    {
+      0x1eb77422, 0x09ad305d, 0x388fd646, 0x28dcc4f7, 0x02cdb746,
+      0x0d84dafd, 0x283f5f99, 0x242617e0, 0x06e16062, 0x048415f5,
+      0x347c7817, 0x3d38971b, 0x0027935d,
+    },
+    {
+      0x10c69f84, 0x35581bac, 0x0ef0c139, 0x1be3660e, 0x215b532b,
+      0x367139b1, 0x1c6b7585, 0x352bb01e, 0x3524a4f2, 0x0de63478,
+      0x0cd9ab1a, 0x0ed22635, 0x00380a1a,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 23G
+    {
+      0x284aac81, 0x39557af1, 0x37c4ab51, 0x2a402a47, 0x3f9aa484,
+      0x1d270c31, 0x13a78a68, 0x040bf50a, 0x1eb822c0, 0x12a00035,
+      0x023e741a, 0x2977c053, 0x003cb647,
+    },
+    {
+      0x0d5a2b14, 0x26d97fa8, 0x14b9be27, 0x2f887d90, 0x2d636809,
+      0x2fc155fa, 0x3c8377af, 0x31ec0862, 0x0cb46103, 0x217af706,
+      0x1d04966f, 0x1e6a3e23, 0x00283004,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 25G
+    {
+      0x3716be9a, 0x1bd06fa0, 0x1cb2ca44, 0x2a2962cf, 0x3da97431,
+      0x1d1af4a3, 0x0e0a3555, 0x35dbead7, 0x276207c4, 0x2d499e51,
+      0x2709ee9e, 0x32e460e9, 0x00e4c6d5,
+    },
+    {
+      0x26aac897, 0x3ebd535f, 0x049722cf, 0x2a55eeeb, 0x16a5a209,
+      0x02e2bf97, 0x22f20628, 0x38634564, 0x0ca95942, 0x3c59775d,
+      0x045c0027, 0x148ea95e, 0x00a37245,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 27G
+    {
+      0x23e2e546, 0x2d3bb7e8, 0x098e1b06, 0x1d86f056, 0x3a04e220,
+      0x2d27035e, 0x28d3a4ac, 0x2b2a8ad2, 0x370508e3, 0x356a0b22,
+      0x2623c316, 0x304fd063, 0x009c5fa2,
+    },
+    {
+      0x39f48752, 0x0a7ed591, 0x13f519b5, 0x3cb12c88, 0x1218e30e,
+      0x055946f6, 0x259556f0, 0x3c6df6a7, 0x3f6194fd, 0x0540f2de,
+      0x11a5afe8, 0x032c1d61, 0x00f641de,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 29G
+    {
+      0x1eb1a373, 0x1deee0ec, 0x17b1e279, 0x1a7901fd, 0x0dfca2ad,
+      0x1b413d35, 0x0de50fa4, 0x3d3d072f, 0x0ee56e0a, 0x20433955,
+      0x2ead7b75, 0x3e595b1b, 0x00f1bc35,
+    },
+    {
+      0x328faf29, 0x0f83417b, 0x3848a0e5, 0x3fa3d451, 0x30e8383f,
+      0x3dc25828, 0x0fc70531, 0x3b1ddb65, 0x33dc8d7a, 0x151f03ca,
+      0x1ccf733c, 0x1e9566f3, 0x00245849,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 31G
+    {
+      0x29eb28b9, 0x320d876e, 0x11b8a650, 0x07e9216f, 0x374e6206,
+      0x264c4934, 0x098c59d3, 0x0ccd8e53, 0x1446c73e, 0x284b021f,
+      0x3e804fcf, 0x1bc3a94c, 0x00f2e6f0,
+    },
+    {
+      0x3852680c, 0x054bd6e9, 0x2fc9ebf3, 0x2200b1b4, 0x0251cd3e,
+      0x02e6b045, 0x00d313fb, 0x06a1945e, 0x3bd14a04, 0x0984bf3f,
+      0x046f9e44, 0x1930802f, 0x008f86e4,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 33G
+    {
+      0x082c802a, 0x3bf5ffb1, 0x2dd3fe2a, 0x07abb65e, 0x3ec90d63,
+      0x11acfdc2, 0x354bdaf2, 0x09c561e7, 0x36c95549, 0x23c9dcee,
+      0x3bca9275, 0x208e3086, 0x0038dbd5,
+    },
+    {
+      0x26d333bb, 0x2668199c, 0x3bf43705, 0x0517a9ea, 0x3d9527d3,
+      0x1bcaaea6, 0x1f5f17b8, 0x129c5944, 0x130feff5, 0x38520dcf,
+      0x08912a77, 0x1a537e06, 0x00828c26,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 35G
+    {
+      0x2e1410ea, 0x2792b842, 0x33813ca2, 0x262dff5e, 0x19145dc9,
+      0x009c3961, 0x0f3ac55a, 0x16fd3dca, 0x25abc367, 0x0f5194d6,
+      0x3f99b986, 0x33b29263, 0x0077c12d,
+    },
+    {
+      0x1cbeef77, 0x15d1f822, 0x2f226733, 0x0317c2ef, 0x22b22cc2,
+      0x21e9233b, 0x34304004, 0x1fee2593, 0x269e396e, 0x0342f440,
+      0x13ad302f, 0x2f0d09db, 0x00eee351,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 37G
+    {
+      0x05de389d, 0x281c9cb4, 0x2fcb4482, 0x1ae8b672, 0x210654e5,
+      0x0db0048a, 0x0fcb941c, 0x2b079172, 0x2adcd850, 0x002bcb7a,
+      0x3e8fdb43, 0x386fa5b7, 0x001221b1,
+    },
+    {
+      0x139dd273, 0x0cffec86, 0x1bf67235, 0x13caa48c, 0x117ebb5f,
+      0x0c490623, 0x1d97db23, 0x14f76259, 0x26180599, 0x1838b885,
+      0x0381ad84, 0x3ea297b6, 0x0050b225,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 39G
+    {
+      0x28f8fedb, 0x16b1e5fa, 0x247b24d1, 0x20fa6f22, 0x24347c49,
+      0x1cb057c9, 0x3642c35b, 0x1742f4b4, 0x02de31c6, 0x0b73045c,
+      0x1678224c, 0x150d8988, 0x009bc6b6,
+    },
+    {
+      0x2bbcfcd4, 0x025e4c12, 0x185d888c, 0x35e66bb5, 0x2248bf6a,
+      0x1624c10e, 0x370c722e, 0x20860615, 0x3368dba1, 0x3b4247be,
+      0x0ec7147e, 0x24e12619, 0x004482f0,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 41G
+    {
+      0x07c76293, 0x03cfce7a, 0x294f76d1, 0x1ec1729a, 0x09b8c707,
+      0x0408d2d8, 0x1a18410d, 0x3515ac9e, 0x0b095185, 0x3b6482a2,
+      0x15c411a5, 0x0a45eb43, 0x002ce37b,
+    },
+    {
+      0x22a7607e, 0x3e29f5ef, 0x25d1dfdc, 0x36922d3e, 0x1227bb4d,
+      0x23db6e16, 0x03547820, 0x2dee23e0, 0x004fbab5, 0x1bd212b7,
+      0x3b9dabde, 0x381ee83a, 0x00bf27e3,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 43G
+    {
+      0x1a26a33d, 0x03777092, 0x3bebc678, 0x12690523, 0x05a605aa,
+      0x2377e91d, 0x25eb5aba, 0x0bbe5a26, 0x264f4de5, 0x3d2173d6,
+      0x12ca5a2f, 0x24447f89, 0x009c3adb,
+    },
+    {
+      0x07355061, 0x11000371, 0x1af74203, 0x2b96e05d, 0x0a6a32db,
+      0x27130042, 0x176634c6, 0x2e114bc1, 0x029a69dc, 0x202c8ad2,
+      0x0db50b9f, 0x17e04ebd, 0x0083e8d9,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 45G
+    {
+      0x3bfef50f, 0x16da295a, 0x04ea016a, 0x0f52477a, 0x0cd17cb0,
+      0x11270b8a, 0x393e3258, 0x31913f60, 0x209eadd9, 0x0efb13d1,
+      0x19c3bce4, 0x0450c747, 0x006ce3bf,
+    },
+    {
+      0x3c570471, 0x1b77a645, 0x21e5cfe3, 0x01768c90, 0x0777e081,
+      0x1d3f8af2, 0x24aa858d, 0x0038ded3, 0x2abd9188, 0x1d54e550,
+      0x04e7c760, 0x09d2c8d8, 0x00c3325e,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 47G
+    {
+      0x289a30fe, 0x149536c1, 0x22e6b2cd, 0x3a7a3330, 0x2384f121,
+      0x254c1d0a, 0x362c0e2a, 0x2fd931d9, 0x20bcc870, 0x3297e8c3,
+      0x1f1a06f4, 0x257aae97, 0x001273f5,
+    },
+    {
+      0x3d58f4ce, 0x2f6be658, 0x2dfc8b0c, 0x051e80cb, 0x01486ca7,
+      0x33890856, 0x283c213c, 0x38cab832, 0x349fa1af, 0x14b29a0a,
+      0x0cba0db5, 0x323f8206, 0x0062737f,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 49G
+    {
+      0x1a0e8cf2, 0x3690fa39, 0x1d03d1c9, 0x0a3d6c64, 0x11173488,
+      0x1365da92, 0x2d182dd7, 0x3314c00f, 0x1afd7486, 0x0cbf0484,
+      0x3f7f504f, 0x1674490f, 0x00a6c364,
+    },
+    {
+      0x0c63b40a, 0x39b76dda, 0x17b89f62, 0x286f02f1, 0x1ad25b38,
+      0x267d5e08, 0x365b4228, 0x0954fe8c, 0x31d00bd7, 0x04170a29,
+      0x1d91cebd, 0x337e5b1c, 0x0058279f,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 51G
+    {
+      0x20068fb0, 0x3f81beeb, 0x0d1b992f, 0x062a3302, 0x0b0341a6,
+      0x1bb4ed44, 0x0f2cc712, 0x0a8491fa, 0x35bc0b4a, 0x32788f0b,
+      0x2fba86d2, 0x1f691bf6, 0x008bc605,
+    },
+    {
+      0x222c2ce9, 0x32d65ee3, 0x16077f56, 0x31b42137, 0x0e970554,
+      0x3b480a67, 0x0ae0d42f, 0x39d65665, 0x185d777f, 0x08bf47c6,
+      0x260fbf2a, 0x09fda206, 0x00fea19f,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 53G
+    {
+      0x376e9fa3, 0x0240f275, 0x3dc08ac9, 0x0b28aa42, 0x3e20b6ff,
+      0x072f81f0, 0x169ba8f4, 0x0d6f757c, 0x340888e9, 0x0d4e4cb3,
+      0x3c592288, 0x04051059, 0x00a0e5cd,
+    },
+    {
+      0x1e9e587e, 0x3171556b, 0x14197aaf, 0x2772faa7, 0x37fd0a0c,
+      0x2fc2b85f, 0x2024ee7d, 0x1b250e85, 0x24bed639, 0x3d7079f3,
+      0x0feaa542, 0x25c63455, 0x00120de7,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 55G
+    {
+      0x3f2b4f85, 0x2ec95dc7, 0x2ee7c873, 0x342838b8, 0x21eb0130,
+      0x3d467bab, 0x112f5f22, 0x249693c0, 0x2b08f36d, 0x1939dd42,
+      0x107307d0, 0x1d55c6cd, 0x00a059cd,
+    },
+    {
+      0x29c8d6cc, 0x3b21ea95, 0x049bcd5a, 0x2031dae2, 0x0235aaa8,
+      0x0051f61e, 0x008ff0fa, 0x04d45559, 0x032efc31, 0x33aff37f,
+      0x370026d8, 0x18b169d7, 0x0040f6ae,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 57G
+    {
+      0x36ecb8bd, 0x0275a8e2, 0x2b104167, 0x3f4e08e8, 0x13227907,
+      0x2a996659, 0x21fc778b, 0x2e2c9c91, 0x3ece6c3e, 0x3261e72a,
+      0x1a84f1ce, 0x31fac435, 0x008654dd,
+    },
+    {
+      0x23578549, 0x219efaa3, 0x3b99b51b, 0x35b6f56a, 0x1c7e4088,
+      0x344f46a8, 0x17ea47d1, 0x2679923f, 0x09d07425, 0x1ebdd8fb,
+      0x28883056, 0x1b04424b, 0x00312706,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 59G
+    {
+      0x19fe20b0, 0x29df5c3e, 0x1f59772b, 0x3dec56ca, 0x275d8abb,
+      0x24f90796, 0x02b98a2b, 0x1a455a48, 0x1b0191e7, 0x12085db4,
+      0x21a4296f, 0x1ab67dc5, 0x00cc42cb,
+    },
+    {
+      0x1e24d63f, 0x29d354d1, 0x338781dd, 0x0a459d18, 0x14deb918,
+      0x05a337ed, 0x3895ec23, 0x08fd1278, 0x2685ea42, 0x39941a7e,
+      0x2d391646, 0x1aeb6145, 0x00bbd6bb,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 61G
+    {
+      0x3da2cc75, 0x30933042, 0x34071db5, 0x3969b47e, 0x072edcb5,
+      0x150b6fd6, 0x2011fa92, 0x25912d3e, 0x36895f72, 0x24030711,
+      0x1a2870b7, 0x079882a0, 0x000a1215,
+    },
+    {
+      0x05a3e83c, 0x04f855fb, 0x3fb8c48a, 0x3ee619d9, 0x1a069884,
+      0x164d146a, 0x1d9f1cf6, 0x3531d6ec, 0x280c4479, 0x091d6f02,
+      0x3b7e1500, 0x0a583aba, 0x00857c80,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 63G
+    {
+      0x2008f8af, 0x3f55d3df, 0x1ef5431a, 0x0558160f, 0x3c8f7b94,
+      0x1a33eee0, 0x18b333c9, 0x11da778d, 0x0a6cac33, 0x023d4593,
+      0x3112cae5, 0x3ae50aaa, 0x00b32e89,
+    },
+    {
+      0x04e11e2c, 0x206af825, 0x1e74a1ac, 0x36bb7fd6, 0x19009535,
+      0x3775e812, 0x2dc0679c, 0x3f122dcf, 0x3d5ba770, 0x3da580ff,
+      0x10324e2b, 0x1c59b65c, 0x00b1e3ae,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 65G
+    {
+      0x07d6c3e7, 0x37f7f274, 0x29cc18b6, 0x180a5e31, 0x29db68d1,
+      0x1ce912c9, 0x077ab512, 0x0a276573, 0x3542cec9, 0x1014c10c,
+      0x22bd452d, 0x2d73e456, 0x0088d136,
+    },
+    {
+      0x2d6f32c9, 0x045585c3, 0x0e754675, 0x37dfcdee, 0x30ebca42,
+      0x23f2e1b6, 0x085f9602, 0x38821bd1, 0x2a0c1b74, 0x0dfc5a53,
+      0x146e9add, 0x16c11407, 0x00bcb576,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 67G
+    {
+      0x360e52f1, 0x0a58b05e, 0x08944983, 0x0c0801a6, 0x19a89527,
+      0x1863ea15, 0x349a2eba, 0x1ecafbfe, 0x16c15ae8, 0x09c5e9e5,
+      0x0fd98873, 0x164bbd9c, 0x003df769,
+    },
+    {
+      0x1113ef3a, 0x3cb1eab7, 0x02b8135e, 0x1e9d1647, 0x3bb5c5f4,
+      0x0f6855f7, 0x3189e9cf, 0x33fdc7e9, 0x06145602, 0x3d4139d8,
+      0x04e9b457, 0x33748538, 0x00b0bed5,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 69G
+    {
+      0x209412d4, 0x31d3eb63, 0x1c63b6df, 0x086d2611, 0x1dcff917,
+      0x0cb3b8fb, 0x15f6daa7, 0x3c8b761f, 0x321077ab, 0x0f2b78e0,
+      0x02387ce9, 0x1776e71e, 0x00df8eb1,
+    },
+    {
+      0x0c258534, 0x21f3b48d, 0x1f4dc360, 0x093e7b09, 0x05aeb789,
+      0x3a481b44, 0x016a85d9, 0x10585eab, 0x3ad513d0, 0x02c56109,
+      0x221ef247, 0x3ae1f175, 0x0017801a,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 71G
+    {
+      0x056fb793, 0x140c4588, 0x3d5387a5, 0x14feffcb, 0x175725fe,
+      0x130b19c2, 0x37ba6f04, 0x3b96658d, 0x32471e24, 0x2c4aedb8,
+      0x28260042, 0x0effc9a3, 0x0030e318,
+    },
+    {
+      0x3185e15a, 0x193f0ab9, 0x257489cd, 0x27d7f8e1, 0x156a178e,
+      0x025e53e1, 0x2c937754, 0x36c07eac, 0x2ebb2ae2, 0x0b731181,
+      0x2c012263, 0x0ad7eed7, 0x006a1fff,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 73G
+    {
+      0x19da355c, 0x2fcfcbdc, 0x28963e5d, 0x1854ab93, 0x138d0c28,
+      0x104dcfda, 0x10fa6fd2, 0x23e7f981, 0x16f174b7, 0x1091a72a,
+      0x01a372f2, 0x1c0219bb, 0x00e28249,
+    },
+    {
+      0x2cd8c070, 0x1465d015, 0x0691f7cc, 0x3cbcb2f6, 0x2b261390,
+      0x0c72c432, 0x15c62c48, 0x23692fd8, 0x2e528d28, 0x25090eca,
+      0x09ccae3a, 0x383ebc98, 0x00997cd3,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 75G
+    {
+      0x0db731ea, 0x031adb37, 0x07c5b761, 0x3d3d75b0, 0x050ed466,
+      0x0a7a263d, 0x375ffc4c, 0x373454f8, 0x253babb0, 0x0bc12c43,
+      0x2347ce9b, 0x0dd907f6, 0x000f3ec6,
+    },
+    {
+      0x39843afa, 0x3dce28a8, 0x3fb16909, 0x18f6a7b4, 0x38243ecf,
+      0x184fb447, 0x0ad05ac5, 0x3a00fb41, 0x141d1f5c, 0x0db3da3a,
+      0x3c634bad, 0x01da75a8, 0x00512e00,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 77G
+    {
+      0x07e7ef95, 0x044d32c4, 0x3029c95c, 0x1327c3cb, 0x1c5b8e60,
+      0x3b829c44, 0x112f972b, 0x211ecac8, 0x2e6c42fa, 0x035b9f01,
+      0x178be0e8, 0x265293e0, 0x008366c4,
+    },
+    {
+      0x2395d26b, 0x263d8da3, 0x1ac49e5a, 0x09897b02, 0x18b3d6c6,
+      0x05830267, 0x04ed6f4b, 0x32420bd6, 0x3616d31a, 0x29926ee7,
+      0x3b446120, 0x029cf2fb, 0x00d94241,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 79G
+    {
+      0x227a09e1, 0x1bd75b5f, 0x3cc2cbad, 0x043068d1, 0x0ed8f7b2,
+      0x3d748888, 0x09bf0dc6, 0x04a0deee, 0x27e5e822, 0x01756836,
+      0x0c3b5b23, 0x0009c425, 0x00089320,
+    },
+    {
+      0x0f759e87, 0x3bb50c2c, 0x1a656028, 0x224a28fd, 0x223c8be0,
+      0x330519d0, 0x2a19cd28, 0x3443f343, 0x1536b6a5, 0x24758be5,
+      0x0c6577a5, 0x1dfc5026, 0x0023389b,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 81G
+    {
+      0x1072aa44, 0x21e8f91b, 0x1c9ea821, 0x2ea1df8b, 0x32fdbab1,
+      0x105bee3d, 0x05b48b1f, 0x33235727, 0x27861e28, 0x3f1df014,
+      0x0407e983, 0x04202c93, 0x00f0091b,
+    },
+    {
+      0x0fddcfb8, 0x162043e3, 0x1a08429b, 0x3b581dea, 0x3769f4e7,
+      0x01c75a6b, 0x16f8f352, 0x2333063c, 0x37a794ec, 0x0e95cbee,
+      0x3c882cd6, 0x2d5b0d47, 0x00022492,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 83G
+    {
+      0x1ec13d4e, 0x14c93b5b, 0x10a16727, 0x177ff8d2, 0x13f73bc1,
+      0x1380d361, 0x02712e35, 0x3a2157a7, 0x1a3acede, 0x33d99502,
+      0x163e5ab3, 0x039e1b69, 0x00e4c3d4,
+    },
+    {
+      0x343c3cdb, 0x141881c6, 0x0e206c28, 0x1480171f, 0x389a5226,
+      0x3ad34341, 0x0dbe6912, 0x220542aa, 0x31d5d335, 0x37bb1f2a,
+      0x2ece31d9, 0x371bc355, 0x004b4b1b,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 85G
+    {
+      0x01354b1c, 0x331ab1eb, 0x184edfb8, 0x1f9bd023, 0x34489054,
+      0x0e9fe9c9, 0x13bf80f6, 0x241ce6dc, 0x0ee9cba3, 0x2b616c68,
+      0x3ba60e5b, 0x2c502dce, 0x00e22e9e,
+    },
+    {
+      0x00501f82, 0x1fe1a404, 0x2bcf3abe, 0x0c61341c, 0x1af7d22d,
+      0x2af4d2d5, 0x05849e62, 0x1901494f, 0x0093a0bf, 0x3ad39f0c,
+      0x0797e8d6, 0x1ce08969, 0x0065c4cd,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 87G
+    {
+      0x2e21919a, 0x0802f26b, 0x1a2712c3, 0x18ae1ead, 0x18e1deab,
+      0x35f5ad80, 0x30ab7fb2, 0x1724cc8d, 0x28780c3e, 0x0dd3a5cd,
+      0x34c8092e, 0x1639c78d, 0x000d87a6,
+    },
+    {
+      0x19f1932a, 0x1535f09d, 0x1bd2f32f, 0x2590255c, 0x14dea0e1,
+      0x034404eb, 0x0a11221a, 0x064a4418, 0x373dde5c, 0x1aca4186,
+      0x2e01c0cc, 0x0a05b9c2, 0x00472daa,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 89G
+    {
+      0x3582d838, 0x14af97bd, 0x2b998b37, 0x01c9f6ea, 0x08cc82aa,
+      0x367f0029, 0x1ac5c90e, 0x0dc718c5, 0x2d8f4fa8, 0x103f394a,
+      0x3f8b08d3, 0x0ac506b0, 0x00c6f0e5,
+    },
+    {
+      0x319512f2, 0x00d09b48, 0x2d7b2ea8, 0x1c54dc26, 0x317aba7a,
+      0x3ec75309, 0x06f52386, 0x04ae2f44, 0x0902909a, 0x304359c9,
+      0x1f8fe1a4, 0x1dda53c0, 0x00040a8f,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 91G
+    {
+      0x1da9cdf8, 0x39112230, 0x2894df9c, 0x0e2b45c3, 0x3ed257f3,
+      0x3b990332, 0x0eb2d67b, 0x3b8dbcba, 0x34552e1a, 0x2c394de5,
+      0x15ae0b8d, 0x00d2e9c9, 0x00b52215,
+    },
+    {
+      0x0fab54bf, 0x1789101a, 0x01487605, 0x3a9eab63, 0x183f14d1,
+      0x0e016e0a, 0x37ddffac, 0x0828f325, 0x25ab6c6b, 0x2cb6271f,
+      0x38bcd769, 0x102162b0, 0x00d72284,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 93G
+    {
+      0x1498007c, 0x235bb930, 0x28b88969, 0x1a69db1f, 0x236b1c8b,
+      0x22bb8566, 0x0b24f848, 0x057c2126, 0x0d464abc, 0x0a7cf185,
+      0x13661390, 0x2cb53bb7, 0x00cf04cf,
+    },
+    {
+      0x1508f7c6, 0x1496dbdf, 0x1e75b6de, 0x1eec4904, 0x28910db4,
+      0x2c8c57ab, 0x125e6cf8, 0x0d3e7cbb, 0x29bb8e34, 0x284d918b,
+      0x03c6905d, 0x0593a907, 0x001c7ef1,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 95G
+    {
+      0x319b9882, 0x36223a3e, 0x21cfa3b1, 0x00ac5199, 0x36a61d06,
+      0x2fe084ba, 0x0a0caa25, 0x1f9c9029, 0x0414d2e0, 0x1b7abd34,
+      0x185f1c77, 0x39038b4a, 0x0044f3d6,
+    },
+    {
+      0x301cef8a, 0x1640993f, 0x1bfa65d6, 0x02fa0708, 0x0bd8411a,
+      0x160945b1, 0x10f06388, 0x1b84831d, 0x2778ffe6, 0x103ac302,
+      0x364d0fc6, 0x1fc1e003, 0x00124645,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 97G
+    {
+      0x3e611017, 0x29a2223f, 0x374c8850, 0x29573a79, 0x290a00c4,
+      0x293a19ca, 0x2232dbf2, 0x041cd7e5, 0x0e017405, 0x05a3b8e1,
+      0x2475729c, 0x27e6a703, 0x00c466ca,
+    },
+    {
+      0x30aa4f67, 0x18e1b3a9, 0x164edcbb, 0x3843a380, 0x2aa3aa6c,
+      0x3a1e9acd, 0x3c4de7b2, 0x00cc112a, 0x0143a0c7, 0x2540dc8d,
+      0x147c3871, 0x18a8c120, 0x004ee0f4,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 99G
+    {
+      0x39ce8be4, 0x00489549, 0x229c7e0e, 0x2413c67c, 0x06508501,
+      0x37707833, 0x3183aa92, 0x30d895e0, 0x2d7c993d, 0x1cb5988d,
+      0x1cb3a0f2, 0x3b411d9b, 0x0069a19b,
+    },
+    {
+      0x133d3804, 0x09b9aab6, 0x3cea8cf2, 0x146eb529, 0x39f901b5,
+      0x2f5338d4, 0x1114d550, 0x2c90af71, 0x320adabc, 0x3e831a3f,
+      0x3cdd3339, 0x02db37cf, 0x00cf7405,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 101G
+    {
+      0x1851aba4, 0x077325fc, 0x26a107e6, 0x0868464a, 0x37a1317a,
+      0x2ed69ff6, 0x3d52bcce, 0x0a509255, 0x19798e74, 0x0b6c2dc9,
+      0x148920c6, 0x130d821e, 0x001a4589,
+    },
+    {
+      0x0faf043d, 0x021e7412, 0x2c60ac29, 0x072395f0, 0x0d393242,
+      0x0aa4653c, 0x1304855f, 0x39206058, 0x033a2afa, 0x3d1f2027,
+      0x05c81514, 0x35bafe07, 0x006c7aa1,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 103G
+    {
+      0x27f5125e, 0x0cfb489c, 0x07ee5dc5, 0x191f79d6, 0x3716f053,
+      0x3f4d8dd3, 0x2ed22b20, 0x34542842, 0x3a09e700, 0x0a1a8f50,
+      0x05b61f3f, 0x23cf93d1, 0x000c87e1,
+    },
+    {
+      0x2a18c5c9, 0x26c0ed65, 0x116366bb, 0x3e954fa8, 0x38bf3c9e,
+      0x0c971ad0, 0x340ab57f, 0x1f6ed3a5, 0x1e0a0553, 0x34f89c2e,
+      0x2c557640, 0x0ddd7b4a, 0x00562c80,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 105G
+    {
+      0x370c2403, 0x22bd2581, 0x0a1ff499, 0x01b3e4fd, 0x35aba036,
+      0x015ccdf1, 0x2979d444, 0x3b69e9c4, 0x10165f98, 0x1a26e58d,
+      0x1e0d03cd, 0x1758df48, 0x001b2c22,
+    },
+    {
+      0x1f06cf00, 0x322f1a26, 0x20307feb, 0x382eaee5, 0x3bf7d6e6,
+      0x2b5f9115, 0x198a4250, 0x389167a8, 0x2bad6016, 0x31a82afc,
+      0x12615cda, 0x17e127a9, 0x00e6037e,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 107G
+    {
+      0x0a741bc1, 0x0afc73c0, 0x247a0b75, 0x13a95d8b, 0x1311b0b1,
+      0x1664f1eb, 0x281e3bc8, 0x123d5f2b, 0x342a345f, 0x154d76be,
+      0x1c27514e, 0x0700dec9, 0x00e90276,
+    },
+    {
+      0x35b5aa8a, 0x10440b7b, 0x17cbe9cb, 0x2d19c612, 0x186aafc2,
+      0x0070f879, 0x0d54aaca, 0x2f3a0e2a, 0x043352f4, 0x088d3cff,
+      0x1e34bd07, 0x37bacbf3, 0x009a7df3,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 109G
+    {
+      0x3707b545, 0x124e2bef, 0x13d06cbc, 0x2daaa29c, 0x1da7a241,
+      0x22543471, 0x35b65b42, 0x3755ef8a, 0x192f62a4, 0x13c12fba,
+      0x036166c3, 0x1ab9b6c8, 0x00a683d1,
+    },
+    {
+      0x3ac8415d, 0x04c3311d, 0x393523d5, 0x0eedc538, 0x318a38d3,
+      0x1467daaa, 0x080f1f92, 0x3b981bf8, 0x3f9955ab, 0x3bfcc546,
+      0x2b2502db, 0x03a90b71, 0x0011f485,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 111G
+    {
+      0x273d4af8, 0x0ce6b9ac, 0x2ec9a3d2, 0x2dc1c6f9, 0x1e766433,
+      0x20c31138, 0x0cbd88e0, 0x3790ca8f, 0x1d996c68, 0x31386d12,
+      0x14726901, 0x09d26a18, 0x00635390,
+    },
+    {
+      0x0c415011, 0x3e10ff1a, 0x3bf9db27, 0x2034bfa2, 0x2555b62a,
+      0x24bfda78, 0x1e6f31f2, 0x2fad9246, 0x1307d973, 0x0f58fc98,
+      0x3d69d2e4, 0x2020b20e, 0x0073f8e1,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 113G
+    {
+      0x15ac615c, 0x0a3b777b, 0x20421ebe, 0x053185bc, 0x3d6aa020,
+      0x36262776, 0x1a016e22, 0x2f60c7de, 0x2a1ba438, 0x2dfdc735,
+      0x36bba821, 0x393d9599, 0x0066f00c,
+    },
+    {
+      0x346a5f13, 0x184886f7, 0x0b8e8100, 0x34f95055, 0x2187a334,
+      0x346c7d50, 0x2999f5ea, 0x1271ff61, 0x1e5ca646, 0x2c6894c0,
+      0x3fe060b3, 0x32ee0d7a, 0x008dcac1,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 115G
+    {
+      0x24c0767e, 0x3ad02f35, 0x02bfbca6, 0x35bf007d, 0x35a69bb5,
+      0x2b73fbbd, 0x168a0c5e, 0x3aa72767, 0x2e487bef, 0x0ba7a951,
+      0x3da0b105, 0x169934e5, 0x0025dba8,
+    },
+    {
+      0x31e8657d, 0x14bb592b, 0x0b654c38, 0x1039e439, 0x0b1e2525,
+      0x17214610, 0x006420aa, 0x191a3c4e, 0x1cf5f086, 0x3254c39e,
+      0x3c5aa0c6, 0x1765ea04, 0x0036ffd0,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 117G
+    {
+      0x26737f2a, 0x2c164df3, 0x24d1f3e4, 0x20133e00, 0x1b51ac65,
+      0x3d65349e, 0x253ffdcc, 0x02f166dd, 0x1b1eec50, 0x26002e48,
+      0x045e4c6d, 0x0bb548f4, 0x00cfa91e,
+    },
+    {
+      0x0731c73a, 0x1ba246ee, 0x01c5c779, 0x37a65b01, 0x20132d99,
+      0x2370d171, 0x13ae259b, 0x06f625fb, 0x04d19ba1, 0x0cf695e6,
+      0x3f62e27d, 0x3f1f5284, 0x00ac800d,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 119G
+    {
+      0x28f1f4c1, 0x0d8c8b92, 0x168587d6, 0x3242b331, 0x28b08db1,
+      0x2ffa0d03, 0x2246a962, 0x095fc4cd, 0x2b3afe1e, 0x20184e99,
+      0x3937d5ac, 0x0c416460, 0x00c6c94f,
+    },
+    {
+      0x01aaeeac, 0x199cd975, 0x04720aa4, 0x156568f0, 0x1d8c4550,
+      0x12750a4e, 0x3a76db73, 0x14514ee9, 0x1f6063ea, 0x3172ace7,
+      0x17752794, 0x3e8f49fe, 0x00df68fe,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 121G
+    {
+      0x0d9e105c, 0x2f4d39b3, 0x34af4850, 0x27e32873, 0x1c11cc44,
+      0x2f4baaf9, 0x36e47ad8, 0x370362d9, 0x2f3708dc, 0x2a68c07b,
+      0x3c65d0ae, 0x2800561e, 0x004229ef,
+    },
+    {
+      0x0460db77, 0x252fe4b7, 0x233e76ca, 0x10af0cbc, 0x08641e1c,
+      0x24bb0b76, 0x194fa457, 0x3f6a721c, 0x0646de18, 0x020eccf7,
+      0x2f5ec901, 0x29c314a1, 0x008caab0,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 123G
+    {
+      0x16749836, 0x00cac276, 0x1a8138e1, 0x14a428ea, 0x290fc360,
+      0x1dcc850a, 0x0cbcfea8, 0x24da96f7, 0x2957de9e, 0x1f7c19c8,
+      0x34b94e4e, 0x3b1f1182, 0x00257f9d,
+    },
+    {
+      0x2c1915cd, 0x0f2e3300, 0x24cf0072, 0x130184d8, 0x3ecad9be,
+      0x37276141, 0x2d148bfc, 0x24b8b2d8, 0x0d63f546, 0x3cbe9d5b,
+      0x1e11fe0e, 0x21de6c45, 0x0051d818,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 125G
+    {
+      0x216ded14, 0x198bfda4, 0x0aed5ebe, 0x077e960f, 0x0f4cbdf4,
+      0x01327ebe, 0x29face8c, 0x206bd7f0, 0x2bfdcbc7, 0x2d78db7b,
+      0x2b06932e, 0x2d60de04, 0x0084847f,
+    },
+    {
+      0x238f527b, 0x2c0d8d66, 0x259d071d, 0x35b3c8b0, 0x3aac2776,
+      0x2018d4ad, 0x1aaf465c, 0x3da2524e, 0x1c2e84b9, 0x09428e02,
+      0x19e71549, 0x37059513, 0x00774d7a,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+  { -- 127G
+    {
+      0x0b2327f1, 0x12d174a9, 0x33d9d93e, 0x1bb44046, 0x2d5d9d43,
+      0x35feefe8, 0x033a5ca5, 0x22bf62c7, 0x1e41af34, 0x2fef062a,
+      0x30d153c9, 0x107a894e, 0x00354960,
+    },
+    {
+      0x33426158, 0x00ab6872, 0x3c171b9b, 0x30f3a6e9, 0x22de8f8e,
+      0x1415f1f5, 0x1b6c330a, 0x33899be7, 0x19ae8dd2, 0x02745918,
+      0x01d69d9e, 0x2a93ff77, 0x0073ce1e,
+    },
+    {
+      0x00000001, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+      0x00000000, 0x00000000, 0x00000000,
+    },
+  },
+}
+
+return lib
@@ -981,6 +981,14 @@ do
 
     return parser:parse(certAsn)
   end
+
+  function lib.parseSubjectPublicKeyInfoFromAsn(pkInfoAsn)
+    local parser = setmetatable({
+      __path = {},
+    }, meta)
+
+    return parser:parseSubjectPublicKeyInfo(pkInfoAsn)
+  end
 end
 
 return lib
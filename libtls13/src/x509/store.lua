@@ -0,0 +1,177 @@
+-- Trust stores built by script/build-trust-store.py.
+--
+-- Opening a store only reads its index. The anchors for a name are found by a
+-- binary search over the index, and only their records are read; the
+-- certificates are decoded when asked for.
+
+local asn = require("tls13.asn")
+local sha2 = require("tls13.crypto.hash.sha2")
+local x509 = require("tls13.x509")
+
+local lib = {}
+
+local headerFormat = ">c4I4"
+local headerSize = 8
+local indexEntryFormat = ">c8I4I4"
+local indexEntrySize = 16
+local recordFormat = ">s2I2I2I2I2s3"
+
+-- Returns the index key of a name given its DER encoding.
+function lib.subjectKey(subject)
+  return sha2.sha256():update(subject):finish():sub(1, 8)
+end
+
+local anchorMeta = {
+  __index = {
+    -- Returns the SubjectPublicKeyInfo, parsed as by the X.509 parser.
+    getPublicKeyInfo = function(self)
+      if not self.__publicKeyInfo then
+        local pkInfoAsn, err = asn.decode(self.publicKeyInfoDer)
+
+        if not pkInfoAsn then
+          return nil, err
+        end
+
+        local pkInfo, err = x509.parseSubjectPublicKeyInfoFromAsn(pkInfoAsn)
+
+        if not pkInfo then
+          return nil, err
+        end
+
+        self.__publicKeyInfo = pkInfo
+      end
+
+      return self.__publicKeyInfo
+    end,
+
+    -- Returns the parsed certificate.
+    getCertificate = function(self)
+      if not self.__certificate then
+        local certAsn, err = asn.decode(self.certificateDer)
+
+        if not certAsn then
+          return nil, err
+        end
+
+        local cert, err = x509.parseCertificateFromAsn(certAsn)
+
+        if not cert then
+          return nil, err
+        end
+
+        self.__certificate = cert
+      end
+
+      return self.__certificate
+    end,
+  },
+}
+
+local function decodeRecord(record)
+  local label, subjectStart, subjectLength, pkInfoStart, pkInfoLength, der =
+    recordFormat:unpack(record)
+
+  return setmetatable({
+    label = label,
+    subjectDer = der:sub(subjectStart + 1, subjectStart + subjectLength),
+    publicKeyInfoDer = der:sub(pkInfoStart + 1, pkInfoStart + pkInfoLength),
+    certificateDer = der,
+  }, anchorMeta)
+end
+
+-- Opens a trust store file.
+--
+-- Returns an object with the following fields:
+--
+-- - count: the number of anchors.
+-- - find(subject): returns the anchors whose subject name is encoded as
+--   `subject` (a DER-encoded Name, e.g. the issuer of a certificate) as a
+--   list, possibly empty.
+-- - close(): closes the file.
+--
+-- An anchor has the fields `label`, `subjectDer`, `publicKeyInfoDer` and
+-- `certificateDer`, and the methods `getPublicKeyInfo()` and
+-- `getCertificate()`, which parse the DER on first use.
+function lib.openTrustStore(path)
+  local f, err = io.open(path, "rb")
+
+  if not f then
+    return nil, err
+  end
+
+  local header = f:read(headerSize)
+
+  if not header or #header < headerSize then
+    f:close()
+
+    return nil, "not a trust store"
+  end
+
+  local magic, count = headerFormat:unpack(header)
+
+  if magic ~= "TST1" then
+    f:close()
+
+    return nil, "not a trust store"
+  end
+
+  -- the index stays a single string: it's searched in place.
+  local index = f:read(count * indexEntrySize) or ""
+
+  if #index < count * indexEntrySize then
+    f:close()
+
+    return nil, "the trust store is truncated"
+  end
+
+  local store = {count = count}
+
+  local function entry(i)
+    return indexEntryFormat:unpack(index, (i - 1) * indexEntrySize + 1)
+  end
+
+  function store.find(subject)
+    local key = lib.subjectKey(subject)
+
+    -- the first entry with a key not less than the one sought
+    local lo, hi = 1, count + 1
+
+    while lo < hi do
+      local mid = (lo + hi) // 2
+
+      if entry(mid) < key then
+        lo = mid + 1
+      else
+        hi = mid
+      end
+    end
+
+    local anchors = {}
+
+    for i = lo, count, 1 do
+      local entryKey, offset, size = entry(i)
+
+      if entryKey ~= key then
+        break
+      end
+
+      assert(f:seek("set", offset))
+      local anchor = decodeRecord(assert(f:read(size)))
+
+      -- the keys are truncated hashes.
+      if anchor.subjectDer == subject then
+        table.insert(anchors, anchor)
+      end
+    end
+
+    return anchors
+  end
+
+  function store.close()
+    f:close()
+  end
+
+  return store
+end
+
+return lib
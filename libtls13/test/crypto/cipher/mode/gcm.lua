@@ -1,5 +1,7 @@
 local util = require("util")
 
+local testUtil = require("test.test-util")(_ENV)
+
 context("AES-GCM tests #crypto #cipher #gcm #aes", function()
   local aes = require("crypto.cipher.aes")
   local gcm = require("crypto.cipher.mode.gcm")
@@ -302,15 +304,7 @@ context("AES-GCM tests #crypto #cipher #gcm #aes", function()
       end
     end
 
-    -- eh.
-    local json = dofile("third-party/json.lua/json.lua")
-
-    local f =
-      io.open("third-party/wycheproof/testvectors/aes_gcm_test.json", "r")
-    local aesGcmTestJson = f:read("a")
-    f:close()
-
-    local data = json.decode(aesGcmTestJson)
+    local data = testUtil.loadWycheproof("aes_gcm_test.json")
 
     for _, group in ipairs(data.testGroups) do
       if group.tagSize == 128
@@ -1,5 +1,54 @@
 local util = require("tls13.util")
 
+local testUtil = require("test.test-util")(_ENV)
+
+-- Defines tests for the messages listed in a data file produced by
+-- `generate-sha-hashes.py --stream`.
+--
+-- Each line is `<seed> <length> <update sizes> <digest>`: the message is the
+-- first <length> bytes of testUtil.makePrng(<seed>), and it's passed to the
+-- hasher in pieces of the given sizes (repeated as necessary), or all at once
+-- if the sizes are `-`. The message is generated piece by piece too.
+local function makeStreamTests(hasher, path)
+  for line in io.lines(path) do
+    local seed, length, sizes, expectedHash =
+      line:match("(%d+) (%d+) (%S+) (%x+)")
+    seed, length = tonumber(seed), tonumber(length)
+
+    local updateSizes = {}
+
+    for size in sizes:gmatch("%d+") do
+      table.insert(updateSizes, tonumber(size))
+    end
+
+    if #updateSizes == 0 then
+      updateSizes[1] = math.max(length, 1)
+    end
+
+    local name = ("%d-byte message, updates of %s"):format(length, sizes)
+
+    if length >= 1 << 20 then
+      name = name .. " #long"
+    end
+
+    test(name, function()
+      local prng = testUtil.makePrng(seed)
+      local h = hasher()
+      local remaining = length
+      local i = 1
+
+      while remaining > 0 do
+        local size = math.min(updateSizes[i], remaining)
+        h:update(prng.read(size))
+        remaining = remaining - size
+        i = i % #updateSizes + 1
+      end
+
+      assert.are.equal(expectedHash, util.toHex(h:finish()))
+    end)
+  end
+end
+
 context("SHA2-256 tests #crypto #hash #sha2 #sha2-256", function()
   local sha2 = require("tls13.crypto.hash.sha2")
 
@@ -25,6 +74,10 @@ context("SHA2-256 tests #crypto #hash #sha2 #sha2-256", function()
     )
   end)
 
+  context("streamed messages from data/sha256-stream.txt", function()
+    makeStreamTests(sha2.sha256, "./test/data/sha256-stream.txt")
+  end)
+
   context("messages from data/sha256.txt", function()
     for line in io.lines("./test/data/sha256.txt") do
       local inputHex, expectedHash = line:match("(%S+) (%S+)")
@@ -75,6 +128,10 @@ context("SHA2-384 tests #crypto #hash #sha2 #sha2-384", function()
     )
   end)
 
+  context("streamed messages from data/sha384-stream.txt", function()
+    makeStreamTests(sha2.sha384, "./test/data/sha384-stream.txt")
+  end)
+
   context("messages from data/sha384.txt", function()
     for line in io.lines("./test/data/sha384.txt") do
       local inputHex, expectedHash = line:match("(%S+) (%S+)")
@@ -125,6 +182,10 @@ context("SHA2-512 tests #crypto #hash #sha2 #sha2-512", function()
     )
   end)
 
+  context("streamed messages from data/sha512-stream.txt", function()
+    makeStreamTests(sha2.sha512, "./test/data/sha512-stream.txt")
+  end)
+
   context("messages from data/sha512.txt", function()
     for line in io.lines("./test/data/sha512.txt") do
       local inputHex, expectedHash = line:match("(%S+) (%S+)")
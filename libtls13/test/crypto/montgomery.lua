@@ -1,8 +1,44 @@
+local testUtil = require("test.test-util")(_ENV)
+
 context(
   "Big integer arithmetic and modular exponentiation tests #crypto #montgomery",
   function()
     local montgomery = require("tls13.crypto.montgomery")
 
+    -- Calls f with the operands of every case in the test data file.
+    --
+    -- Prefers test/data/<name>.bin (see script/vecfile.py), which is faster to
+    -- read and can be split into shards with TEST_SHARD, and falls back to the
+    -- hex text file test/data/<name>.txt.
+    local function forEachCase(name, operandCount, f)
+      local vecFile = testUtil.openVecFile("test/data/" .. name .. ".bin")
+
+      if vecFile then
+        local first, last = testUtil.shardRange(vecFile.count)
+
+        for i = first, last, 1 do
+          f(vecFile.case(i))
+        end
+
+        vecFile.close()
+
+        return
+      end
+
+      local pattern = ("(%x+)"):rep(operandCount, " ")
+
+      for line in io.lines("test/data/" .. name .. ".txt") do
+        local operands = {line:match(pattern)}
+        assert(#operands == operandCount)
+
+        for i = 1, operandCount, 1 do
+          operands[i] = montgomery.fromHex(operands[i])
+        end
+
+        f(table.unpack(operands, 1, operandCount))
+      end
+    end
+
     context("64-by-32 division #div64by32", function()
       test("manual tests", function()
         assert.are.equal(
@@ -75,18 +111,23 @@ context(
       )
     end)
 
-    test("big integer remainder operation #modVecVec #long", function()
-      for line in io.lines("test/data/mod-vec-vec.txt") do
-        local x, y, remainder = line:match("(%x+) (%x+) (%x+)")
-        x = montgomery.fromHex(x)
-        y = montgomery.fromHex(y)
-        remainder = montgomery.fromHex(remainder)
+    test("big integer remainder by a power of two #modVecVec", function()
+      assert.are.equal(
+        "23456789abcdef0",
+        montgomery.toHex(montgomery.__internal.modVecVec(
+          montgomery.fromHex("123456789abcdef0"),
+          montgomery.fromHex("1000000000000000")
+        ))
+      )
+    end)
 
+    test("big integer remainder operation #modVecVec #long", function()
+      forEachCase("mod-vec-vec", 3, function(x, y, remainder)
         assert.are.equal(
           montgomery.toHex(remainder),
           montgomery.toHex(montgomery.__internal.modVecVec(x, y))
         )
-      end
+      end)
     end)
 
     context("modular exponentiation #modpow", function()
@@ -138,19 +179,25 @@ context(
         )
       end)
 
-      test("numbers from data/modpow.txt #long", function()
-        for line in io.lines("test/data/modpow.txt") do
-          local x, y, mod, result = line:match("(%x+) (%x+) (%x+) (%x+)")
-          x = montgomery.fromHex(assert(x))
-          y = montgomery.fromHex(assert(y))
-          mod = montgomery.fromHex(assert(mod))
-          result = montgomery.fromHex(assert(result))
+      test("modulus close to a power of two", function()
+        -- R² mod m is much shorter than m here.
+        assert.are.equal(
+          "f3",
+          montgomery.toHex(montgomery.modPowOdd(
+            montgomery.fromHex("3"),
+            montgomery.fromHex("5"),
+            montgomery.fromHex("ffffffffffffffff")
+          ))
+        )
+      end)
 
+      test("numbers from data/modpow.txt #long", function()
+        forEachCase("modpow", 4, function(x, y, mod, result)
           assert.are.equal(
             montgomery.toHex(result),
             montgomery.toHex(montgomery.modPowOdd(x, y, mod))
           )
-        end
+        end)
       end)
     end)
   end
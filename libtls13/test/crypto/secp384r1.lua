@@ -235,6 +235,27 @@ context("NIST P-384 tests #crypto #secp384r1", function()
   end)
 
   context("ECDSA verification #ecdsa #ecdsaSha384", function()
+    context("Signature corpus", function()
+      local f = io.open("test/data/ecdsa-p384.json", "r")
+      local encodedTests = f:read("a")
+      f:close()
+
+      local tests = testUtil.json.decode(encodedTests)
+
+      for _, testSpec in ipairs(tests["ecdsa-sha384"]) do
+        test(("Test %d: %s"):format(testSpec.id, testSpec.name), function()
+          local valid = secp384r1.ecdsaVerifySha384(
+            util.fromHex(testSpec.message),
+            util.fromHex(testSpec.r),
+            util.fromHex(testSpec.s),
+            util.fromHex(testSpec.publicKey)
+          )
+
+          assert.are.equal(testSpec.valid, valid == true)
+        end)
+      end
+    end)
+
     context("Project Wycheproof test vectors", function()
       local function checkSignature(publicKey, message, signature)
         local sr, ss = sigalg.decodeEcdsaSignature(signature)
@@ -1,16 +1,41 @@
 return function(_ENV)
-  local json = dofile("third-party/json.lua/json.lua")
+  -- json.lua comes from a submodule, so it's only loaded when a test uses
+  -- lib.json: the tests that don't can run without it.
+  local lib = setmetatable({}, {
+    __index = function(self, key)
+      if key == "json" then
+        self.json = dofile("third-party/json.lua/json.lua")
 
-  local lib = {}
+        return self.json
+      end
+    end,
+  })
 
-  lib.json = json
+  -- Loads a Project Wycheproof test vector file.
+  --
+  -- Uses the fixture built by script/build-wycheproof-fixtures.py, which only
+  -- has the groups the tests use, if there's one. Otherwise, or if
+  -- WYCHEPROOF_JSON is set, decodes the JSON file from the submodule.
+  function lib.loadWycheproof(file)
+    if not os.getenv("WYCHEPROOF_JSON") then
+      local fixture = "test/data/wycheproof/" .. file:gsub("%.json$", ".lua")
+      local chunk = loadfile(fixture, "t", {})
+
+      if chunk then
+        return chunk()
+      end
+    end
 
-  function lib.makeWycheproofTests(args)
     local f =
-      assert(io.open("third-party/wycheproof/testvectors/" .. args.file, "r"))
+      assert(io.open("third-party/wycheproof/testvectors/" .. file, "r"))
     local testJson = f:read("a")
     f:close()
-    local tests = json.decode(testJson)
+
+    return lib.json.decode(testJson)
+  end
+
+  function lib.makeWycheproofTests(args)
+    local tests = lib.loadWycheproof(args.file)
 
     for _, testGroup in ipairs(tests.testGroups) do
       local groupData = args.prepareGroupData and args.prepareGroupData(testGroup)
@@ -39,5 +64,104 @@ return function(_ENV)
     end
   end
 
+  -- Opens a binary test vector file (see script/vecfile.py).
+  --
+  -- Returns `nil` if the file does not exist. Otherwise returns an object with
+  -- the following fields:
+  --
+  -- - count: the number of cases.
+  -- - case(i): reads the operands of case i, as arrays of 32-bit words.
+  -- - close(): closes the file.
+  function lib.openVecFile(path)
+    local f = io.open(path, "rb")
+
+    if not f then
+      return nil
+    end
+
+    local magic, count, operandCount = ("<c4I4I4"):unpack(f:read(12))
+    assert(magic == "VEC1", path .. " is not a test vector file")
+
+    local index = {}
+
+    for i = 1, count, 1 do
+      index[i] = (("<I4"):unpack(f:read(4)))
+    end
+
+    local vecFile = {count = count}
+
+    function vecFile.case(i)
+      assert(f:seek("set", index[i]))
+      local operands = {}
+
+      for j = 1, operandCount, 1 do
+        local wordCount = ("<I4"):unpack(f:read(4))
+        local format = "<" .. ("I4"):rep(wordCount)
+        local words = {format:unpack(f:read(4 * wordCount))}
+        -- the last value is the position after the unpacked data.
+        words[#words] = nil
+        operands[j] = words
+      end
+
+      return table.unpack(operands, 1, operandCount)
+    end
+
+    function vecFile.close()
+      f:close()
+    end
+
+    return vecFile
+  end
+
+  -- Creates a deterministic byte stream (SplitMix64) from an integer seed.
+  --
+  -- The same generator is implemented in script/generate-sha-hashes.py.
+  -- Returns an object whose read(n) method returns the next n bytes.
+  function lib.makePrng(seed)
+    local state = seed
+    local buf = ""
+    local prng = {}
+
+    function prng.read(n)
+      local parts = {buf}
+      local available = #buf
+
+      while available < n do
+        state = state + 0x9e3779b97f4a7c15
+        local z = state
+        z = (z ~ z >> 30) * 0xbf58476d1ce4e5b9
+        z = (z ~ z >> 27) * 0x94d049bb133111eb
+        parts[#parts + 1] = ("<i8"):pack(z ~ z >> 31)
+        available = available + 8
+      end
+
+      local data = table.concat(parts)
+      buf = data:sub(n + 1)
+
+      return data:sub(1, n)
+    end
+
+    return prng
+  end
+
+  -- Returns the range of case indices [first, last] to run out of count,
+  -- as selected by the TEST_SHARD environment variable.
+  --
+  -- TEST_SHARD has the form "k/n" and selects the k-th of n equal slices
+  -- (1 ≤ k ≤ n). If it's unset, all cases are run.
+  function lib.shardRange(count)
+    local shard = os.getenv("TEST_SHARD")
+
+    if not shard or shard == "" then
+      return 1, count
+    end
+
+    local k, n = shard:match("^(%d+)/(%d+)$")
+    k, n = tonumber(k), tonumber(n)
+    assert(k and 1 <= k and k <= n, "TEST_SHARD must be of the form k/n")
+
+    return (k - 1) * count // n + 1, k * count // n
+  end
+
   return lib
 end
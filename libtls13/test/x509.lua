@@ -53,6 +53,54 @@ context("X.509 certificate parser tests #x509", function()
     end
   end)
 
+  context("Trust store", function()
+    local store = require("tls13.x509.store")
+
+    local certs = loadPemFile("test/data/ca-bundle.pem")
+    local trustStore = assert(store.openTrustStore("test/data/ca-bundle.store"))
+
+    test("Anchor count", function()
+      assert.are.equal(#certs, trustStore.count)
+    end)
+
+    for _, cert in ipairs(certs) do
+      local caName, cert = table.unpack(cert)
+
+      test("CA " .. caName, function()
+        local tbsCertificate = asn.decode(cert)[1]
+        local fieldIdx = tbsCertificate[1].TAG
+          == asn.makeTagSpec("contextSpecific", 0) and 6 or 5
+        local subject = tbsCertificate[fieldIdx]
+        local subjectDer = cert:sub(subject.START, subject.END)
+
+        local anchors = trustStore.find(subjectDer)
+        local anchor
+
+        for _, candidate in ipairs(anchors) do
+          if candidate.certificateDer == cert then
+            anchor = candidate
+          end
+        end
+
+        assert.is_not.nil_(anchor)
+        assert.are.equal(caName, anchor.label)
+        assert.are.equal(subjectDer, anchor.subjectDer)
+
+        local pkInfo = tbsCertificate[fieldIdx + 1]
+        assert.are.equal(
+          cert:sub(pkInfo.START, pkInfo.END),
+          anchor.publicKeyInfoDer
+        )
+        assert.is.table(anchor:getPublicKeyInfo())
+        assert.is.table(anchor:getCertificate())
+      end)
+    end
+
+    test("Unknown subject", function()
+      assert.are.same({}, trustStore.find("\x30\x00"))
+    end)
+  end)
+
   test("RSASSA-PSS signature certificate", function()
     local oid = require("tls13.asn.oid")
 